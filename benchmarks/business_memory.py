@@ -0,0 +1,99 @@
+"""
+Benchmark: memory of 100k leads as plain dicts vs ``Business`` records.
+
+Field values (names, addresses, URLs, ...) are built once and shared by
+both layouts, so the figures cover only what each layout adds per lead:
+the container itself and the ``scraped_at`` value, which dicts stored as
+an ISO string and ``Business`` stores as a float. Export time to CSV and
+JSON is reported as well, since records are exported far more often than
+they are built.
+
+Usage:
+    python benchmarks/business_memory.py [--leads 100000]
+"""
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from leads_finder.core.business import Business  # noqa: E402
+from leads_finder.core.export import export_to_csv, export_to_json  # noqa: E402
+
+
+def field_values(i: int) -> Dict[str, Any]:
+    cid = str(10 ** 17 + i * 7919)
+    url = f"https://www.google.com/maps?cid={cid}"
+    return {
+        "name": f"Business number {i}",
+        "category": ("Dentist", "Pizza restaurant", "Plumber")[i % 3],
+        "phone": f"+1 416-555-{i % 10000:04d}",
+        "email": None,
+        "website": url,
+        "rating": round(3 + (i % 20) / 10, 1),
+        "reviews_count": i % 900,
+        "address": f"{i} Main St, Suite {i % 50}",
+        "city": "Toronto",
+        "country": None,
+        "lat": None,
+        "lon": None,
+        "source": "Google Maps",
+        "distance": f"{i % 30 / 10} km",
+        "status": "Open · Closes 5PM",
+        "review_snippet": None,
+        "google_cid": cid,
+        "google_maps_url": url,
+    }
+
+
+def as_dict(values: Dict[str, Any]) -> Dict[str, Any]:
+    return {**values, "scraped_at": datetime.utcnow().isoformat()}
+
+
+def as_business(values: Dict[str, Any]) -> Business:
+    return Business(values, scraped_at=time.time())
+
+
+def measure(label: str, make: Callable[[Dict[str, Any]], Any], values: List[Dict[str, Any]]) -> None:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+    leads = [make(fields) for fields in values]
+    build = time.perf_counter() - started
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    with tempfile.TemporaryDirectory() as directory:
+        started = time.perf_counter()
+        export_to_csv(leads, os.path.join(directory, "leads.csv"))
+        csv_time = time.perf_counter() - started
+        started = time.perf_counter()
+        export_to_json(leads, os.path.join(directory, "leads.json"))
+        json_time = time.perf_counter() - started
+
+    print(
+        f"{label:9} {used / 2 ** 20:7.1f} MiB ({used / len(values):4.0f} B/lead), "
+        f"build {build:.2f}s, csv {csv_time:.2f}s, json {json_time:.2f}s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--leads", type=int, default=100_000)
+    args = parser.parse_args()
+
+    values = [field_values(i) for i in range(args.leads)]
+    print(f"{args.leads} leads")
+    measure("dict", as_dict, values)
+    measure("Business", as_business, values)
+
+
+if __name__ == "__main__":
+    main()
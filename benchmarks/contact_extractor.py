@@ -0,0 +1,84 @@
+"""
+Benchmark: place page contact extraction, original code vs the current one.
+
+Times the original regex and full JSON decode extractor (kept in
+``tests/legacy_google_maps.py`` for the parity tests) against
+``GoogleMapsProvider._extract_contact_details`` on the recorded place
+pages in ``tests/fixtures``. Real place pages run to several megabytes,
+mostly scripts around the place data, so each page is padded with
+script filler on both sides of its content.
+
+Usage:
+    python benchmarks/contact_extractor.py [--padding-kb 3000] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+import legacy_google_maps as legacy  # noqa: E402
+from leads_finder.providers.google_maps import GoogleMapsProvider  # noqa: E402
+
+FIXTURES = os.path.join(ROOT, "tests", "fixtures")
+
+
+def place_page(path: str, padding_kb: int) -> str:
+    """A fixture place page with about ``padding_kb`` KB of scripts around its content."""
+    with open(path, encoding="utf-8") as f:
+        html = f.read()
+    block = "<script>window.d=[" + ",".join(f'"k{k}",{k}' for k in range(90)) + "];</script>\n"
+    filler = block * (padding_kb * 1024 // len(block) // 2)
+    return filler + html + filler
+
+
+def measure(
+    label: str,
+    extract: Callable[[str], Dict[str, Optional[str]]],
+    pages: List[str],
+    repeat: int,
+) -> float:
+    """Print and return milliseconds per page."""
+    found = sum(1 for html in pages if any(extract(html).values()))  # warm up
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for html in pages:
+            extract(html)
+    per_page = (time.perf_counter() - started) * 1000 / (repeat * len(pages))
+    print(f"{label:8} {per_page:8.2f} ms/page ({found} pages with contact details)")
+    return per_page
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--padding-kb", type=int, default=3000, help="Filler added to each page")
+    parser.add_argument("--repeat", type=int, default=5, help="Passes over the pages")
+    args = parser.parse_args()
+
+    fixtures = sorted(
+        os.path.join(FIXTURES, name) for name in os.listdir(FIXTURES) if name.startswith("place_")
+    )
+    pages = [place_page(path, args.padding_kb) for path in fixtures]
+    size = sum(len(html) for html in pages) // len(pages) // 1024
+    print(f"{len(pages)} pages of ~{size} KB, {args.repeat} passes")
+
+    provider = GoogleMapsProvider(None)
+    mismatched = [
+        os.path.basename(path)
+        for path, html in zip(fixtures, pages)
+        if provider._extract_contact_details(html) != legacy.extract_contact_details(html)
+    ]
+    if mismatched:
+        print(f"Output differs from the original on: {', '.join(mismatched)}")
+
+    original = measure("original", legacy.extract_contact_details, pages, args.repeat)
+    current = measure("current", provider._extract_contact_details, pages, args.repeat)
+    print(f"{'':8} {original / current:8.1f}x the original")
+
+
+if __name__ == "__main__":
+    main()
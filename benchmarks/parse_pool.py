@@ -0,0 +1,87 @@
+"""
+Benchmark: parsing results pages in the calling process vs a parse pool.
+
+Several searches run at once in threads, as in the web app. Each parses
+the same results pages with ``GoogleMapsProvider._parse_results_html``,
+either in its own thread or in a pool from ``create_parse_executor``.
+The script reports pages parsed per second for each worker count.
+
+Parsing holds the GIL, so threads alone run about as fast as one search.
+The pool only helps when there are idle cores: on a single-core machine
+it is slower, because every page is also copied to a worker.
+
+Usage:
+    python benchmarks/parse_pool.py [--searches 4] [--pages 20] [--workers 1,2,4]
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from leads_finder.core.parse_pool import create_parse_executor  # noqa: E402
+from leads_finder.providers.google_maps import GoogleMapsProvider  # noqa: E402
+
+FIXTURES = os.path.join(ROOT, "tests", "fixtures")
+
+
+def results_page(path: str, padding_kb: int) -> str:
+    """A fixture results page padded with inline scripts to a realistic size."""
+    with open(path, encoding="utf-8") as f:
+        html = f.read()
+    filler = "".join(
+        f"<script>window.s{k}='{'x' * 1000}';</script><div class='f'><span>{k}</span></div>"
+        for k in range(padding_kb)
+    )
+    return html.replace("<body>", "<body>" + filler, 1)
+
+
+def run(pages: List[str], searches: int, workers: Optional[int], backend: str) -> float:
+    """Return pages parsed per second."""
+    executor = create_parse_executor(workers) if workers else None
+    provider = GoogleMapsProvider(None, parser_backend=backend, parse_executor=executor)
+
+    def search() -> int:
+        return sum(len(provider._parse_results_html(html, "Toronto", 0, set())) for html in pages)
+
+    try:
+        search()  # warm up (and start the pool's workers)
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=searches) as threads:
+            list(threads.map(lambda _: search(), range(searches)))
+        elapsed = time.perf_counter() - started
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return searches * len(pages) / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--searches", type=int, default=4, help="Concurrent searches")
+    parser.add_argument("--pages", type=int, default=20, help="Pages parsed per search")
+    parser.add_argument("--workers", default="1,2,4", help="Comma-separated pool sizes to try")
+    parser.add_argument("--backend", default="lxml", choices=("lxml", "bs4"))
+    parser.add_argument("--padding-kb", type=int, default=300, help="Filler added to each page")
+    args = parser.parse_args()
+
+    fixtures = sorted(
+        os.path.join(FIXTURES, name) for name in os.listdir(FIXTURES) if name.startswith("results_page_")
+    )
+    pages = [results_page(fixtures[i % len(fixtures)], args.padding_kb) for i in range(args.pages)]
+    size = sum(len(html) for html in pages) // len(pages) // 1024
+    print(f"{os.cpu_count()} CPU(s), {args.searches} searches x {args.pages} pages of ~{size} KB, {args.backend}")
+
+    baseline = run(pages, args.searches, None, args.backend)
+    print(f"in-process: {baseline:7.1f} pages/s")
+    for workers in (int(value) for value in args.workers.split(",") if value.strip()):
+        rate = run(pages, args.searches, workers, args.backend)
+        print(f"{workers} worker(s): {rate:7.1f} pages/s ({rate / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
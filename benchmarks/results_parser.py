@@ -0,0 +1,78 @@
+"""
+Benchmark: results page parsing with the original code and both backends.
+
+Times the original BeautifulSoup parser (kept in ``tests/legacy_google_maps.py``
+for the parity tests), the current ``bs4`` backend and the ``lxml``
+backend on the recorded results pages in ``tests/fixtures``. Each page is
+padded with inline scripts and nested filler markup to about the size of
+a real results page, which is mostly markup around the listings.
+
+Usage:
+    python benchmarks/results_parser.py [--padding-kb 300] [--repeat 20]
+"""
+import argparse
+import os
+import sys
+import time
+from typing import Callable, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+import legacy_google_maps as legacy  # noqa: E402
+from leads_finder.providers.google_maps import GoogleMapsProvider  # noqa: E402
+
+FIXTURES = os.path.join(ROOT, "tests", "fixtures")
+
+
+def results_page(path: str, padding_kb: int) -> str:
+    """A fixture results page padded with inline scripts to a realistic size."""
+    with open(path, encoding="utf-8") as f:
+        html = f.read()
+    filler = "".join(
+        f"<script>window.s{k}='{'x' * 600}';</script>"
+        f"<div class='f'><div><span>{k}</span><span>&amp; &#183; {k}</span></div></div>"
+        for k in range(padding_kb)
+    )
+    return html.replace("<body>", "<body>" + filler, 1)
+
+
+def measure(label: str, parse: Callable[[str], list], pages: List[str], repeat: int) -> float:
+    """Print and return milliseconds per page."""
+    listings = sum(len(parse(html)) for html in pages)  # warm up
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for html in pages:
+            parse(html)
+    per_page = (time.perf_counter() - started) * 1000 / (repeat * len(pages))
+    print(f"{label:8} {per_page:8.2f} ms/page ({listings} listings)")
+    return per_page
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--padding-kb", type=int, default=300, help="Filler blocks (about 0.7 KB each) added to each page")
+    parser.add_argument("--repeat", type=int, default=20, help="Passes over the pages")
+    args = parser.parse_args()
+
+    fixtures = sorted(
+        os.path.join(FIXTURES, name) for name in os.listdir(FIXTURES) if name.startswith("results_page_")
+    )
+    pages = [results_page(path, args.padding_kb) for path in fixtures]
+    size = sum(len(html) for html in pages) // len(pages) // 1024
+    print(f"{len(pages)} pages of ~{size} KB, {args.repeat} passes")
+
+    original = measure(
+        "original", lambda html: legacy.parse_results_html(html, "Toronto", 0, set()), pages, args.repeat
+    )
+    for backend in ("bs4", "lxml"):
+        provider = GoogleMapsProvider(None, parser_backend=backend)
+        per_page = measure(
+            backend, lambda html: provider._parse_results_html(html, "Toronto", 0, set()), pages, args.repeat
+        )
+        print(f"{'':8} {original / per_page:8.1f}x the original")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+Adaptive (AIMD) concurrency and rate control for Decodo API calls.
+"""
+import threading
+import time
+from collections import deque
+from typing import Optional, Dict, Any
+
+from .rate_limiter import TokenBucketRateLimiter
+
+
+class AdaptiveConcurrencyController:
+    """
+    Additive-increase / multiplicative-decrease controller.
+
+    Every request reports its outcome and latency. After a full "window" of
+    healthy responses (one per allowed concurrent slot) the concurrency limit
+    grows by one and the request rate by ``rate_step``. A 429, a 5xx/timeout
+    or a latency spike well above the observed baseline shrinks both by
+    ``decrease_factor``. Decreases are spaced at least one baseline latency
+    apart so a single burst of errors only counts once.
+
+    The controller drives the rate of the attached ``TokenBucketRateLimiter``
+    and gates in-flight requests itself, so long runs settle near the highest
+    throughput the account sustains. An unlimited limiter (rate 0) is left
+    alone until the first congestion signal, which starts rate control at
+    ``max_rate * decrease_factor``.
+    """
+
+    OK = "ok"
+    THROTTLED = "throttled"
+    ERROR = "error"
+    NEUTRAL = "neutral"
+
+    def __init__(
+        self,
+        initial_limit: int = 2,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        initial_rate: Optional[float] = None,
+        min_rate: float = 0.2,
+        max_rate: float = 20.0,
+        rate_step: float = 0.25,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 3.0,
+        latency_window: int = 50,
+    ):
+        """
+        Initialize the controller.
+
+        Args:
+            initial_limit: Starting number of concurrent requests
+            min_limit: Lowest concurrency the controller will back off to
+            max_limit: Highest concurrency the controller will grow to
+            initial_rate: Starting requests per second (defaults to the rate of
+                the limiter the controller is bound to; an unlimited limiter
+                stays unlimited until the first backoff)
+            min_rate: Lowest requests per second
+            max_rate: Highest requests per second
+            rate_step: Requests per second added after each healthy window
+            decrease_factor: Multiplier applied to limit and rate on congestion
+            latency_tolerance: Latency above baseline * tolerance counts as congestion
+            latency_window: Number of recent latencies used to estimate the baseline
+        """
+        self.min_limit = max(int(min_limit), 1)
+        self.max_limit = max(int(max_limit), self.min_limit)
+        self.min_rate = max(min_rate, 0.01)
+        self.max_rate = max(max_rate, self.min_rate)
+        self.rate_step = rate_step
+        self.decrease_factor = min(max(decrease_factor, 0.1), 0.95)
+        self.latency_tolerance = latency_tolerance
+
+        self._limit = float(min(max(int(initial_limit), self.min_limit), self.max_limit))
+        self._rate = initial_rate
+        self._rate_limiter: Optional[TokenBucketRateLimiter] = None
+        self._latencies = deque(maxlen=max(int(latency_window), 1))
+        self._healthy_streak = 0
+        self._last_decrease = 0.0
+        self._in_flight = 0
+        self._cond = threading.Condition()
+        self._counts = {self.OK: 0, self.THROTTLED: 0, self.ERROR: 0, self.NEUTRAL: 0}
+
+    def bind(self, rate_limiter: TokenBucketRateLimiter) -> None:
+        """
+        Attach the rate limiter whose rate this controller drives.
+
+        Args:
+            rate_limiter: Limiter used by the session
+        """
+        with self._cond:
+            self._rate_limiter = rate_limiter
+            if self._rate is None and rate_limiter.rate > 0:
+                self._rate = rate_limiter.rate
+            if self._rate is not None:
+                self._set_rate(self._rate)
+
+    @property
+    def limit(self) -> int:
+        """Current number of concurrent requests allowed."""
+        with self._cond:
+            return int(self._limit)
+
+    @property
+    def rate(self) -> Optional[float]:
+        """Current requests per second (None while unlimited)."""
+        with self._cond:
+            return self._rate
+
+    def try_acquire(self) -> bool:
+        """Take an in-flight slot if one is free (non-blocking)."""
+        with self._cond:
+            if self._in_flight < int(self._limit):
+                self._in_flight += 1
+                return True
+            return False
+
+    def acquire(self) -> None:
+        """Block until an in-flight slot is free and take it."""
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+
+    def release(self, outcome: str, latency: Optional[float] = None) -> None:
+        """
+        Free an in-flight slot and feed the request outcome to the controller.
+
+        Args:
+            outcome: One of OK, THROTTLED, ERROR or NEUTRAL
+            latency: Network latency of the request in seconds
+        """
+        with self._cond:
+            self._in_flight = max(self._in_flight - 1, 0)
+            self._counts[outcome] = self._counts.get(outcome, 0) + 1
+
+            if outcome == self.OK and latency is not None:
+                baseline = self._baseline()
+                self._latencies.append(latency)
+                if baseline is not None and latency > baseline * self.latency_tolerance:
+                    outcome = self.ERROR
+
+            if outcome in (self.THROTTLED, self.ERROR):
+                self._decrease()
+            elif outcome == self.OK:
+                self._increase()
+
+            self._cond.notify_all()
+
+    def _baseline(self) -> Optional[float]:
+        if len(self._latencies) < 5:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[len(ordered) // 4]
+
+    def _increase(self) -> None:
+        self._healthy_streak += 1
+        if self._healthy_streak < int(self._limit):
+            return
+
+        self._healthy_streak = 0
+        self._limit = min(self._limit + 1, self.max_limit)
+        if self._rate is not None:
+            self._set_rate(self._rate + self.rate_step)
+
+    def _decrease(self) -> None:
+        self._healthy_streak = 0
+        now = time.monotonic()
+        spacing = self._baseline() or 1.0
+        if now - self._last_decrease < spacing:
+            return
+
+        self._last_decrease = now
+        self._limit = max(self._limit * self.decrease_factor, self.min_limit)
+        if self._rate is not None:
+            self._set_rate(self._rate * self.decrease_factor)
+        elif self._rate_limiter is not None:
+            # First backoff of an unlimited limiter: start rate control.
+            self._set_rate(self.max_rate * self.decrease_factor)
+
+    def _set_rate(self, rate: float) -> None:
+        self._rate = min(max(rate, self.min_rate), self.max_rate)
+        if self._rate_limiter is not None:
+            self._rate_limiter.configure(self._rate)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Report the controller state.
+
+        Returns:
+            Dictionary with the current limit, rate, in-flight count,
+            latency baseline and outcome counters
+        """
+        with self._cond:
+            return {
+                "limit": int(self._limit),
+                "rate": self._rate,
+                "in_flight": self._in_flight,
+                "baseline_latency": self._baseline(),
+                "outcomes": dict(self._counts),
+            }
@@ -0,0 +1,345 @@
+"""
+Asyncio-native Decodo Web Scraping API session.
+
+Requires the optional ``aiohttp`` dependency (``pip install leads-finder[async]``).
+"""
+import asyncio
+import time
+from typing import Optional, Dict, Any, Callable, List
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from .adaptive import AdaptiveConcurrencyController
+from .cache import ResponseCache
+from .cassette import Cassette, CassetteMissError
+from .rate_limiter import TokenBucketRateLimiter
+from .retry import CircuitBreaker, RetryPolicy
+from .scraper_api_session import BaseScraperAPISession, DecodoUnauthorizedError, decode_json
+from .singleflight import AsyncSingleFlight, shared_async_single_flight
+
+
+def _basic_auth_header(username: str, password: str) -> str:
+    """Build the Basic ``Authorization`` header value (``BasicAuth`` is deprecated in recent aiohttp)."""
+    encode = getattr(aiohttp, "encode_basic_auth", None)
+    if encode is not None:
+        return encode(username, password)
+    return aiohttp.BasicAuth(username, password).encode()
+
+
+class AsyncScraperAPISession(BaseScraperAPISession):
+    """
+    Async counterpart of ``ScraperAPISession``.
+
+    Exposes the same ``scrape`` / ``google_maps_search`` /
+    ``google_maps_place_details`` surface as coroutines, so a single event
+    loop can keep many Decodo calls in flight. Calls are bounded by
+    ``max_in_flight`` and paced by the (optionally shared) rate limiter.
+    """
+
+    def __init__(
+        self,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        rps: float = 1.0,
+        api_endpoint: str = "https://scraper-api.decodo.com/v2/scrape",
+        pool_size: int = 20,
+        burst: Optional[float] = None,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+        max_in_flight: int = 20,
+        cache: Optional[ResponseCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        coalesce: bool = True,
+        single_flight: Optional[AsyncSingleFlight] = None,
+        adaptive: Optional[AdaptiveConcurrencyController] = None,
+        cassette: Optional[Cassette] = None,
+        hooks: Optional[List[Callable[[Dict[str, Any]], None]]] = None,
+    ):
+        """
+        Initialize async Scraper API session.
+
+        Args:
+            username: Decodo scraper API username (defaults to DECODO_USERNAME env var)
+            password: Decodo scraper API password (defaults to DECODO_PASSWORD env var)
+            rps: Requests per second rate limit (ignored when rate_limiter is given)
+            api_endpoint: Scraper API endpoint
+            pool_size: Maximum number of pooled connections kept open to the API host
+            burst: Number of requests allowed back-to-back before rps applies
+            rate_limiter: Shared limiter instance (may also be used by sync sessions)
+            max_in_flight: Maximum number of concurrent requests
+            cache: Optional response cache consulted before every request
+            retry_policy: Backoff/retry settings for failed requests
+            circuit_breaker: Breaker pausing callers when the upstream error rate
+                spikes; may be shared with other sessions
+            coalesce: Share one upstream call between identical concurrent requests
+                made with the same credentials
+            single_flight: Coalescing registry (defaults to a process-wide one)
+            adaptive: Optional AIMD controller that tunes concurrency and the
+                rate limiter from observed latency, 429s and 5xx responses
+            cassette: Optional cassette to record responses to or replay them from
+            hooks: Callbacks receiving an event dict for every request, error,
+                retry, cache hit, coalesced call and replayed response
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncScraperAPISession requires aiohttp. "
+                "Install it with: pip install 'leads-finder[async]'"
+            )
+
+        super().__init__(
+            username=username,
+            password=password,
+            rps=rps,
+            api_endpoint=api_endpoint,
+            pool_size=pool_size,
+            burst=burst,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            coalesce=coalesce,
+            adaptive=adaptive,
+            cassette=cassette,
+            hooks=hooks,
+        )
+        self.request_errors = (aiohttp.ClientError, asyncio.TimeoutError, ValueError, CassetteMissError)
+        self.single_flight = single_flight or shared_async_single_flight
+        self.max_in_flight = max(int(max_in_flight), 1)
+        self.authorization = _basic_auth_header(self.username or "", self.password or "")
+        self._client: Optional["aiohttp.ClientSession"] = None
+        self._in_flight: Optional[asyncio.Semaphore] = None
+
+    def _get_client(self) -> "aiohttp.ClientSession":
+        """Lazily create the pooled client inside the running event loop."""
+        if self._client is None or self._client.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_size)
+            self._client = aiohttp.ClientSession(
+                connector=connector,
+                headers={
+                    "Authorization": self.authorization,
+                    "Content-Type": "application/json",
+                    "Accept-Encoding": "gzip, deflate",
+                },
+            )
+            self._in_flight = asyncio.Semaphore(self.max_in_flight)
+        return self._client
+
+    async def close(self) -> None:
+        """Close pooled connections held by the session."""
+        if self._client is not None and not self._client.closed:
+            await self._client.close()
+        self._client = None
+
+    async def __aenter__(self) -> "AsyncScraperAPISession":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def error_status(self, error: BaseException) -> Optional[int]:
+        if isinstance(error, aiohttp.ClientResponseError):
+            return error.status
+        return None
+
+    async def _rate_limit(self) -> float:
+        """Wait for the rate limiter without blocking the event loop."""
+        delay = self.rate_limiter.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    async def scrape(
+        self,
+        target: str,
+        query: Optional[str] = None,
+        geo: Optional[str] = None,
+        parse: Optional[bool] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Make a scraping request using Decodo Scraper API.
+
+        Args:
+            target: Target template (e.g., 'google_maps', 'google_search')
+            query: Search query
+            geo: Geographic location (city name, country, or coordinates)
+            parse: Return parsed JSON data (True) or raw HTML (False); omit parameter when None
+            **kwargs: Additional parameters for the target
+
+        Returns:
+            Dictionary with scraping results
+
+        Raises:
+            aiohttp.ClientError: If request fails after all retries
+        """
+        payload = self._build_payload(target, query, geo, parse, kwargs)
+
+        if self.cassette is not None and self.cassette.replaying:
+            self._emit("replayed", target)
+            response = self.cassette.lookup(payload)
+            if self.cassette.latency:
+                await asyncio.sleep(self.cassette.latency)
+            return response
+
+        data = None
+        if self.cache is not None:
+            data = self.cache.get(payload, self._credential_id)
+            if data is not None:
+                self._emit("cache_hit", target)
+
+        if data is None:
+            client = self._get_client()
+            if self.coalesce:
+                data, shared = await self.single_flight.do(
+                    self._flight_key(payload),
+                    lambda: self._send(client, payload),
+                )
+                if shared:
+                    self._emit("coalesced", target)
+            else:
+                data = await self._send(client, payload)
+
+        if self.cassette is not None:
+            self.cassette.record(payload, data)
+        return data
+
+    async def _send(self, client: "aiohttp.ClientSession", payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a payload upstream, retrying transient failures."""
+        target = payload.get("target", "")
+        attempts: Dict[str, int] = {}
+        while True:
+            await self._wait_for_circuit()
+
+            error = None
+            error_body = None
+            retry_after = None
+            status = None
+            nbytes = 0
+            try:
+                async with self._in_flight:
+                    await self._acquire_slot()
+                    try:
+                        wait = await self._rate_limit()
+                    except BaseException:
+                        # Cancelled while paced: give the slot back before leaving.
+                        self._release_slot(AdaptiveConcurrencyController.NEUTRAL)
+                        raise
+
+                    started = time.monotonic()
+                    try:
+                        async with client.post(
+                            self.api_endpoint,
+                            json=payload,
+                            timeout=aiohttp.ClientTimeout(
+                                sock_connect=self.retry_policy.connect_timeout,
+                                sock_read=self.retry_policy.read_timeout,
+                            ),
+                        ) as response:
+                            if response.status == 401:
+                                self.circuit_breaker.record_success()
+                                text = await response.text()
+                                detail = ""
+                                try:
+                                    detail_json = await response.json(content_type=None)
+                                    detail = (
+                                        detail_json.get("message")
+                                        or detail_json.get("error")
+                                        or detail_json.get("detail")
+                                        or ""
+                                    )
+                                except ValueError:
+                                    detail = text.strip()
+
+                                raise self._unauthorized_error(detail)
+
+                            status = response.status
+                            if response.status >= 400:
+                                error_body = await response.text()
+                                nbytes = len(error_body)
+                                retry_after = self.retry_policy.parse_retry_after(response.headers)
+                            response.raise_for_status()
+                            raw = await response.read()
+                            nbytes = len(raw)
+                            data = decode_json(raw)
+                            raw = None
+                    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                        error = e
+                    except BaseException as e:
+                        self._release_slot(AdaptiveConcurrencyController.NEUTRAL)
+                        self._emit(
+                            "error",
+                            target,
+                            status=401 if isinstance(e, DecodoUnauthorizedError) else None,
+                            latency=time.monotonic() - started,
+                            wait=wait,
+                        )
+                        raise
+                    latency = time.monotonic() - started
+
+                    if error is None:
+                        self._emit("request", target, status=status, nbytes=nbytes, latency=latency, wait=wait)
+                        self._release_slot(AdaptiveConcurrencyController.OK, latency)
+                    else:
+                        kind = self._failure_kind(error)
+                        self._emit("error", target, status=status, nbytes=nbytes, latency=latency, wait=wait)
+                        self._release_slot(self._congestion_outcome(kind, status), latency)
+            except BaseException:
+                # Cancelled or failed without an outcome: let the next caller probe.
+                self.circuit_breaker.release_probe()
+                raise
+
+            if error is None:
+                self.circuit_breaker.record_success()
+                if self.cache is not None:
+                    self.cache.set(payload, data, self._credential_id)
+                return data
+
+            delay = None
+            if kind is None:
+                self.circuit_breaker.record_success()
+            else:
+                self.circuit_breaker.record_failure()
+                delay = self.retry_policy.next_delay(kind, attempts, retry_after)
+
+            if delay is None:
+                print(f"Scraper API request failed: {error}")
+                if error_body:
+                    print(f"Response: {error_body[:200]}")
+                raise error
+
+            self._emit("retry", target, status=status)
+            print(f"Scraper API request failed ({error}); retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+    async def _acquire_slot(self) -> None:
+        """Wait for a free slot under the adaptive concurrency limit."""
+        if self.adaptive is None:
+            return
+        while not self.adaptive.try_acquire():
+            await asyncio.sleep(0.05)
+
+    async def _wait_for_circuit(self) -> None:
+        """Pause while the circuit breaker is open."""
+        while True:
+            delay = self.circuit_breaker.before_request()
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+
+    def _failure_kind(self, error: BaseException) -> Optional[str]:
+        """Classify a request failure for the retry policy (None = not retryable)."""
+        connect_timeout = getattr(aiohttp, "ConnectionTimeoutError", None)
+        if connect_timeout is not None and isinstance(error, connect_timeout):
+            return "connect"
+        if isinstance(error, asyncio.TimeoutError):
+            return "read"
+        if isinstance(error, aiohttp.ClientResponseError):
+            if error.status in self.retry_policy.retry_statuses:
+                return "status"
+            return None
+        if isinstance(error, aiohttp.ClientConnectionError):
+            return "connect"
+        return None
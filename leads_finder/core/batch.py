@@ -0,0 +1,234 @@
+"""
+Batch jobs: many query x location searches run concurrently in one process.
+"""
+import csv
+import os
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Set
+
+from .checkpoint import CheckpointStore, checkpoint_key, search_params
+from .scraper_api_session import DecodoUnauthorizedError
+
+
+JOB_COLUMNS = ("query", "city", "country", "limit", "latitude", "longitude", "radius_km", "out")
+
+
+class BatchJob(NamedTuple):
+    """One search of a batch file."""
+
+    query: str
+    city: str = ""
+    country: Optional[str] = None
+    limit: int = 100
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    radius_km: Optional[float] = None
+    out: Optional[str] = None
+    line: int = 0
+
+    @property
+    def label(self) -> str:
+        """Short description for progress output."""
+        if self.latitude is not None:
+            return f"{self.query} @ ({self.latitude:.4f}, {self.longitude:.4f}) {self.radius_km:g} km"
+        return f"{self.query} @ {self.city}"
+
+
+class BatchResult(NamedTuple):
+    """Outcome of one batch job."""
+
+    job: BatchJob
+    businesses: List[Dict[str, Any]]
+    elapsed: float
+    error: Optional[str] = None
+
+
+def load_jobs(path: str, default_limit: int = 100) -> List[BatchJob]:
+    """
+    Read batch jobs from a CSV file with a header row.
+
+    Only ``query`` is required. Each job needs either ``city`` or all of
+    ``latitude``, ``longitude`` and ``radius_km``; ``limit`` falls back to
+    ``default_limit`` and ``out`` names the job's own output file.
+
+    Args:
+        path: CSV file
+        default_limit: Limit for rows without one
+
+    Returns:
+        Jobs in file order
+
+    Raises:
+        ValueError: On unknown columns or an invalid row (with its line number)
+    """
+    jobs = []
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        columns = [column.strip() for column in reader.fieldnames or []]
+        if "query" not in columns:
+            raise ValueError(f"{path}: missing 'query' column")
+        unknown = [column for column in columns if column not in JOB_COLUMNS]
+        if unknown:
+            raise ValueError(f"{path}: unknown columns: {', '.join(unknown)}")
+
+        for row in reader:
+            values = {
+                key.strip(): (value or "").strip()
+                for key, value in row.items()
+                if key is not None
+            }
+            if not any(values.values()):
+                continue
+            try:
+                jobs.append(_parse_job(values, default_limit, reader.line_num))
+            except ValueError as e:
+                raise ValueError(f"{path}, line {reader.line_num}: {e}") from None
+    return jobs
+
+
+def _parse_job(values: Dict[str, str], default_limit: int, line: int) -> BatchJob:
+    query = values.get("query")
+    if not query:
+        raise ValueError("query is required")
+
+    coordinates = [values.get(key) for key in ("latitude", "longitude", "radius_km")]
+    if any(coordinates) and not all(coordinates):
+        raise ValueError("latitude, longitude and radius_km must be given together")
+    latitude, longitude, radius_km = (float(value) if value else None for value in coordinates)
+    if latitude is not None:
+        if not -90.0 <= latitude <= 90.0 or not -180.0 <= longitude <= 180.0:
+            raise ValueError("coordinates out of range")
+        if radius_km <= 0:
+            raise ValueError("radius_km must be positive")
+    elif not values.get("city"):
+        raise ValueError("city or coordinates are required")
+
+    limit = int(values["limit"]) if values.get("limit") else default_limit
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+
+    return BatchJob(
+        query=query,
+        city=values.get("city", ""),
+        country=values.get("country") or None,
+        limit=limit,
+        latitude=latitude,
+        longitude=longitude,
+        radius_km=radius_km,
+        out=values.get("out") or None,
+        line=line,
+    )
+
+
+def job_output_path(job: BatchJob, out_dir: str, extension: str = "csv") -> str:
+    """
+    File a job's results are written to in per-job output mode.
+
+    Args:
+        job: Batch job
+        out_dir: Directory for per-job files
+        extension: Default file extension
+
+    Returns:
+        The job's ``out`` column (relative to ``out_dir``) or a name built
+        from its query, location and line number
+    """
+    if job.out:
+        return os.path.join(out_dir, job.out)
+    location = job.city or f"{job.latitude}_{job.longitude}_{job.radius_km}km"
+    slug = re.sub(r"[^a-z0-9]+", "_", f"{job.query} {location}".lower()).strip("_")
+    return os.path.join(out_dir, f"{job.line:04d}_{slug or 'job'}.{extension}")
+
+
+def run_jobs(
+    provider: Any,
+    jobs: List[BatchJob],
+    concurrency: int = 4,
+    progress_callback: Optional[Callable[[BatchJob, int, int], None]] = None,
+    checkpoints: Optional[CheckpointStore] = None,
+    resume: bool = False,
+    **search_kwargs: Any,
+) -> Iterator[BatchResult]:
+    """
+    Run jobs concurrently on one provider, yielding each result as it finishes.
+
+    Every job goes through the same provider, so they share its session
+    (connection pool, rate limiter, response cache) and place cache. A job
+    that fails is reported with ``error`` set; a rejected login stops the
+    whole batch.
+
+    With ``checkpoints`` every job saves its progress under the same key a
+    single ``search`` with those parameters would use. With ``resume``
+    finished jobs return their saved leads without new calls and
+    interrupted ones continue where they stopped.
+
+    Args:
+        provider: Provider instance (e.g. ``GoogleMapsProvider``)
+        jobs: Jobs to run
+        concurrency: Jobs running at once
+        progress_callback: Called with (job, collected, limit) as a job pages
+        checkpoints: Optional store for per-job checkpoints
+        resume: Continue from saved checkpoints instead of starting over
+        **search_kwargs: Extra arguments for ``provider.search``
+
+    Yields:
+        One ``BatchResult`` per job, in completion order
+
+    Raises:
+        DecodoUnauthorizedError: When the API rejects the credentials
+    """
+    def run(job: BatchJob) -> BatchResult:
+        started = time.monotonic()
+
+        def report(collected: int, limit: int, *_: Any) -> None:
+            if progress_callback:
+                progress_callback(job, collected, limit)
+
+        try:
+            checkpoint = None
+            if checkpoints is not None:
+                params = search_params(
+                    type(provider).__name__,
+                    job.query,
+                    job.city,
+                    job.limit,
+                    country=job.country,
+                    enrich=search_kwargs.get("enrich", True),
+                    latitude=job.latitude,
+                    longitude=job.longitude,
+                    radius_km=job.radius_km,
+                )
+                checkpoint = checkpoints.open(checkpoint_key(params), params, resume=resume)
+            businesses = provider.search(
+                job.query,
+                job.city,
+                job.limit,
+                country=job.country,
+                latitude=job.latitude,
+                longitude=job.longitude,
+                radius_km=job.radius_km,
+                progress_callback=report,
+                checkpoint=checkpoint,
+                **search_kwargs,
+            )
+        except DecodoUnauthorizedError:
+            raise
+        except Exception as e:
+            return BatchResult(job, [], time.monotonic() - started, str(e))
+        return BatchResult(job, businesses, time.monotonic() - started)
+
+    executor = ThreadPoolExecutor(max_workers=max(concurrency, 1), thread_name_prefix="leads-batch")
+    pending: Set[Future] = set()
+    try:
+        pending = {executor.submit(run, job) for job in jobs}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
@@ -0,0 +1,82 @@
+"""
+Per-search caps on the number of paid Decodo API calls.
+"""
+import threading
+from typing import Optional
+
+
+class RequestBudget:
+    """
+    Thread-safe counter of Decodo calls a search may still issue.
+
+    Providers call ``try_spend()`` before every request and skip the request
+    when it returns False. An unlimited budget (``max_requests=None``) always
+    allows the call but still counts it.
+    """
+
+    def __init__(self, max_requests: Optional[int] = None):
+        """
+        Initialize the budget.
+
+        Args:
+            max_requests: Maximum number of calls, or None for no cap
+        """
+        if max_requests is not None and max_requests < 0:
+            raise ValueError("max_requests must be zero or positive")
+
+        self.max_requests = max_requests
+        self._spent = 0
+        self._lock = threading.Lock()
+
+    @property
+    def limited(self) -> bool:
+        """True when the budget caps the number of calls."""
+        return self.max_requests is not None
+
+    @property
+    def spent(self) -> int:
+        """Calls charged so far."""
+        with self._lock:
+            return self._spent
+
+    @property
+    def remaining(self) -> Optional[int]:
+        """Calls still allowed, or None when unlimited."""
+        with self._lock:
+            if self.max_requests is None:
+                return None
+            return max(self.max_requests - self._spent, 0)
+
+    def can_spend(self, calls: int = 1) -> bool:
+        """Check whether ``calls`` more requests fit without charging them."""
+        with self._lock:
+            return self.max_requests is None or self._spent + calls <= self.max_requests
+
+    def try_spend(self, calls: int = 1) -> bool:
+        """
+        Charge ``calls`` requests if they fit in the budget.
+
+        Args:
+            calls: Number of requests about to be issued
+
+        Returns:
+            True when the requests were charged, False when the budget is exhausted
+        """
+        with self._lock:
+            if self.max_requests is not None and self._spent + calls > self.max_requests:
+                return False
+            self._spent += calls
+            return True
+
+    def charge(self, calls: int) -> None:
+        """
+        Count calls that were made without ``try_spend``.
+
+        Used when resuming a search, so requests paid for by the interrupted
+        run still count against ``max_requests``.
+
+        Args:
+            calls: Number of requests already issued
+        """
+        with self._lock:
+            self._spent += max(int(calls), 0)
@@ -0,0 +1,242 @@
+"""
+Compact record type for business leads.
+"""
+import sys
+from collections.abc import Mapping, MutableMapping
+from datetime import datetime, timedelta, timezone
+from operator import attrgetter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+# Field order of a business record, which is also the key order of ``to_dict()``.
+FIELDS = (
+    "name",
+    "category",
+    "phone",
+    "email",
+    "website",
+    "rating",
+    "reviews_count",
+    "address",
+    "city",
+    "country",
+    "lat",
+    "lon",
+    "source",
+    "scraped_at",
+    "distance",
+    "status",
+    "review_snippet",
+    "google_cid",
+    "google_maps_url",
+)
+
+# Fields holding a handful of distinct values shared by many records.
+_INTERNED = frozenset(("city", "country", "source", "category"))
+
+# Fields stored under their own slot name; ``scraped_at`` is kept as a timestamp.
+_SLOTS = tuple(field for field in FIELDS if field != "scraped_at")
+_FIELD_SET = frozenset(FIELDS)
+_SLOT_SET = frozenset(_SLOTS)
+_get_slots = attrgetter(*_SLOTS)
+_SCRAPED_AT_INDEX = FIELDS.index("scraped_at")
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _format_timestamp(timestamp: Optional[float]) -> Optional[str]:
+    if timestamp is None:
+        return None
+    # Same naive UTC ISO string as ``datetime.utcnow().isoformat()``.
+    return (_EPOCH + timedelta(seconds=timestamp)).isoformat()
+
+
+def _parse_timestamp(value: Any) -> Optional[float]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, datetime):
+        moment = value
+    else:
+        moment = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+class Business(MutableMapping):
+    """
+    One business lead, stored in slots instead of a per-listing dict.
+
+    A search can hold tens of thousands of these, and a 19-key dict costs
+    several times the memory of a slotted object. Records behave like the
+    dicts they replace (``business["phone"]``, ``.get()``, ``.update()``,
+    iteration in ``FIELDS`` order), so code written against dicts keeps
+    working; ``to_dict()`` produces a plain dict where one is needed, e.g.
+    for JSON.
+
+    Every field is always present and defaults to None. ``city``,
+    ``country``, ``source`` and ``category`` are interned so records share
+    one copy of each value, and ``scraped_at`` is held as a POSIX timestamp
+    and formatted as an ISO string when read. Keys outside ``FIELDS`` are
+    accepted and kept in a side dict created on first use.
+    """
+
+    __slots__ = _SLOTS + ("_scraped_at", "_extra")
+
+    def __init__(self, data: Optional[Mapping] = None, **fields: Any):
+        """
+        Initialize a record.
+
+        Args:
+            data: Optional mapping (dict or ``Business``) to copy fields from
+            **fields: Field values, applied after ``data``
+        """
+        if isinstance(data, Business):
+            self._copy_from(data)
+        else:
+            if data:
+                fields = {**data, **fields}
+            for slot in _SLOTS:
+                value = fields.pop(slot, None)
+                if slot in _INTERNED and type(value) is str:
+                    value = sys.intern(value)
+                setattr(self, slot, value)
+            self._scraped_at = _parse_timestamp(fields.pop("scraped_at", None))
+            self._extra = None
+        for key, value in fields.items():
+            self[key] = value
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _SLOT_SET:
+            return getattr(self, key)
+        if key == "scraped_at":
+            return _format_timestamp(self._scraped_at)
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in _FIELD_SET:
+            if key == "scraped_at":
+                self._scraped_at = _parse_timestamp(value)
+                return
+            if key in _INTERNED and type(value) is str:
+                value = sys.intern(value)
+            setattr(self, key, value)
+            return
+        if self._extra is None:
+            self._extra = {}
+        self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        """Reset a field to None; extra keys are removed."""
+        if key in _FIELD_SET:
+            self[key] = None
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from FIELDS
+        if self._extra:
+            yield from list(self._extra)
+
+    def __len__(self) -> int:
+        return len(FIELDS) + (len(self._extra) if self._extra else 0)
+
+    def __contains__(self, key: object) -> bool:
+        return key in _FIELD_SET or (self._extra is not None and key in self._extra)
+
+    def __repr__(self) -> str:
+        return f"Business({self.to_dict()!r})"
+
+    def __reduce__(self) -> Tuple[Any, Tuple[Any, ...]]:
+        # A flat tuple pickles far smaller than the 19-key dict, which matters
+        # when parse workers send pages of records back to the main process.
+        return _restore, (_get_slots(self), self._scraped_at, self._extra)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a field or extra value, or ``default``."""
+        if key in _SLOT_SET:
+            return getattr(self, key)
+        if key == "scraped_at":
+            return _format_timestamp(self._scraped_at)
+        if self._extra is not None:
+            return self._extra.get(key, default)
+        return default
+
+    def copy(self) -> "Business":
+        """Return a shallow copy."""
+        duplicate = Business.__new__(Business)
+        duplicate._copy_from(self)
+        return duplicate
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record as a plain dict, every field included."""
+        values = list(_get_slots(self))
+        values.insert(_SCRAPED_AT_INDEX, _format_timestamp(self._scraped_at))
+        result = dict(zip(FIELDS, values))
+        if self._extra:
+            result.update(self._extra)
+        return result
+
+    def _copy_from(self, other: "Business") -> None:
+        for slot, value in zip(_SLOTS, _get_slots(other)):
+            setattr(self, slot, value)
+        self._scraped_at = other._scraped_at
+        self._extra = dict(other._extra) if other._extra else None
+
+
+def _restore(
+    values: Tuple[Any, ...],
+    scraped_at: Optional[float],
+    extra: Optional[Dict[str, Any]],
+) -> Business:
+    business = Business.__new__(Business)
+    for slot, value in zip(_SLOTS, values):
+        if slot in _INTERNED and type(value) is str:
+            value = sys.intern(value)
+        setattr(business, slot, value)
+    business._scraped_at = scraped_at
+    business._extra = extra
+    return business
+
+
+def as_dicts(businesses: Iterable[Mapping]) -> List[Dict[str, Any]]:
+    """
+    Convert records to plain dicts for JSON serialization.
+
+    Args:
+        businesses: ``Business`` records or dicts
+
+    Returns:
+        List of dicts (dicts are passed through unchanged)
+    """
+    return [
+        business.to_dict() if isinstance(business, Business) else business
+        for business in businesses
+    ]
+
+
+def json_default(value: Any) -> Any:
+    """
+    ``default`` hook for ``json.dump`` that serializes ``Business`` records.
+
+    Records are converted one at a time as the encoder reaches them, so
+    dumping a large result list never holds a dict copy of every row.
+
+    Args:
+        value: Object the JSON encoder cannot serialize natively
+
+    Returns:
+        Plain dict for a ``Business``
+
+    Raises:
+        TypeError: For any other type
+    """
+    if isinstance(value, Business):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
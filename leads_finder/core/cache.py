@@ -0,0 +1,257 @@
+"""
+Persistent on-disk cache for Decodo API responses.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Optional, Dict, Any
+
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "leads-finder", "responses.sqlite3"
+)
+
+# Search result pages go stale quickly; place details pages rarely change.
+DEFAULT_TTLS = {
+    "google_maps": 6 * 60 * 60,
+    "google": 7 * 24 * 60 * 60,
+}
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def payload_key(payload: Dict[str, Any], scope: str = "") -> str:
+    """
+    Build a stable key for a scrape payload.
+
+    Args:
+        payload: Request payload sent to the Decodo API
+        scope: Optional namespace (e.g. a credential fingerprint) keeping
+            otherwise identical payloads apart
+
+    Returns:
+        Hex digest of the scope and canonicalized payload
+    """
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    if scope:
+        canonical = f"{scope}|{canonical}"
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache of scrape responses keyed on the canonical payload.
+
+    Sessions scope their entries with a fingerprint of their credentials, so
+    a response fetched by one Decodo account is never served to another.
+
+    Entries expire after a per-target TTL and the cache is kept under
+    ``max_bytes`` by evicting the least recently used responses. Bodies are
+    stored zlib-compressed. The database runs in WAL mode so the CLI and the
+    web app can share one file.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = 24 * 60 * 60,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite database file (parent directories are created)
+            ttls: Per-target time-to-live in seconds (merged over DEFAULT_TTLS)
+            default_ttl: TTL for targets not listed in ttls
+            max_bytes: Maximum total size of stored (compressed) bodies
+        """
+        self.path = path
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    target TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    size INTEGER NOT NULL,
+                    body BLOB NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)"
+            )
+
+    def ttl_for(self, target: str) -> float:
+        """Return the TTL in seconds for a scrape target."""
+        return self.ttls.get(target, self.default_ttl)
+
+    def get(self, payload: Dict[str, Any], scope: str = "") -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response.
+
+        Args:
+            payload: Request payload
+            scope: Namespace the response was stored under
+
+        Returns:
+            Cached response, or None when missing or expired
+        """
+        key = payload_key(payload, scope)
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            body, expires_at = row
+            if expires_at <= now:
+                with self._conn:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+
+        try:
+            return json.loads(zlib.decompress(body))
+        except (zlib.error, ValueError):
+            return None
+
+    def set(self, payload: Dict[str, Any], response: Dict[str, Any], scope: str = "") -> None:
+        """
+        Store a response.
+
+        Args:
+            payload: Request payload the response belongs to
+            response: Decoded JSON response
+            scope: Namespace to store the response under
+        """
+        target = str(payload.get("target", ""))
+        ttl = self.ttl_for(target)
+        if ttl <= 0:
+            return
+
+        body = zlib.compress(json.dumps(response, separators=(",", ":")).encode("utf-8"))
+        now = time.time()
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO responses
+                    (key, target, created_at, expires_at, accessed_at, size, body)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (payload_key(payload, scope), target, now, now + ttl, now, len(body), body),
+            )
+            self._evict()
+
+    def _evict(self) -> int:
+        """Drop least recently used entries until the cache fits max_bytes."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+
+        removed = 0
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at ASC"
+        ).fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            removed += 1
+        return removed
+
+    def prune(self) -> int:
+        """
+        Remove expired entries and enforce the size bound.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM responses WHERE expires_at <= ?", (time.time(),)
+            )
+            removed = cursor.rowcount + self._evict()
+        with self._lock:
+            self._conn.execute("VACUUM")
+        return removed
+
+    def clear(self) -> int:
+        """
+        Remove every entry.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock, self._conn:
+            removed = self._conn.execute("DELETE FROM responses").rowcount
+        with self._lock:
+            self._conn.execute("VACUUM")
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Summarize cache contents.
+
+        Returns:
+            Dictionary with totals and a per-target breakdown
+        """
+        now = time.time()
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT target,
+                       COUNT(*),
+                       COALESCE(SUM(size), 0),
+                       COALESCE(SUM(CASE WHEN expires_at <= ? THEN 1 ELSE 0 END), 0)
+                FROM responses
+                GROUP BY target
+                ORDER BY target
+                """,
+                (now,),
+            ).fetchall()
+
+        targets = {
+            target: {"entries": entries, "bytes": size, "expired": expired}
+            for target, entries, size, expired in rows
+        }
+        return {
+            "path": self.path,
+            "entries": sum(t["entries"] for t in targets.values()),
+            "bytes": sum(t["bytes"] for t in targets.values()),
+            "expired": sum(t["expired"] for t in targets.values()),
+            "max_bytes": self.max_bytes,
+            "targets": targets,
+        }
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,136 @@
+"""
+Record/replay cassettes of Decodo API traffic for network-free runs.
+"""
+import gzip
+import json
+import threading
+import time
+from typing import Dict, Any, List
+
+from .cache import payload_key
+
+
+class CassetteMissError(LookupError):
+    """Raised in replay mode when a request was never recorded."""
+
+
+class Cassette:
+    """
+    Gzip-compressed JSON-lines file of scrape payloads and responses.
+
+    In ``record`` mode every response returned by ``scrape()`` is appended to
+    the file. In ``replay`` mode responses are served back by payload, in
+    recording order when the same payload was captured more than once, with an
+    optional simulated latency per request. Replay never touches the network
+    and does not need Decodo credentials.
+    """
+
+    RECORD = "record"
+    REPLAY = "replay"
+
+    def __init__(self, path: str, mode: str = REPLAY, latency: float = 0.0):
+        """
+        Open a cassette.
+
+        Args:
+            path: Cassette file (``.jsonl.gz`` recommended)
+            mode: "record" to capture traffic or "replay" to serve it back
+            latency: Seconds to sleep per replayed request
+        """
+        if mode not in (self.RECORD, self.REPLAY):
+            raise ValueError(f"Unknown cassette mode: {mode!r} (use 'record' or 'replay')")
+
+        self.path = path
+        self.mode = mode
+        self.latency = max(latency, 0.0)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, List[Dict[str, Any]]] = {}
+        self._positions: Dict[str, int] = {}
+        self._file = None
+        self.recorded = 0
+        self.replayed = 0
+
+        if mode == self.REPLAY:
+            self._load()
+        else:
+            self._file = gzip.open(path, "wt", encoding="utf-8")
+
+    @property
+    def replaying(self) -> bool:
+        """True when serving responses from the cassette."""
+        return self.mode == self.REPLAY
+
+    def _load(self) -> None:
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                entry = json.loads(line)
+                self._entries.setdefault(entry["key"], []).append(entry["response"])
+
+    def record(self, payload: Dict[str, Any], response: Dict[str, Any]) -> None:
+        """
+        Append an interaction (record mode only).
+
+        Args:
+            payload: Request payload
+            response: Decoded JSON response
+        """
+        if self._file is None:
+            return
+
+        line = json.dumps(
+            {"key": payload_key(payload), "payload": payload, "response": response},
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+        with self._lock:
+            self._file.write(line + "\n")
+            self.recorded += 1
+
+    def play(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Serve a recorded response (replay mode), sleeping for the simulated latency.
+
+        Args:
+            payload: Request payload
+
+        Returns:
+            Recorded response
+
+        Raises:
+            CassetteMissError: If the payload was never recorded
+        """
+        response = self.lookup(payload)
+        if self.latency:
+            time.sleep(self.latency)
+        return response
+
+    def lookup(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the next recorded response for a payload without sleeping."""
+        key = payload_key(payload)
+        with self._lock:
+            responses = self._entries.get(key)
+            if not responses:
+                raise CassetteMissError(
+                    f"No recorded response for {payload.get('target')} request "
+                    f"in cassette {self.path}"
+                )
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+            self.replayed += 1
+            return responses[min(position, len(responses) - 1)]
+
+    def close(self) -> None:
+        """Flush and close the cassette file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> "Cassette":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
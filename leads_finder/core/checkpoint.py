@@ -0,0 +1,417 @@
+"""
+Checkpoints for resuming interrupted searches.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from .business import Business, json_default
+
+
+DEFAULT_CHECKPOINT_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "leads-finder", "checkpoints.sqlite3"
+)
+
+STATUS_RUNNING = "running"
+STATUS_COMPLETE = "complete"
+
+
+def checkpoint_key(params: Dict[str, Any]) -> str:
+    """
+    Identify a search by its parameters.
+
+    Args:
+        params: JSON-serializable search parameters (query, location, limit, ...)
+
+    Returns:
+        Hex digest; the same parameters always give the same key
+    """
+    canonical = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+
+def search_params(
+    provider: str,
+    query: str,
+    city: str,
+    limit: int,
+    country: Optional[str] = None,
+    enrich: bool = True,
+    latitude: Optional[float] = None,
+    longitude: Optional[float] = None,
+    radius_km: Optional[float] = None,
+    **options: Any,
+) -> Dict[str, Any]:
+    """
+    Parameters that identify a search, for ``checkpoint_key``.
+
+    Rate limits, budgets and concurrency are left out on purpose: changing
+    them does not change which leads a search returns, so a resumed run may
+    use different ones.
+
+    Args:
+        provider: Provider class name
+        query: Search keyword
+        city: City name
+        limit: Maximum number of results
+        country: Optional country code
+        enrich: Whether contact details are fetched
+        latitude: Optional latitude for radius-based searches
+        longitude: Optional longitude for radius-based searches
+        radius_km: Optional radius in kilometers
+        **options: Further settings that change the results (e.g. tiling)
+
+    Returns:
+        JSON-serializable dictionary
+    """
+    params = {
+        "provider": provider,
+        "query": query,
+        "city": city,
+        "country": country,
+        "limit": limit,
+        "enrich": enrich,
+        "latitude": latitude,
+        "longitude": longitude,
+        "radius_km": radius_km,
+    }
+    params.update(options)
+    return params
+
+
+def encode_listing_keys(keys: Iterable[Any]) -> List[Any]:
+    """Make listing identifiers (CIDs or (name, address) tuples) JSON-serializable."""
+    return [list(key) if isinstance(key, tuple) else key for key in keys]
+
+
+def decode_listing_keys(keys: Iterable[Any]) -> List[Any]:
+    """Inverse of ``encode_listing_keys``."""
+    return [tuple(key) if isinstance(key, list) else key for key in keys]
+
+
+class SearchCheckpoint:
+    """
+    Saved state of one search: a cursor plus the leads found so far.
+
+    Providers append each lead as soon as it is final and replace the
+    cursor (whatever they need to continue, e.g. the next page and the
+    listings already seen) at safe points. Every write is its own
+    transaction, so a crash loses at most the lead being processed.
+
+    Obtain instances from ``CheckpointStore.open()``.
+    """
+
+    def __init__(
+        self,
+        store: "CheckpointStore",
+        key: str,
+        params: Dict[str, Any],
+        cursor: Optional[Dict[str, Any]],
+        leads: List[Business],
+        spent: int,
+        completed: bool,
+    ):
+        self.store = store
+        self.key = key
+        self.params = params
+        # State loaded when the checkpoint was opened.
+        self.cursor = cursor
+        self.leads = leads
+        self.spent = spent
+        self.completed = completed
+
+    @property
+    def resumed(self) -> bool:
+        """True when earlier progress was loaded."""
+        return self.cursor is not None or bool(self.leads)
+
+    def append(
+        self,
+        businesses: Iterable[Business],
+        cursor: Optional[Dict[str, Any]] = None,
+        spent: Optional[int] = None,
+    ) -> None:
+        """
+        Save new leads, optionally with a new cursor.
+
+        Args:
+            businesses: Leads in search order
+            cursor: Replaces the saved cursor in the same transaction
+            spent: Decodo calls charged to the search so far
+        """
+        self.store._write(self.key, append=list(businesses), cursor=cursor, spent=spent)
+
+    def replace(
+        self,
+        index: int,
+        business: Business,
+        cursor: Optional[Dict[str, Any]] = None,
+        spent: Optional[int] = None,
+    ) -> None:
+        """
+        Overwrite a saved lead, e.g. once it has been enriched.
+
+        Args:
+            index: Position of the lead in save order
+            business: Updated lead
+            cursor: Replaces the saved cursor in the same transaction
+            spent: Decodo calls charged to the search so far
+        """
+        self.store._write(self.key, replace=(index, business), cursor=cursor, spent=spent)
+
+    def save_cursor(self, cursor: Dict[str, Any], spent: Optional[int] = None) -> None:
+        """Replace the saved cursor."""
+        self.store._write(self.key, cursor=cursor, spent=spent)
+
+    def complete(self) -> None:
+        """Mark the search finished; resuming it returns the saved leads without new calls."""
+        self.store._write(self.key, status=STATUS_COMPLETE)
+        self.completed = True
+
+
+class CheckpointStore:
+    """
+    SQLite file of search checkpoints (WAL mode, shared by threads).
+
+    Searches are keyed by ``checkpoint_key(params)`` in the CLI and by the
+    search id in the web app; the parameters are stored alongside so a
+    search can be restarted from its key alone.
+    """
+
+    def __init__(self, path: str = DEFAULT_CHECKPOINT_PATH):
+        """
+        Initialize the store.
+
+        Args:
+            path: SQLite database file (parent directories are created)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS searches (
+                    key TEXT PRIMARY KEY,
+                    params TEXT NOT NULL,
+                    cursor TEXT,
+                    spent INTEGER NOT NULL,
+                    leads INTEGER NOT NULL,
+                    status TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS leads (
+                    key TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (key, seq)
+                ) WITHOUT ROWID
+                """
+            )
+
+    def open(self, key: str, params: Dict[str, Any], resume: bool = True) -> SearchCheckpoint:
+        """
+        Load or start the checkpoint of a search.
+
+        Args:
+            key: Search key
+            params: Search parameters, stored for ``find()``
+            resume: Load earlier progress; when False any saved state is discarded
+
+        Returns:
+            The search's checkpoint
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            if not resume:
+                self._delete(key)
+            row = self._conn.execute(
+                "SELECT cursor, spent, status FROM searches WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._conn.execute(
+                    """
+                    INSERT INTO searches (key, params, cursor, spent, leads, status, created_at, updated_at)
+                    VALUES (?, ?, NULL, 0, 0, ?, ?, ?)
+                    """,
+                    (key, json.dumps(params, default=str), STATUS_RUNNING, now, now),
+                )
+                return SearchCheckpoint(self, key, params, None, [], 0, False)
+
+            cursor, spent, status = row
+            leads = [
+                Business(json.loads(data))
+                for (data,) in self._conn.execute(
+                    "SELECT data FROM leads WHERE key = ? ORDER BY seq", (key,)
+                )
+            ]
+        return SearchCheckpoint(
+            self,
+            key,
+            params,
+            json.loads(cursor) if cursor else None,
+            leads,
+            spent,
+            status == STATUS_COMPLETE,
+        )
+
+    def find(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Describe a saved search.
+
+        Args:
+            key: Search key
+
+        Returns:
+            Dictionary with params, status, leads and updated_at, or None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT params, status, leads, updated_at FROM searches WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        params, status, leads, updated_at = row
+        return {
+            "key": key,
+            "params": json.loads(params),
+            "status": status,
+            "leads": leads,
+            "updated_at": updated_at,
+        }
+
+    def list(self) -> List[Dict[str, Any]]:
+        """
+        Describe every saved search, most recently updated first.
+
+        Returns:
+            List of dictionaries as returned by ``find()``
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, params, status, leads, updated_at FROM searches ORDER BY updated_at DESC"
+            ).fetchall()
+        return [
+            {
+                "key": key,
+                "params": json.loads(params),
+                "status": status,
+                "leads": leads,
+                "updated_at": updated_at,
+            }
+            for key, params, status, leads, updated_at in rows
+        ]
+
+    def delete(self, key: str) -> bool:
+        """
+        Remove a saved search.
+
+        Returns:
+            True when the search existed
+        """
+        with self._lock, self._conn:
+            return self._delete(key)
+
+    def prune(self, max_age: float = 7 * 24 * 60 * 60) -> int:
+        """
+        Remove searches not updated for ``max_age`` seconds.
+
+        Returns:
+            Number of searches removed
+        """
+        cutoff = time.time() - max_age
+        with self._lock, self._conn:
+            keys = [
+                key for (key,) in self._conn.execute(
+                    "SELECT key FROM searches WHERE updated_at <= ?", (cutoff,)
+                )
+            ]
+            for key in keys:
+                self._delete(key)
+        with self._lock:
+            self._conn.execute("VACUUM")
+        return len(keys)
+
+    def clear(self) -> int:
+        """
+        Remove every saved search.
+
+        Returns:
+            Number of searches removed
+        """
+        with self._lock, self._conn:
+            removed = self._conn.execute("DELETE FROM searches").rowcount
+            self._conn.execute("DELETE FROM leads")
+        with self._lock:
+            self._conn.execute("VACUUM")
+        return removed
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _delete(self, key: str) -> bool:
+        """Remove a search (caller holds the lock inside a transaction)."""
+        self._conn.execute("DELETE FROM leads WHERE key = ?", (key,))
+        return self._conn.execute("DELETE FROM searches WHERE key = ?", (key,)).rowcount > 0
+
+    def _write(
+        self,
+        key: str,
+        append: Optional[List[Business]] = None,
+        replace: Optional[Any] = None,
+        cursor: Optional[Dict[str, Any]] = None,
+        spent: Optional[int] = None,
+        status: Optional[str] = None,
+    ) -> None:
+        with self._lock, self._conn:
+            (count,) = self._conn.execute(
+                "SELECT leads FROM searches WHERE key = ?", (key,)
+            ).fetchone()
+            if append:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO leads (key, seq, data) VALUES (?, ?, ?)",
+                    [
+                        (key, count + offset, json.dumps(business, default=json_default))
+                        for offset, business in enumerate(append)
+                    ],
+                )
+                count += len(append)
+            if replace is not None:
+                index, business = replace
+                self._conn.execute(
+                    "UPDATE leads SET data = ? WHERE key = ? AND seq = ?",
+                    (json.dumps(business, default=json_default), key, index),
+                )
+
+            assignments = ["leads = ?", "updated_at = ?"]
+            values: List[Any] = [count, time.time()]
+            if cursor is not None:
+                assignments.append("cursor = ?")
+                values.append(json.dumps(cursor, default=str))
+            if spent is not None:
+                assignments.append("spent = ?")
+                values.append(spent)
+            if status is not None:
+                assignments.append("status = ?")
+                values.append(status)
+            self._conn.execute(
+                f"UPDATE searches SET {', '.join(assignments)} WHERE key = ?",
+                (*values, key),
+            )
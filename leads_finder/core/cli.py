@@ -3,28 +3,54 @@
 Command-line interface for Local Leads Finder using Decodo Scraper API.
 """
 import sys
+import time
 import click
 from dotenv import load_dotenv
 
+from .adaptive import AdaptiveConcurrencyController
+from .batch import BatchJob, job_output_path, load_jobs, run_jobs
+from .cache import DEFAULT_CACHE_PATH, ResponseCache
+from .cassette import Cassette
+from .checkpoint import DEFAULT_CHECKPOINT_PATH, CheckpointStore, checkpoint_key, search_params
+from .pagination import PaginationPolicy
+from .parse_pool import create_parse_executor
+from .place_cache import DEFAULT_PLACES_PATH, PlaceDetailsCache
 from .scraper_api_session import ScraperAPISession, DecodoUnauthorizedError
-from .dedupe import deduplicate_businesses
+from .dedupe import Deduplicator, deduplicate_businesses
 from .export import export_to_csv, export_to_json
+from .fanout import merge_streams
 from ..providers.google_maps import GoogleMapsProvider
+from ..providers.registry import PROVIDERS, provider_names, resolve_providers
 
 
 # Load environment variables
 load_dotenv()
 
 
-# Provider mapping
-PROVIDERS = {
-    "google": GoogleMapsProvider,
-    "googlemaps": GoogleMapsProvider,
-    "gmaps": GoogleMapsProvider,
-}
+class DefaultCommandGroup(click.Group):
+    """Click group that runs ``search`` when no subcommand is given."""
 
+    default_command = "search"
 
-@click.command()
+    def parse_args(self, ctx, args):
+        if not args or (args[0] not in self.commands and args[0] not in ctx.help_option_names):
+            args = [self.default_command, *args]
+        return super().parse_args(ctx, args)
+
+
+@click.group(cls=DefaultCommandGroup)
+def main():
+    """
+    Local Leads Finder - Collect local business leads using Decodo Scraper API.
+
+    Runs a search by default; see `leads-finder search --help` for options.
+
+    Example:
+        leads-finder --query "dentist" --city "Toronto" --out leads.csv
+    """
+
+
+@main.command("search")
 @click.option(
     "--query",
     required=True,
@@ -54,10 +80,27 @@ PROVIDERS = {
     default=None,
     help="Search radius in kilometers from the provided coordinates",
 )
+@click.option(
+    "--tiles/--no-tiles",
+    default=False,
+    help="Split a radius search into a hex grid of smaller circles, subdividing busy ones",
+)
+@click.option(
+    "--tile-radius-km",
+    type=float,
+    default=None,
+    help="Radius of the top-level tiles in --tiles mode (default: half of --radius-km)",
+)
+@click.option(
+    "--tile-depth",
+    default=2,
+    type=click.IntRange(min=0),
+    help="How many times a saturated tile may be subdivided in --tiles mode",
+)
 @click.option(
     "--providers",
     default="google",
-    help="Comma-separated list of providers (google, googlemaps, gmaps)",
+    help=f"Comma-separated list of providers ({', '.join(provider_names())}); distinct providers run concurrently",
 )
 @click.option(
     "--limit",
@@ -65,6 +108,12 @@ PROVIDERS = {
     type=int,
     help="Maximum number of businesses per provider",
 )
+@click.option(
+    "--max-requests",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Cap on Decodo calls per provider (result pages plus place details)",
+)
 @click.option(
     "--out",
     default="leads.csv",
@@ -76,6 +125,29 @@ PROVIDERS = {
     type=float,
     help="Requests per second rate limit",
 )
+@click.option(
+    "--burst",
+    default=None,
+    type=float,
+    help="Requests allowed back-to-back before --rps applies (default: 1)",
+)
+@click.option(
+    "--adaptive/--no-adaptive",
+    default=False,
+    help="Tune concurrency and rate from observed latency, 429s and 5xx (starts at --rps)",
+)
+@click.option(
+    "--max-rps",
+    default=10.0,
+    type=float,
+    help="Upper bound for the request rate in --adaptive mode",
+)
+@click.option(
+    "--pool-size",
+    default=10,
+    type=int,
+    help="Maximum number of keep-alive connections to the Decodo API",
+)
 @click.option(
     "--country",
     default=None,
@@ -96,23 +168,143 @@ PROVIDERS = {
     default=True,
     help="Fetch detailed contact info (phone, email, website) for each business (default: enabled)",
 )
-def main(
+@click.option(
+    "--enrich-concurrency",
+    default=4,
+    type=click.IntRange(min=1),
+    help="Place-details lookups to run in parallel during enrichment (paced by --rps)",
+)
+@click.option(
+    "--prefetch/--no-prefetch",
+    default=True,
+    help="Request the next results page while the current one is enriched (default: enabled)",
+)
+@click.option(
+    "--min-page-yield",
+    default=2,
+    type=click.IntRange(min=0),
+    help="Stop paging after pages that add fewer new listings than this (0 disables)",
+)
+@click.option(
+    "--max-pages",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Hard cap on results pages per search",
+)
+@click.option(
+    "--parser",
+    "parser_backend",
+    default="lxml",
+    type=click.Choice(["lxml", "bs4"]),
+    help="Listing parser: fast lxml XPath (falls back to BeautifulSoup) or BeautifulSoup only",
+)
+@click.option(
+    "--parse-workers",
+    default=0,
+    type=click.IntRange(min=0),
+    help="Parse HTML in this many worker processes instead of the search threads (0 = in-process)",
+)
+@click.option(
+    "--cache/--no-cache",
+    "use_cache",
+    default=False,
+    help="Reuse cached Decodo responses from previous runs (default: disabled)",
+)
+@click.option(
+    "--cache-path",
+    default=DEFAULT_CACHE_PATH,
+    show_default=True,
+    help="SQLite file backing the response cache",
+)
+@click.option(
+    "--place-cache/--no-place-cache",
+    "use_place_cache",
+    default=True,
+    help="Reuse contact details of places enriched in earlier runs (default: enabled)",
+)
+@click.option(
+    "--place-cache-path",
+    default=DEFAULT_PLACES_PATH,
+    show_default=True,
+    help="SQLite file backing the place details cache",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    default=False,
+    help="Continue an interrupted run of the same search from its checkpoint",
+)
+@click.option(
+    "--checkpoint/--no-checkpoint",
+    "use_checkpoint",
+    default=True,
+    help="Save progress after every lead so the run can be resumed (default: enabled)",
+)
+@click.option(
+    "--checkpoint-path",
+    default=DEFAULT_CHECKPOINT_PATH,
+    show_default=True,
+    help="SQLite file holding search checkpoints",
+)
+@click.option(
+    "--record",
+    "record_path",
+    default=None,
+    help="Record every Decodo response to a compressed cassette file",
+)
+@click.option(
+    "--replay",
+    "replay_path",
+    default=None,
+    help="Serve Decodo responses from a recorded cassette instead of the network",
+)
+@click.option(
+    "--replay-latency",
+    default=0.0,
+    type=float,
+    help="Simulated seconds of latency per replayed request",
+)
+def search(
     query: str,
     city: str,
     latitude: float,
     longitude: float,
     radius_km: float,
+    tiles: bool,
+    tile_radius_km: float,
+    tile_depth: int,
     providers: str,
     limit: int,
+    max_requests: int,
     out: str,
     rps: float,
+    burst: float,
+    adaptive: bool,
+    max_rps: float,
+    pool_size: int,
     country: str,
     username: str,
     password: str,
     enrich: bool,
+    enrich_concurrency: int,
+    prefetch: bool,
+    min_page_yield: int,
+    max_pages: int,
+    parser_backend: str,
+    parse_workers: int,
+    use_cache: bool,
+    cache_path: str,
+    use_place_cache: bool,
+    place_cache_path: str,
+    resume: bool,
+    use_checkpoint: bool,
+    checkpoint_path: str,
+    record_path: str,
+    replay_path: str,
+    replay_latency: float,
 ):
     """
-    Local Leads Finder - Collect local business leads using Decodo Scraper API.
+    Search providers for businesses and export them to CSV or JSON.
 
     Example:
         leads-finder --query "dentist" --city "Toronto" --out leads.csv
@@ -121,6 +313,10 @@ def main(
     print(f"📍 Providers: {providers}")
     print(f"🎯 Limit: {limit} per provider")
     print(f"📊 Enrichment: {'Enabled' if enrich else 'Disabled'}")
+    if max_requests:
+        print(f"💰 Request budget: {max_requests} per provider")
+    if use_cache:
+        print(f"🗄️  Cache: {cache_path}")
 
     use_radius = any(value is not None for value in (latitude, longitude, radius_km))
 
@@ -152,60 +348,181 @@ def main(
 
         print(f"📏 Radius: {radius_km:.2f} km around ({latitude:.6f}, {longitude:.6f})")
 
-    # Parse providers
-    provider_list = [p.strip().lower() for p in providers.split(",")]
+    if tiles and not use_radius:
+        print("❌ --tiles requires --latitude, --longitude and --radius-km")
+        sys.exit(1)
+
+    if tiles:
+        print(f"🧩 Tiling: up to {tile_depth} subdivision level(s)")
+
+    # Parse providers; aliases of one provider collapse into a single search
+    try:
+        provider_list = resolve_providers(providers.split(","))
+    except ValueError as e:
+        print(f"❌ {e}")
+        print(f"   Available: {', '.join(provider_names())}")
+        sys.exit(1)
+    if not provider_list:
+        print("❌ No providers given")
+        sys.exit(1)
+    if len(provider_list) < len([p for p in providers.split(",") if p.strip()]):
+        print(f"ℹ️  Aliases of the same provider run once: {', '.join(provider_list)}")
 
-    # Validate providers
-    invalid_providers = [p for p in provider_list if p not in PROVIDERS]
-    if invalid_providers:
-        print(f"❌ Invalid providers: {', '.join(invalid_providers)}")
-        print(f"   Available: {', '.join(PROVIDERS.keys())}")
+    if record_path and replay_path:
+        print("❌ Use either --record or --replay, not both")
         sys.exit(1)
 
+    cassette = None
+    if record_path:
+        cassette = Cassette(record_path, mode=Cassette.RECORD)
+        print(f"📼 Recording responses to {record_path}")
+    elif replay_path:
+        try:
+            cassette = Cassette(replay_path, mode=Cassette.REPLAY, latency=replay_latency)
+        except OSError as e:
+            print(f"❌ Could not open cassette: {e}")
+            sys.exit(1)
+        print(f"📼 Replaying responses from {replay_path}")
+
     # Initialize Scraper API session
     try:
         session = ScraperAPISession(
             username=username,
             password=password,
             rps=rps,
+            burst=burst,
+            pool_size=pool_size,
+            cache=ResponseCache(cache_path) if use_cache else None,
+            adaptive=AdaptiveConcurrencyController(max_rate=max_rps) if adaptive else None,
+            cassette=cassette,
         )
         print("✓ Decodo Scraper API session initialized")
     except ValueError as e:
         print(f"❌ {e}")
         sys.exit(1)
 
-    # Collect businesses from all providers
-    all_businesses = []
+    place_cache = PlaceDetailsCache(place_cache_path) if enrich and use_place_cache else None
+    parse_executor = create_parse_executor(parse_workers) if parse_workers else None
+    if parse_executor is not None:
+        print(f"🧮 Parsing in {parse_workers} worker process(es)")
+    checkpoints = CheckpointStore(checkpoint_path) if use_checkpoint else None
+    if resume and checkpoints is None:
+        print("⚠️  --resume has no effect with --no-checkpoint")
+    interrupted = False
 
-    for provider_name in provider_list:
-        print(f"\n📡 Fetching from {provider_name.upper()}...")
+    # Search all providers at once (they share the session and its rate
+    # limiter) and deduplicate leads as they arrive.
+    deduplicator = Deduplicator()
+    collected = 0
+    streams = {}
+    provider_checkpoints = []
 
-        try:
-            provider_class = PROVIDERS[provider_name]
-            provider = provider_class(session)
-            businesses = provider.search(
+    def make_stream(provider, checkpoint):
+        if tiles:
+            return lambda: provider.iter_search_tiled(
                 query,
-                city,
-                limit,
+                latitude,
+                longitude,
+                radius_km,
+                limit=limit,
+                city=city,
                 country=country,
                 enrich=enrich,
-                latitude=latitude if use_radius else None,
-                longitude=longitude if use_radius else None,
-                radius_km=radius_km if use_radius else None,
+                tile_radius_km=tile_radius_km,
+                max_depth=tile_depth,
+                max_requests=max_requests,
+                enrich_concurrency=enrich_concurrency,
+                checkpoint=checkpoint,
             )
-            all_businesses.extend(businesses)
+        return lambda: provider.iter_search(
+            query,
+            city,
+            limit,
+            country=country,
+            enrich=enrich,
+            latitude=latitude if use_radius else None,
+            longitude=longitude if use_radius else None,
+            radius_km=radius_km if use_radius else None,
+            max_requests=max_requests,
+            enrich_concurrency=enrich_concurrency,
+            prefetch=prefetch,
+            checkpoint=checkpoint,
+        )
+
+    def report_error(provider_name, error):
+        nonlocal interrupted
+        if isinstance(error, DecodoUnauthorizedError):
+            raise error
+        print(f"❌ Error with {provider_name}: {error}")
+        interrupted = interrupted or checkpoints is not None
+
+    try:
+        for provider_name in provider_list:
+            print(f"\n📡 Fetching from {provider_name.upper()}...")
+
+            try:
+                provider_class = PROVIDERS[provider_name]
+                provider = provider_class(
+                    session,
+                    parser_backend=parser_backend,
+                    place_cache=place_cache,
+                    pagination_policy=PaginationPolicy(
+                        min_yield=min_page_yield,
+                        min_new_ratio=0.2 if min_page_yield else 0.0,
+                        max_pages=max_pages,
+                    ),
+                    parse_executor=parse_executor,
+                )
+                checkpoint = None
+                if checkpoints is not None:
+                    params = search_params(
+                        provider_class.__name__,
+                        query,
+                        city,
+                        limit,
+                        country=country,
+                        enrich=enrich,
+                        latitude=latitude if use_radius else None,
+                        longitude=longitude if use_radius else None,
+                        radius_km=radius_km if use_radius else None,
+                        **({"tile_radius_km": tile_radius_km, "tile_depth": tile_depth} if tiles else {}),
+                    )
+                    checkpoint = checkpoints.open(checkpoint_key(params), params, resume=resume)
+                    provider_checkpoints.append(checkpoint)
+                    if checkpoint.resumed:
+                        print(f"♻️  Resuming from checkpoint: {len(checkpoint.leads)} leads already saved")
+                streams[provider_name] = make_stream(provider, checkpoint)
+            except Exception as e:
+                print(f"❌ Error with {provider_name}: {e}")
+                interrupted = interrupted or checkpoints is not None
+
+        try:
+            for _, business in merge_streams(streams, on_error=report_error):
+                collected += 1
+                deduplicator.add(business)
         except DecodoUnauthorizedError as e:
             print("❌ Decodo authentication failed.")
             print(f"   {e}")
             print("   Update your credentials with --username/--password or set DECODO_USERNAME and DECODO_PASSWORD.")
             sys.exit(1)
-        except Exception as e:
-            print(f"❌ Error with {provider_name}: {e}")
-            continue
+        if any(not checkpoint.completed for checkpoint in provider_checkpoints):
+            interrupted = True
+    except KeyboardInterrupt:
+        interrupted = checkpoints is not None
+        raise
+    finally:
+        if parse_executor is not None:
+            parse_executor.shutdown()
+        _close_session(session, place_cache)
+        if cassette is not None:
+            cassette.close()
+        if checkpoints is not None:
+            checkpoints.close()
+        if interrupted:
+            print("\n💾 The search did not finish; its progress is saved. Rerun with --resume to continue.")
 
-    # Deduplicate
-    print(f"\n🔄 Deduplicating {len(all_businesses)} businesses...")
-    unique_businesses = deduplicate_businesses(all_businesses)
+    unique_businesses = deduplicator.businesses
+    print(f"\n🔄 Deduplicated {collected} businesses as they arrived ({deduplicator.duplicates} duplicates)")
     print(f"✓ {len(unique_businesses)} unique businesses found")
 
     # Export
@@ -223,5 +540,486 @@ def main(
     print(f"\n✅ Done! Found {len(unique_businesses)} leads")
 
 
+def _close_session(session: ScraperAPISession, place_cache=None) -> None:
+    """Close a run's session and caches, printing their usage statistics."""
+    session.close()
+    summary = session.stats.summary_lines()
+    if summary:
+        print("\n📈 Decodo API usage:")
+        for line in summary:
+            print(f"   {line}")
+    if session.adaptive is not None:
+        snapshot = session.adaptive.snapshot()
+        rate = "no rate limit" if snapshot["rate"] is None else f"{snapshot['rate']:.2f} requests/sec"
+        print(f"\n⚙️  Adaptive limit settled at {snapshot['limit']} concurrent requests, {rate}")
+    if session.cache is not None:
+        session.cache.close()
+    if place_cache is not None:
+        place_stats = place_cache.stats()
+        print(
+            f"📇 Place cache: {place_stats['hits']} reused, "
+            f"{place_stats['misses']} fetched ({place_cache.path})"
+        )
+        place_cache.close()
+
+
+@main.command("batch")
+@click.argument("jobs_file", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--out",
+    default=None,
+    help="Write every job's leads to one deduplicated file (CSV or JSON)",
+)
+@click.option(
+    "--out-dir",
+    default="batch_leads",
+    show_default=True,
+    help="Directory for per-job output files (ignored with --out)",
+)
+@click.option(
+    "--format",
+    "output_format",
+    default="csv",
+    type=click.Choice(["csv", "json"]),
+    help="Format of per-job files without an 'out' column",
+)
+@click.option(
+    "--concurrency",
+    default=4,
+    type=click.IntRange(min=1),
+    help="Jobs run at once (all share --rps)",
+)
+@click.option(
+    "--limit",
+    default=100,
+    type=click.IntRange(min=1),
+    help="Maximum businesses per job when the file has no 'limit' column value",
+)
+@click.option(
+    "--max-requests",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Cap on Decodo calls per job (result pages plus place details)",
+)
+@click.option("--rps", default=1.0, type=float, help="Requests per second rate limit for the whole batch")
+@click.option(
+    "--burst",
+    default=None,
+    type=float,
+    help="Requests allowed back-to-back before --rps applies (default: 1)",
+)
+@click.option(
+    "--adaptive/--no-adaptive",
+    default=False,
+    help="Tune concurrency and rate from observed latency, 429s and 5xx (starts at --rps)",
+)
+@click.option("--max-rps", default=10.0, type=float, help="Upper bound for the request rate in --adaptive mode")
+@click.option(
+    "--pool-size",
+    default=10,
+    type=click.IntRange(min=1),
+    help="Maximum number of keep-alive connections to the Decodo API",
+)
+@click.option("--username", default=None, help="Decodo username (or set DECODO_USERNAME env var)")
+@click.option("--password", default=None, help="Decodo password (or set DECODO_PASSWORD env var)")
+@click.option(
+    "--enrich/--no-enrich",
+    default=True,
+    help="Fetch detailed contact info (phone, email, website) for each business (default: enabled)",
+)
+@click.option(
+    "--enrich-concurrency",
+    default=2,
+    type=click.IntRange(min=1),
+    help="Place-details lookups run in parallel per job (paced by --rps)",
+)
+@click.option(
+    "--parser",
+    "parser_backend",
+    default="lxml",
+    type=click.Choice(["lxml", "bs4"]),
+    help="Listing parser: fast lxml XPath (falls back to BeautifulSoup) or BeautifulSoup only",
+)
+@click.option(
+    "--cache/--no-cache",
+    "use_cache",
+    default=False,
+    help="Reuse cached Decodo responses from previous runs (default: disabled)",
+)
+@click.option(
+    "--cache-path",
+    default=DEFAULT_CACHE_PATH,
+    show_default=True,
+    help="SQLite file backing the response cache",
+)
+@click.option(
+    "--place-cache/--no-place-cache",
+    "use_place_cache",
+    default=True,
+    help="Reuse contact details of places enriched in earlier runs (default: enabled)",
+)
+@click.option(
+    "--place-cache-path",
+    default=DEFAULT_PLACES_PATH,
+    show_default=True,
+    help="SQLite file backing the place details cache",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    default=False,
+    help="Continue an interrupted run of the same search from its checkpoint",
+)
+@click.option(
+    "--checkpoint/--no-checkpoint",
+    "use_checkpoint",
+    default=True,
+    help="Save progress after every lead so the run can be resumed (default: enabled)",
+)
+@click.option(
+    "--checkpoint-path",
+    default=DEFAULT_CHECKPOINT_PATH,
+    show_default=True,
+    help="SQLite file holding search checkpoints",
+)
+def batch(
+    jobs_file: str,
+    out: str,
+    out_dir: str,
+    output_format: str,
+    concurrency: int,
+    limit: int,
+    max_requests: int,
+    rps: float,
+    burst: float,
+    adaptive: bool,
+    max_rps: float,
+    pool_size: int,
+    username: str,
+    password: str,
+    enrich: bool,
+    enrich_concurrency: int,
+    parser_backend: str,
+    use_cache: bool,
+    cache_path: str,
+    use_place_cache: bool,
+    place_cache_path: str,
+    resume: bool,
+    use_checkpoint: bool,
+    checkpoint_path: str,
+):
+    """
+    Run many searches from a CSV file in one process.
+
+    JOBS_FILE has a header row with a 'query' column plus 'city' or
+    'latitude', 'longitude' and 'radius_km'; optional columns are
+    'country', 'limit' and 'out' (per-job output file). All jobs share one
+    session, rate limiter, response cache and place cache.
+
+    Example:
+        leads-finder batch jobs.csv --concurrency 8 --rps 4 --out-dir leads/
+    """
+    try:
+        jobs = load_jobs(jobs_file, default_limit=limit)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    if not jobs:
+        print("❌ No jobs found")
+        sys.exit(1)
+
+    print(f"📋 {len(jobs)} jobs from {jobs_file}, {concurrency} at a time")
+    print(f"📊 Enrichment: {'Enabled' if enrich else 'Disabled'}")
+    print(f"💾 Output: {out if out else out_dir + '/ (one file per job)'}")
+
+    try:
+        session = ScraperAPISession(
+            username=username,
+            password=password,
+            rps=rps,
+            burst=burst,
+            pool_size=pool_size,
+            cache=ResponseCache(cache_path) if use_cache else None,
+            adaptive=AdaptiveConcurrencyController(max_rate=max_rps) if adaptive else None,
+        )
+        print("✓ Decodo Scraper API session initialized")
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    place_cache = PlaceDetailsCache(place_cache_path) if enrich and use_place_cache else None
+    provider = GoogleMapsProvider(session, parser_backend=parser_backend, place_cache=place_cache)
+    checkpoints = CheckpointStore(checkpoint_path) if use_checkpoint else None
+
+    def report_progress(job: BatchJob, collected: int, job_limit: int) -> None:
+        print(f"   ⏳ {job.label}: {collected}/{job_limit}")
+
+    # Deduplicates across jobs as they finish when writing a single --out file
+    combined = Deduplicator()
+    finished = 0
+    failed = 0
+    total_leads = 0
+    started = time.monotonic()
+
+    try:
+        for result in run_jobs(
+            provider,
+            jobs,
+            concurrency=concurrency,
+            progress_callback=report_progress,
+            checkpoints=checkpoints,
+            resume=resume,
+            enrich=enrich,
+            max_requests=max_requests,
+            enrich_concurrency=enrich_concurrency,
+        ):
+            finished += 1
+            prefix = f"[{finished}/{len(jobs)}] {result.job.label}"
+            if result.error:
+                failed += 1
+                print(f"❌ {prefix}: {result.error}")
+                continue
+
+            leads = deduplicate_businesses(result.businesses)
+            total_leads += len(leads)
+            rate = len(leads) / result.elapsed if result.elapsed > 0 else 0.0
+            print(f"✓ {prefix}: {len(leads)} leads in {result.elapsed:.1f}s ({rate:.2f} leads/s)")
+
+            if out:
+                combined.add_all(leads)
+            elif leads:
+                path = job_output_path(result.job, out_dir, output_format)
+                if path.endswith(".json"):
+                    export_to_json(leads, path)
+                else:
+                    export_to_csv(leads, path)
+
+            elapsed = time.monotonic() - started
+            print(
+                f"   📊 {finished}/{len(jobs)} jobs, {total_leads} leads, "
+                f"{total_leads / elapsed if elapsed > 0 else 0.0:.2f} leads/s overall"
+            )
+    except DecodoUnauthorizedError as e:
+        print("❌ Decodo authentication failed.")
+        print(f"   {e}")
+        print("   Update your credentials with --username/--password or set DECODO_USERNAME and DECODO_PASSWORD.")
+        sys.exit(1)
+    finally:
+        _close_session(session, place_cache)
+        if checkpoints is not None:
+            checkpoints.close()
+
+    elapsed = time.monotonic() - started
+    print(
+        f"\n✅ {finished - failed}/{len(jobs)} jobs done ({failed} failed) in {elapsed:.1f}s, "
+        f"{total_leads} leads"
+    )
+    if failed and checkpoints is not None:
+        print("💾 Progress of failed jobs is saved. Rerun with --resume to continue them.")
+
+    if out:
+        unique_businesses = combined.businesses
+        print(f"\n🔄 Deduplicated {total_leads} businesses across jobs ({combined.duplicates} duplicates)")
+        print(f"✓ {len(unique_businesses)} unique businesses found")
+        if unique_businesses:
+            print(f"\n💾 Exporting to {out}...")
+            if out.endswith(".json"):
+                export_to_json(unique_businesses, out)
+            else:
+                export_to_csv(unique_businesses, out)
+
+
+@main.group("cache")
+def cache_group():
+    """Inspect and maintain the on-disk Decodo response cache."""
+
+
+cache_path_option = click.option(
+    "--cache-path",
+    default=DEFAULT_CACHE_PATH,
+    show_default=True,
+    help="SQLite file backing the response cache",
+)
+
+
+@cache_group.command("stats")
+@cache_path_option
+def cache_stats(cache_path: str):
+    """Show cache size and entry counts per target."""
+    cache = ResponseCache(cache_path)
+    stats = cache.stats()
+    cache.close()
+
+    print(f"🗄️  Cache: {stats['path']}")
+    print(f"   Entries: {stats['entries']} ({stats['expired']} expired)")
+    print(f"   Size: {stats['bytes'] / 1024 / 1024:.2f} MB of {stats['max_bytes'] / 1024 / 1024:.0f} MB")
+    for target, target_stats in stats["targets"].items():
+        print(
+            f"   - {target}: {target_stats['entries']} entries, "
+            f"{target_stats['bytes'] / 1024 / 1024:.2f} MB, {target_stats['expired']} expired"
+        )
+
+
+@cache_group.command("prune")
+@cache_path_option
+def cache_prune(cache_path: str):
+    """Remove expired entries and enforce the size limit."""
+    cache = ResponseCache(cache_path)
+    removed = cache.prune()
+    cache.close()
+    print(f"✓ Pruned {removed} cache entries")
+
+
+@cache_group.command("clear")
+@cache_path_option
+def cache_clear(cache_path: str):
+    """Remove every cached response."""
+    cache = ResponseCache(cache_path)
+    removed = cache.clear()
+    cache.close()
+    print(f"✓ Cleared {removed} cache entries")
+
+
+@main.group("places")
+def places_group():
+    """Inspect, maintain and copy the place details (CID) cache."""
+
+
+place_cache_path_option = click.option(
+    "--place-cache-path",
+    default=DEFAULT_PLACES_PATH,
+    show_default=True,
+    help="SQLite file backing the place details cache",
+)
+
+
+@places_group.command("stats")
+@place_cache_path_option
+def places_stats(place_cache_path: str):
+    """Show how many places are cached."""
+    cache = PlaceDetailsCache(place_cache_path)
+    stats = cache.stats()
+    cache.close()
+
+    print(f"📇 Place cache: {stats['path']}")
+    print(f"   Entries: {stats['entries']}")
+    print(f"   Fresh: {stats['fresh']}, failed (backing off): {stats['failed']}, expired: {stats['expired']}")
+
+
+@places_group.command("prune")
+@place_cache_path_option
+def places_prune(place_cache_path: str):
+    """Remove expired places."""
+    cache = PlaceDetailsCache(place_cache_path)
+    removed = cache.prune()
+    cache.close()
+    print(f"✓ Pruned {removed} cached places")
+
+
+@places_group.command("clear")
+@place_cache_path_option
+def places_clear(place_cache_path: str):
+    """Remove every cached place."""
+    cache = PlaceDetailsCache(place_cache_path)
+    removed = cache.clear()
+    cache.close()
+    print(f"✓ Cleared {removed} cached places")
+
+
+@places_group.command("export")
+@click.argument("path")
+@click.option(
+    "--include-failures",
+    is_flag=True,
+    default=False,
+    help="Also export failed lookups that are still backing off",
+)
+@place_cache_path_option
+def places_export(path: str, include_failures: bool, place_cache_path: str):
+    """Write cached places to a JSON-lines snapshot (gzip if PATH ends in .gz)."""
+    cache = PlaceDetailsCache(place_cache_path)
+    exported = cache.export_snapshot(path, include_failures=include_failures)
+    cache.close()
+    print(f"✓ Exported {exported} places to {path}")
+
+
+@places_group.command("import")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@place_cache_path_option
+def places_import(path: str, place_cache_path: str):
+    """Merge a snapshot; entries older than the local copy are ignored."""
+    cache = PlaceDetailsCache(place_cache_path)
+    try:
+        imported = cache.import_snapshot(path)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ Could not import {path}: {e}")
+        sys.exit(1)
+    finally:
+        cache.close()
+    print(f"✓ Imported {imported} places from {path}")
+
+
+@main.group("checkpoints")
+def checkpoints_group():
+    """List and remove saved search checkpoints."""
+
+
+checkpoint_path_option = click.option(
+    "--checkpoint-path",
+    default=DEFAULT_CHECKPOINT_PATH,
+    show_default=True,
+    help="SQLite file holding search checkpoints",
+)
+
+
+@checkpoints_group.command("list")
+@checkpoint_path_option
+def checkpoints_list(checkpoint_path: str):
+    """Show saved searches, most recent first."""
+    store = CheckpointStore(checkpoint_path)
+    searches = store.list()
+    store.close()
+
+    print(f"💾 Checkpoints: {checkpoint_path}")
+    if not searches:
+        print("   No saved searches")
+    for entry in searches:
+        params = entry["params"]
+        location = params.get("city") or f"({params.get('latitude')}, {params.get('longitude')})"
+        updated = time.strftime("%Y-%m-%d %H:%M", time.localtime(entry["updated_at"]))
+        print(
+            f"   - {params.get('query')} @ {location}: {entry['leads']}/{params.get('limit')} leads, "
+            f"{entry['status']}, updated {updated}"
+        )
+
+
+@checkpoints_group.command("prune")
+@click.option(
+    "--days",
+    default=7.0,
+    type=click.FloatRange(min=0),
+    show_default=True,
+    help="Remove checkpoints not updated for this many days",
+)
+@checkpoint_path_option
+def checkpoints_prune(days: float, checkpoint_path: str):
+    """Remove old checkpoints."""
+    store = CheckpointStore(checkpoint_path)
+    removed = store.prune(days * 24 * 60 * 60)
+    store.close()
+    print(f"✓ Pruned {removed} checkpoints")
+
+
+@checkpoints_group.command("clear")
+@checkpoint_path_option
+def checkpoints_clear(checkpoint_path: str):
+    """Remove every checkpoint."""
+    store = CheckpointStore(checkpoint_path)
+    removed = store.clear()
+    store.close()
+    print(f"✓ Cleared {removed} checkpoints")
+
+
 if __name__ == "__main__":
     main()
@@ -1,7 +1,7 @@
 """
 Deduplication logic for business leads across multiple data sources.
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional
 import Levenshtein
 from .parser import normalize_business_name, normalize_phone
 
@@ -117,6 +117,57 @@ def deduplicate_businesses(businesses: List[Dict[str, Any]]) -> List[Dict[str, A
     return unique_businesses
 
 
+class Deduplicator:
+    """
+    Incremental ``deduplicate_businesses`` for businesses that arrive one at
+    a time, e.g. from several providers streaming concurrently.
+
+    Keeps exactly the businesses ``deduplicate_businesses`` would keep for
+    the same arrival order. Kept businesses are grouped by city, since
+    ``is_duplicate`` only matches names fuzzily within the same city.
+    """
+
+    def __init__(self):
+        """Initialize an empty deduplicator."""
+        self.businesses: List[Dict[str, Any]] = []
+        self.duplicates = 0
+        self._keys = set()
+        self._by_city: Dict[Any, List[Dict[str, Any]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.businesses)
+
+    def add(self, business: Dict[str, Any]) -> bool:
+        """
+        Keep a business unless it duplicates one already kept.
+
+        Args:
+            business: Business to add
+
+        Returns:
+            True if the business was kept, False if it was a duplicate
+        """
+        key = generate_business_key(business)
+        same_city = self._by_city.setdefault(business.get("city"), [])
+        if key in self._keys or is_duplicate(business, same_city):
+            self.duplicates += 1
+            return False
+
+        self.businesses.append(business)
+        self._keys.add(key)
+        same_city.append(business)
+        return True
+
+    def add_all(self, businesses: Iterable[Dict[str, Any]]) -> int:
+        """
+        Add several businesses.
+
+        Returns:
+            Number of businesses kept
+        """
+        return sum(1 for business in businesses if self.add(business))
+
+
 def merge_businesses(
     business1: Dict[str, Any],
     business2: Dict[str, Any]
@@ -2,9 +2,11 @@
 Export functionality for business leads.
 """
 import csv
-from typing import List, Dict, Any
+from typing import Any, Iterable, List, Mapping
 from pathlib import Path
 
+from .business import json_default
+
 
 # Define standard CSV columns as per PRD
 CSV_COLUMNS = [
@@ -26,12 +28,26 @@ CSV_COLUMNS = [
 ]
 
 
-def export_to_csv(businesses: List[Dict[str, Any]], output_path: str) -> None:
+def csv_row(business: Mapping[str, Any], columns: Iterable[str] = CSV_COLUMNS) -> List[Any]:
+    """
+    Values of one business in CSV column order.
+
+    Args:
+        business: ``Business`` record or dict
+        columns: Column names
+
+    Returns:
+        One value per column (None for missing fields)
+    """
+    return [business.get(column) for column in columns]
+
+
+def export_to_csv(businesses: List[Mapping[str, Any]], output_path: str) -> None:
     """
     Export businesses to CSV file.
 
     Args:
-        businesses: List of business dictionaries
+        businesses: List of ``Business`` records or dicts
         output_path: Path to output CSV file
     """
     if not businesses:
@@ -44,23 +60,20 @@ def export_to_csv(businesses: List[Dict[str, Any]], output_path: str) -> None:
 
     # Write CSV
     with open(output_file, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS, extrasaction="ignore")
-        writer.writeheader()
-
-        for business in businesses:
-            # Ensure all columns are present (use None for missing)
-            row = {col: business.get(col) for col in CSV_COLUMNS}
-            writer.writerow(row)
+        writer = csv.writer(f)
+        writer.writerow(CSV_COLUMNS)
+        # Rows are written straight from the records, without an intermediate dict.
+        writer.writerows(csv_row(business) for business in businesses)
 
     print(f"✓ Exported {len(businesses)} businesses to {output_path}")
 
 
-def export_to_json(businesses: List[Dict[str, Any]], output_path: str) -> None:
+def export_to_json(businesses: List[Mapping[str, Any]], output_path: str) -> None:
     """
     Export businesses to JSON file.
 
     Args:
-        businesses: List of business dictionaries
+        businesses: List of ``Business`` records or dicts
         output_path: Path to output JSON file
     """
     import json
@@ -75,6 +88,6 @@ def export_to_json(businesses: List[Dict[str, Any]], output_path: str) -> None:
 
     # Write JSON
     with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(businesses, f, indent=2, ensure_ascii=False)
+        json.dump(businesses, f, indent=2, ensure_ascii=False, default=json_default)
 
     print(f"✓ Exported {len(businesses)} businesses to {output_path}")
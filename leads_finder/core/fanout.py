@@ -0,0 +1,91 @@
+"""
+Run several result streams at once and merge them as items arrive.
+"""
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+
+# Marks the end of a stream on the merge queue.
+_DONE = object()
+
+
+def merge_streams(
+    streams: Dict[str, Callable[[], Iterable[Any]]],
+    on_error: Optional[Callable[[str, Exception], None]] = None,
+) -> Iterator[Tuple[str, Any]]:
+    """
+    Consume several iterables concurrently, yielding items in arrival order.
+
+    Each stream is created and iterated in its own thread, so a slow source
+    does not hold back the others and the total wall time is that of the
+    slowest stream rather than the sum. A single stream is iterated in the
+    caller's thread.
+
+    When a stream raises, ``on_error(name, error)`` is called in the
+    caller's thread and the other streams keep running; without
+    ``on_error``, or if it raises, the error ends the merge. Closing the
+    generator early stops the remaining streams: each finishes the item it
+    is producing and its iterator is closed, so providers cancel their
+    queued work.
+
+    Args:
+        streams: Stream name -> callable returning the stream's iterable
+        on_error: Optional handler for errors raised by a stream
+
+    Yields:
+        Tuples of (stream name, item)
+    """
+    if len(streams) == 1:
+        ((name, factory),) = streams.items()
+        try:
+            for item in factory():
+                yield name, item
+        except Exception as e:
+            if on_error is None:
+                raise
+            on_error(name, e)
+        return
+
+    items: "queue.Queue[Tuple[str, Any, Optional[Exception]]]" = queue.Queue()
+    stop = threading.Event()
+
+    def run(name: str, factory: Callable[[], Iterable[Any]]) -> None:
+        iterator = None
+        error = None
+        try:
+            iterator = iter(factory())
+            for item in iterator:
+                items.put((name, item, None))
+                if stop.is_set():
+                    break
+        except Exception as e:
+            error = e
+        finally:
+            try:
+                close = getattr(iterator, "close", None)
+                if close is not None:
+                    close()
+            finally:
+                items.put((name, _DONE, error))
+
+    executor = ThreadPoolExecutor(max_workers=max(len(streams), 1), thread_name_prefix="leads-stream")
+    try:
+        for name, factory in streams.items():
+            executor.submit(run, name, factory)
+
+        running = len(streams)
+        while running:
+            name, item, error = items.get()
+            if item is not _DONE:
+                yield name, item
+                continue
+            running -= 1
+            if error is not None:
+                if on_error is None:
+                    raise error
+                on_error(name, error)
+    finally:
+        stop.set()
+        executor.shutdown(wait=True)
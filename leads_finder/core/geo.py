@@ -0,0 +1,114 @@
+"""
+Hexagonal tiling of search circles for geo-grid searches.
+"""
+import math
+from typing import List, NamedTuple
+
+
+KM_PER_DEGREE_LATITUDE = 111.32
+
+
+class Tile(NamedTuple):
+    """A circular search area."""
+
+    latitude: float
+    longitude: float
+    radius_km: float
+    depth: int = 0
+
+
+def distance_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """
+    Great-circle distance between two points.
+
+    Args:
+        lat1: Latitude of the first point
+        lng1: Longitude of the first point
+        lat2: Latitude of the second point
+        lng2: Longitude of the second point
+
+    Returns:
+        Distance in kilometers
+    """
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlmb = math.radians(lng2 - lng1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlmb / 2) ** 2
+    return 2 * 6371.0088 * math.asin(min(1.0, math.sqrt(a)))
+
+
+def hex_tiles(
+    latitude: float,
+    longitude: float,
+    radius_km: float,
+    tile_radius_km: float,
+    depth: int = 0,
+) -> List[Tile]:
+    """
+    Cover a circle with overlapping sub-circles centered on a hexagonal grid.
+
+    Centers are ``tile_radius_km * sqrt(3)`` apart, the spacing at which
+    circles of ``tile_radius_km`` leave no gaps. Tiles that do not reach the
+    outer circle are dropped. The result starts at the center and works
+    outwards ring by ring, so the densest area is searched first.
+
+    Args:
+        latitude: Center latitude of the area
+        longitude: Center longitude of the area
+        radius_km: Radius of the area
+        tile_radius_km: Radius of each tile
+        depth: Subdivision depth recorded on the tiles
+
+    Returns:
+        Tiles ordered by distance from the center
+    """
+    if tile_radius_km <= 0:
+        raise ValueError("tile_radius_km must be positive")
+    if tile_radius_km >= radius_km:
+        return [Tile(latitude, longitude, radius_km, depth)]
+
+    spacing = tile_radius_km * math.sqrt(3)
+    km_per_degree_lng = KM_PER_DEGREE_LATITUDE * max(math.cos(math.radians(latitude)), 1e-6)
+    rings = int(math.ceil((radius_km + tile_radius_km) / spacing)) + 1
+
+    tiles = []
+    for q in range(-rings, rings + 1):
+        for r in range(-rings, rings + 1):
+            # Axial hex coordinates -> planar offsets in km.
+            x = spacing * (q + r / 2.0)
+            y = spacing * (r * math.sqrt(3) / 2.0)
+            offset = math.hypot(x, y)
+            # Tiles at or beyond R + r at most touch the area; allow for rounding.
+            if offset >= (radius_km + tile_radius_km) * (1 - 1e-9):
+                continue
+            tiles.append((
+                offset,
+                Tile(
+                    round(latitude + y / KM_PER_DEGREE_LATITUDE, 6),
+                    round(longitude + x / km_per_degree_lng, 6),
+                    tile_radius_km,
+                    depth,
+                ),
+            ))
+
+    tiles.sort(key=lambda item: item[0])
+    return [tile for _, tile in tiles]
+
+
+def subdivide(tile: Tile) -> List[Tile]:
+    """
+    Split a tile into the seven half-radius tiles of its hex grid.
+
+    Args:
+        tile: Tile to split
+
+    Returns:
+        Child tiles, one level deeper
+    """
+    return hex_tiles(
+        tile.latitude,
+        tile.longitude,
+        tile.radius_km,
+        tile.radius_km / 2.0,
+        depth=tile.depth + 1,
+    )
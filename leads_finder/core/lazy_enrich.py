@@ -0,0 +1,234 @@
+"""
+On-demand enrichment of search results, most urgent rows first.
+"""
+import itertools
+import queue
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .business import Business
+
+
+# Request priorities; lower runs first.
+PRIORITY_VISIBLE = 0
+PRIORITY_EXPORT = 1
+
+_PENDING = 0
+_QUEUED = 1
+_RUNNING = 2
+_DONE = 3
+_FAILED = 4
+
+# Finished rows, successfully or not
+_SETTLED = (_DONE, _FAILED)
+
+
+class LazyEnricher:
+    """
+    Enrich a fixed list of businesses only when rows are asked for.
+
+    Callers ``request()`` row indexes with a priority: rows on screen
+    before rows needed for an export, and within a priority the most recent
+    request first, so paging through a table always serves the page being
+    looked at. Rows are enriched once, by up to ``workers`` threads that
+    exit after ``idle_timeout`` seconds without work; when the last one
+    exits ``on_idle`` is called, e.g. to release the session's pooled
+    connections, and a later request simply starts new workers. ``close()``
+    stops the workers for good.
+
+    ``enrich`` receives a copy of the row and may fill in contact fields;
+    the copy is merged back into the shared row under the enricher's lock,
+    so readers using ``rows()`` never see a half-updated business. When
+    ``enrich`` raises, the row is left unchanged and reported by
+    ``failed()`` until it is requested again, which retries it.
+    """
+
+    def __init__(
+        self,
+        businesses: List[Business],
+        enrich: Callable[[Business], Any],
+        workers: int = 2,
+        idle_timeout: float = 30.0,
+        on_idle: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Initialize the enricher.
+
+        Args:
+            businesses: Rows to enrich in place
+            enrich: Called with a copy of a row; fills in its contact details
+            workers: Maximum number of rows enriched at once
+            idle_timeout: Seconds an idle worker thread waits before exiting
+            on_idle: Called whenever the last worker thread exits (after
+                ``idle_timeout`` without work, or after ``close()``)
+        """
+        self.businesses = businesses
+        self.workers = max(int(workers), 1)
+        self.idle_timeout = idle_timeout
+        self._enrich = enrich
+        self._on_idle = on_idle
+        self._queue: "queue.PriorityQueue[Tuple[int, int, int, int]]" = queue.PriorityQueue()
+        self._state = [_PENDING] * len(businesses)
+        self._done = 0
+        self._requests = 0
+        self._order = itertools.count()
+        self._threads: List[threading.Thread] = []
+        self._closed = False
+        self._lock = threading.Condition()
+
+    @property
+    def total(self) -> int:
+        """Number of rows."""
+        return len(self.businesses)
+
+    @property
+    def enriched(self) -> int:
+        """Rows enriched successfully so far."""
+        with self._lock:
+            return self._done
+
+    def request(self, indexes: Iterable[int], priority: int = PRIORITY_VISIBLE) -> None:
+        """
+        Queue rows for enrichment.
+
+        Rows already enriched or being enriched are ignored; queued rows are
+        queued again under the new request, which overtakes the old one, and
+        failed rows are retried.
+
+        Args:
+            indexes: Row indexes, enriched in the given order
+            priority: ``PRIORITY_VISIBLE`` or ``PRIORITY_EXPORT``
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._requests += 1
+            for index in indexes:
+                if not 0 <= index < len(self._state) or self._state[index] in (_RUNNING, _DONE):
+                    continue
+                self._state[index] = _QUEUED
+                self._queue.put((priority, -self._requests, next(self._order), index))
+            self._start_workers()
+
+    def pending(self, indexes: Iterable[int]) -> List[int]:
+        """Return the given rows that are neither enriched nor failed yet."""
+        with self._lock:
+            return [
+                index for index in indexes
+                if 0 <= index < len(self._state) and self._state[index] not in _SETTLED
+            ]
+
+    def failed(self, indexes: Iterable[int]) -> List[int]:
+        """Return the given rows whose last enrichment attempt failed."""
+        with self._lock:
+            return [
+                index for index in indexes
+                if 0 <= index < len(self._state) and self._state[index] == _FAILED
+            ]
+
+    def rows(self, indexes: Iterable[int]) -> Dict[int, Business]:
+        """Return copies of the given rows that are enriched or failed."""
+        with self._lock:
+            return {
+                index: self.businesses[index].copy()
+                for index in indexes
+                if 0 <= index < len(self._state) and self._state[index] in _SETTLED
+            }
+
+    def wait(self, indexes: Iterable[int], timeout: Optional[float] = None) -> bool:
+        """
+        Block until the given rows are enriched or have failed.
+
+        Only rows that were requested can finish; request them first.
+
+        Args:
+            indexes: Row indexes
+            timeout: Optional maximum wait in seconds
+
+        Returns:
+            True when every row is enriched or has failed
+        """
+        indexes = list(indexes)
+        with self._lock:
+            return self._lock.wait_for(
+                lambda: all(
+                    self._state[index] in _SETTLED
+                    for index in indexes
+                    if 0 <= index < len(self._state)
+                ),
+                timeout,
+            )
+
+    def close(self) -> None:
+        """
+        Stop enriching: drop queued rows and let the workers exit.
+
+        A row being enriched finishes first; ``on_idle`` runs once the last
+        worker has exited (right away when none is running).
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            for _ in self._threads:
+                # Wake idle workers so they notice the close.
+                self._queue.put((-1, 0, next(self._order), -1))
+            idle = not self._threads
+        if idle:
+            self._notify_idle()
+
+    def _start_workers(self) -> None:
+        """Start worker threads for queued rows (caller holds the lock)."""
+        self._threads = [thread for thread in self._threads if thread.is_alive()]
+        while len(self._threads) < min(self.workers, self._queue.qsize()):
+            thread = threading.Thread(target=self._work, name="leads-lazy-enrich", daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def _work(self) -> None:
+        while True:
+            try:
+                _, _, _, index = self._queue.get(timeout=self.idle_timeout)
+            except queue.Empty:
+                index = None
+
+            with self._lock:
+                # request() enqueues under the lock, so nothing can slip in here.
+                if self._closed or (index is None and self._queue.empty()):
+                    self._threads.remove(threading.current_thread())
+                    idle = not self._threads
+                    break
+                # Timed out with work queued, or a stale entry: the row was
+                # queued again or already handled.
+                if index is None or self._state[index] != _QUEUED:
+                    continue
+                self._state[index] = _RUNNING
+                business = self.businesses[index].copy()
+
+            try:
+                self._enrich(business)
+                failed = False
+            except Exception as e:
+                print(f"Lazy enrichment failed for row {index}: {e}")
+                failed = True
+
+            with self._lock:
+                if failed:
+                    self._state[index] = _FAILED
+                else:
+                    self.businesses[index].update(business)
+                    self._state[index] = _DONE
+                    self._done += 1
+                self._lock.notify_all()
+
+        if idle:
+            self._notify_idle()
+
+    def _notify_idle(self) -> None:
+        if self._on_idle is not None:
+            try:
+                self._on_idle()
+            except Exception:
+                pass
@@ -0,0 +1,141 @@
+"""
+Early-termination policy for paging through search results.
+"""
+import hashlib
+from typing import Any, Dict, Iterable, Optional, Set
+
+
+# Reasons reported when a search stops paging.
+STOP_LIMIT = "limit reached"
+STOP_BUDGET = "request budget exhausted"
+STOP_EMPTY = "page had no listings"
+STOP_REPEATED = "page repeated an earlier page"
+STOP_NO_NEW = "page had no new listings"
+STOP_LOW_YIELD = "new listings per page fell below the minimum yield"
+STOP_PAGE_CAP = "page cap reached"
+
+
+def page_fingerprint(keys: Iterable[Any]) -> str:
+    """
+    Fingerprint a results page by the ordered identities of its listings.
+
+    Listing identities are used instead of the raw HTML, which carries
+    per-request tokens and would never compare equal.
+
+    Args:
+        keys: Listing identifiers (CID or name/address) in page order
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha1()
+    for key in keys:
+        digest.update(repr(key).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class PaginationPolicy:
+    """
+    Decide when further results pages stop paying off.
+
+    A page counts as low-yield when it adds fewer than ``min_yield`` new
+    listings or when fewer than ``min_new_ratio`` of its listings are new.
+    Paging stops after ``patience`` consecutive low-yield pages, immediately
+    on a page with nothing new or a page identical to an earlier one, and
+    after ``max_pages`` pages when set.
+    """
+
+    def __init__(
+        self,
+        min_yield: int = 2,
+        min_new_ratio: float = 0.2,
+        patience: int = 2,
+        max_pages: Optional[int] = None,
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            min_yield: New listings a page must add to count as productive
+            min_new_ratio: Share (0-1) of a page's listings that must be new
+            patience: Consecutive low-yield pages tolerated before stopping
+            max_pages: Optional hard cap on pages per search
+        """
+        self.min_yield = max(int(min_yield), 0)
+        self.min_new_ratio = min(max(min_new_ratio, 0.0), 1.0)
+        self.patience = max(int(patience), 1)
+        self.max_pages = max_pages
+
+    def start(self) -> "PaginationRun":
+        """Begin tracking a new search."""
+        return PaginationRun(self)
+
+
+class PaginationRun:
+    """Per-search state of a ``PaginationPolicy``."""
+
+    def __init__(self, policy: PaginationPolicy):
+        self.policy = policy
+        self.pages = 0
+        self.stop_reason: Optional[str] = None
+        self._fingerprints: Set[str] = set()
+        self._low_yield_streak = 0
+
+    def observe(self, page_keys: Iterable[Any], new_listings: int) -> bool:
+        """
+        Record a parsed page and decide whether to request the next one.
+
+        Args:
+            page_keys: Identifiers of every listing on the page, seen or not
+            new_listings: Listings on the page not seen earlier in the search
+
+        Returns:
+            True to keep paging; False once ``stop_reason`` is set
+        """
+        page_keys = list(page_keys)
+        self.pages += 1
+        policy = self.policy
+
+        if not page_keys:
+            return self.stop(STOP_EMPTY)
+
+        fingerprint = page_fingerprint(page_keys)
+        if fingerprint in self._fingerprints:
+            return self.stop(STOP_REPEATED)
+        self._fingerprints.add(fingerprint)
+
+        if new_listings == 0:
+            return self.stop(STOP_NO_NEW)
+
+        if new_listings < policy.min_yield or new_listings / len(page_keys) < policy.min_new_ratio:
+            self._low_yield_streak += 1
+            if self._low_yield_streak >= policy.patience:
+                return self.stop(STOP_LOW_YIELD)
+        else:
+            self._low_yield_streak = 0
+
+        if policy.max_pages is not None and self.pages >= policy.max_pages:
+            return self.stop(STOP_PAGE_CAP)
+
+        return True
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the run's state as a JSON-serializable dict (for checkpoints)."""
+        return {
+            "pages": self.pages,
+            "fingerprints": sorted(self._fingerprints),
+            "low_yield_streak": self._low_yield_streak,
+        }
+
+    def restore(self, state: Dict[str, Any]) -> None:
+        """Continue from a ``snapshot()`` taken by an interrupted search."""
+        self.pages = int(state.get("pages", 0))
+        self._fingerprints = set(state.get("fingerprints", ()))
+        self._low_yield_streak = int(state.get("low_yield_streak", 0))
+
+    def stop(self, reason: str) -> bool:
+        """Record why paging stopped (the first reason wins)."""
+        if self.stop_reason is None:
+            self.stop_reason = reason
+        return False
@@ -0,0 +1,41 @@
+"""
+Process pool for CPU-bound HTML parsing.
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+
+def default_parse_workers() -> int:
+    """One worker per core, leaving one core for the searching process."""
+    return max((os.cpu_count() or 2) - 1, 1)
+
+
+def create_parse_executor(workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Create a process pool for ``GoogleMapsProvider(parse_executor=...)``.
+
+    Parsing results and place pages is pure Python work that holds the GIL,
+    so in a threaded process (the web app, or several searches at once) one
+    busy parser stalls every other thread. Workers are started with the
+    "spawn" method: forking a process that already runs threads and holds
+    SQLite connections is not safe.
+
+    One pool can be shared by any number of providers and searches.
+
+    Args:
+        workers: Number of worker processes (default: one per core minus one)
+
+    Returns:
+        Executor to pass to providers; call ``shutdown()`` when done
+    """
+    if workers is None:
+        workers = default_parse_workers()
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
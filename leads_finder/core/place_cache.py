@@ -0,0 +1,342 @@
+"""
+Persistent cache of Google place contact details keyed by CID.
+"""
+import gzip
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
+
+
+DEFAULT_PLACES_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "leads-finder", "places.sqlite3"
+)
+
+DEFAULT_PLACE_TTL = 30 * 24 * 60 * 60
+
+CONTACT_FIELDS = ("phone", "email", "website")
+
+
+class PlaceDetailsCache:
+    """
+    CID -> contact details store shared across searches, runs and users.
+
+    Lookups go through an in-process LRU before hitting SQLite (WAL mode, so
+    the CLI and web app workers can share the file). Successful lookups live
+    for ``ttl`` seconds. Failed lookups are cached negatively: the first
+    failure suppresses retries for ``failure_backoff`` seconds and every
+    further failure doubles the wait, up to ``max_failure_backoff``.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_PLACES_PATH,
+        ttl: float = DEFAULT_PLACE_TTL,
+        memory_size: int = 4096,
+        failure_backoff: float = 60 * 60,
+        max_failure_backoff: float = 7 * 24 * 60 * 60,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite database file (parent directories are created)
+            ttl: Seconds a successful lookup stays fresh
+            memory_size: Number of CIDs kept in the in-process LRU
+            failure_backoff: Seconds a first failed lookup is not retried
+            max_failure_backoff: Upper bound for the doubling failure backoff
+        """
+        self.path = path
+        self.ttl = ttl
+        self.memory_size = max(int(memory_size), 0)
+        self.failure_backoff = max(failure_backoff, 0.0)
+        self.max_failure_backoff = max(max_failure_backoff, self.failure_backoff)
+        self._lock = threading.Lock()
+        # cid -> (expires_at, details or None for a cached failure)
+        self._memory: "OrderedDict[str, Tuple[float, Optional[Dict[str, Optional[str]]]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS places (
+                    cid TEXT PRIMARY KEY,
+                    phone TEXT,
+                    email TEXT,
+                    website TEXT,
+                    ok INTEGER NOT NULL,
+                    failures INTEGER NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+                """
+            )
+
+    def get(self, cid: str) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Look up a place.
+
+        Args:
+            cid: Google CID
+
+        Returns:
+            Contact details, an empty dict while a failed lookup is backing
+            off, or None when the CID should be fetched
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(cid)
+            if entry is None:
+                row = self._conn.execute(
+                    "SELECT phone, email, website, ok, expires_at FROM places WHERE cid = ?",
+                    (cid,),
+                ).fetchone()
+                if row is not None:
+                    phone, email, website, ok, expires_at = row
+                    details = {"phone": phone, "email": email, "website": website} if ok else None
+                    entry = (expires_at, details)
+                    self._remember(cid, entry)
+            else:
+                self._memory.move_to_end(cid)
+
+            if entry is None or entry[0] <= now:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            details = entry[1]
+            return dict(details) if details is not None else {}
+
+    def set(self, cid: str, details: Dict[str, Optional[str]]) -> None:
+        """
+        Store a successful lookup, clearing any failure history.
+
+        Args:
+            cid: Google CID
+            details: Parsed contact details
+        """
+        if self.ttl <= 0:
+            return
+
+        details = {field: details.get(field) for field in CONTACT_FIELDS}
+        now = time.time()
+        expires_at = now + self.ttl
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO places
+                    (cid, phone, email, website, ok, failures, fetched_at, expires_at)
+                VALUES (?, ?, ?, ?, 1, 0, ?, ?)
+                """,
+                (cid, details["phone"], details["email"], details["website"], now, expires_at),
+            )
+            self._remember(cid, (expires_at, details))
+
+    def record_failure(self, cid: str) -> float:
+        """
+        Cache a failed lookup with exponential backoff.
+
+        A previously successful entry keeps its details; only its expiry is
+        pushed out, so a transient failure does not erase known contacts.
+
+        Args:
+            cid: Google CID
+
+        Returns:
+            Seconds until the CID will be fetched again
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT phone, email, website, ok, failures FROM places WHERE cid = ?",
+                (cid,),
+            ).fetchone()
+            failures = (row[4] if row else 0) + 1
+            backoff = min(
+                self.failure_backoff * (2 ** (failures - 1)), self.max_failure_backoff
+            )
+            expires_at = now + backoff
+
+            if row is not None and row[3]:
+                self._conn.execute(
+                    "UPDATE places SET failures = ?, expires_at = ? WHERE cid = ?",
+                    (failures, expires_at, cid),
+                )
+                details = {"phone": row[0], "email": row[1], "website": row[2]}
+            else:
+                self._conn.execute(
+                    """
+                    INSERT OR REPLACE INTO places
+                        (cid, phone, email, website, ok, failures, fetched_at, expires_at)
+                    VALUES (?, NULL, NULL, NULL, 0, ?, ?, ?)
+                    """,
+                    (cid, failures, now, expires_at),
+                )
+                details = None
+            self._remember(cid, (expires_at, details))
+        return backoff
+
+    def _remember(self, cid: str, entry: Tuple[float, Optional[Dict[str, Optional[str]]]]) -> None:
+        if not self.memory_size:
+            return
+        self._memory[cid] = entry
+        self._memory.move_to_end(cid)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def export_snapshot(self, path: str, include_failures: bool = False) -> int:
+        """
+        Write unexpired entries to a JSON-lines file (gzip when it ends in .gz).
+
+        Args:
+            path: Destination file
+            include_failures: Also export negative entries
+
+        Returns:
+            Number of entries written
+        """
+        query = "SELECT cid, phone, email, website, ok, failures, fetched_at, expires_at FROM places WHERE expires_at > ?"
+        if not include_failures:
+            query += " AND ok = 1"
+        with self._lock:
+            rows = self._conn.execute(query, (time.time(),)).fetchall()
+
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "wt", encoding="utf-8") as f:
+            for cid, phone, email, website, ok, failures, fetched_at, expires_at in rows:
+                f.write(json.dumps({
+                    "cid": cid,
+                    "phone": phone,
+                    "email": email,
+                    "website": website,
+                    "ok": bool(ok),
+                    "failures": failures,
+                    "fetched_at": fetched_at,
+                    "expires_at": expires_at,
+                }, ensure_ascii=False) + "\n")
+        return len(rows)
+
+    def import_snapshot(self, path: str) -> int:
+        """
+        Merge a snapshot written by ``export_snapshot``.
+
+        Entries only replace local ones that were fetched earlier, so
+        importing an older snapshot never overwrites fresher data.
+
+        Args:
+            path: Snapshot file
+
+        Returns:
+            Number of entries inserted or updated
+        """
+        opener = gzip.open if path.endswith(".gz") else open
+        imported = 0
+        with opener(path, "rt", encoding="utf-8") as f, self._lock, self._conn:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                entry = json.loads(line)
+                cursor = self._conn.execute(
+                    """
+                    INSERT INTO places
+                        (cid, phone, email, website, ok, failures, fetched_at, expires_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(cid) DO UPDATE SET
+                        phone = excluded.phone,
+                        email = excluded.email,
+                        website = excluded.website,
+                        ok = excluded.ok,
+                        failures = excluded.failures,
+                        fetched_at = excluded.fetched_at,
+                        expires_at = excluded.expires_at
+                    WHERE excluded.fetched_at > places.fetched_at
+                    """,
+                    (
+                        str(entry["cid"]),
+                        entry.get("phone"),
+                        entry.get("email"),
+                        entry.get("website"),
+                        1 if entry.get("ok", True) else 0,
+                        int(entry.get("failures", 0)),
+                        float(entry["fetched_at"]),
+                        float(entry["expires_at"]),
+                    ),
+                )
+                imported += cursor.rowcount
+            self._memory.clear()
+        return imported
+
+    def prune(self) -> int:
+        """
+        Remove expired entries.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock, self._conn:
+            removed = self._conn.execute(
+                "DELETE FROM places WHERE expires_at <= ?", (time.time(),)
+            ).rowcount
+            self._memory.clear()
+        with self._lock:
+            self._conn.execute("VACUUM")
+        return removed
+
+    def clear(self) -> int:
+        """
+        Remove every entry.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock, self._conn:
+            removed = self._conn.execute("DELETE FROM places").rowcount
+            self._memory.clear()
+        with self._lock:
+            self._conn.execute("VACUUM")
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Summarize cache contents.
+
+        Returns:
+            Dictionary with entry counts and this process's hit/miss counters
+        """
+        now = time.time()
+        with self._lock:
+            entries, ok, failed, expired = self._conn.execute(
+                """
+                SELECT COUNT(*),
+                       COALESCE(SUM(CASE WHEN ok = 1 AND expires_at > ? THEN 1 ELSE 0 END), 0),
+                       COALESCE(SUM(CASE WHEN ok = 0 AND expires_at > ? THEN 1 ELSE 0 END), 0),
+                       COALESCE(SUM(CASE WHEN expires_at <= ? THEN 1 ELSE 0 END), 0)
+                FROM places
+                """,
+                (now, now, now),
+            ).fetchone()
+            return {
+                "path": self.path,
+                "entries": entries,
+                "fresh": ok,
+                "failed": failed,
+                "expired": expired,
+                "memory_entries": len(self._memory),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,107 @@
+"""
+Thread-safe token-bucket rate limiting for Decodo API calls.
+"""
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucketRateLimiter:
+    """
+    Token bucket limiter allowing ``rate`` requests per second with bursts.
+
+    The bucket holds up to ``burst`` tokens and refills continuously at
+    ``rate`` tokens per second. Each request consumes one token; when the
+    bucket is empty the caller reserves a future token and sleeps until it
+    becomes available. Reservations are taken under a lock using a monotonic
+    clock, so a single limiter can be shared by several threads and sessions
+    without callers firing together.
+    """
+
+    def __init__(self, rate: float = 1.0, burst: Optional[float] = None):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Sustained requests per second (fractional rates allowed, <= 0 disables limiting)
+            burst: Maximum number of requests that may be sent back-to-back
+                (defaults to 1, i.e. evenly spaced requests)
+        """
+        self._lock = threading.Lock()
+        self._rate = 0.0
+        self._burst = 1.0
+        self._tokens = 0.0
+        self._updated = time.monotonic()
+        self.configure(rate, burst)
+        with self._lock:
+            self._tokens = self._burst
+
+    @property
+    def rate(self) -> float:
+        """Current sustained rate in requests per second."""
+        return self._rate
+
+    @property
+    def burst(self) -> float:
+        """Current burst capacity."""
+        return self._burst
+
+    def configure(self, rate: float, burst: Optional[float] = None) -> None:
+        """
+        Change the rate (and optionally the burst) of a live limiter.
+
+        Args:
+            rate: New sustained requests per second (<= 0 disables limiting)
+            burst: New burst capacity (keeps the current value when omitted)
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._rate = max(float(rate or 0.0), 0.0)
+            if burst is not None:
+                self._burst = max(float(burst), 1.0)
+            self._tokens = min(self._tokens, self._burst)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0 and self._rate > 0:
+            self._tokens = min(self._burst, self._tokens + elapsed * self._rate)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Reserve tokens and return how long the caller must wait before using them.
+
+        The reservation is committed immediately, so concurrent callers queue
+        up behind each other instead of observing the same free slot.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Delay in seconds (0.0 when the request may proceed immediately)
+        """
+        with self._lock:
+            if self._rate <= 0:
+                return 0.0
+
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Block until the requested tokens are available.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Seconds spent waiting
+        """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
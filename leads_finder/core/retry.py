@@ -0,0 +1,263 @@
+"""
+Retry and circuit-breaker policies for Decodo API calls.
+"""
+import random
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Optional, Mapping, Dict, Iterable
+
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class RetryPolicy:
+    """
+    Capped exponential backoff with full jitter.
+
+    Failures are split into three kinds, each with its own retry budget:
+
+    - ``connect``: the connection could not be established, so the request
+      never reached Decodo and is always safe to repeat.
+    - ``read``: the request was sent but no response arrived in time. Decodo
+      may still have rendered (and billed) it, so these are retried sparingly.
+    - ``status``: Decodo answered with a retryable status such as 429 or 502.
+      A ``Retry-After`` header, when present, overrides the computed backoff.
+    """
+
+    def __init__(
+        self,
+        connect_retries: int = 3,
+        read_retries: int = 1,
+        status_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: Iterable[int] = RETRYABLE_STATUS_CODES,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 120.0,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 60.0,
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            connect_retries: Retries allowed after connection failures or connect timeouts
+            read_retries: Retries allowed after read timeouts
+            status_retries: Retries allowed after retryable HTTP status codes
+            backoff_base: Backoff for the first retry in seconds (doubles each attempt)
+            backoff_max: Upper bound for a single backoff delay
+            jitter: Randomize delays between 0 and the computed backoff
+            retry_statuses: HTTP status codes worth retrying
+            respect_retry_after: Honor the Retry-After response header
+            max_retry_after: Upper bound applied to Retry-After values
+            connect_timeout: Seconds to wait for a connection
+            read_timeout: Seconds to wait for a response (rendering can be slow)
+        """
+        self.budgets: Dict[str, int] = {
+            "connect": max(int(connect_retries), 0),
+            "read": max(int(read_retries), 0),
+            "status": max(int(status_retries), 0),
+        }
+        self.backoff_base = max(backoff_base, 0.0)
+        self.backoff_max = max(backoff_max, 0.0)
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+
+    @property
+    def timeout(self):
+        """``(connect, read)`` timeout tuple for the HTTP client."""
+        return (self.connect_timeout, self.read_timeout)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Compute the delay before a retry.
+
+        Args:
+            attempt: Number of retries already made for this request (0-based)
+
+        Returns:
+            Delay in seconds
+        """
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def parse_retry_after(self, headers: Optional[Mapping[str, str]]) -> Optional[float]:
+        """
+        Read a Retry-After header expressed in seconds or as an HTTP date.
+
+        Args:
+            headers: Response headers
+
+        Returns:
+            Delay in seconds, or None when absent or unparseable
+        """
+        if not headers or not self.respect_retry_after:
+            return None
+
+        value = headers.get("Retry-After")
+        if not value:
+            return None
+
+        value = value.strip()
+        try:
+            delay = float(value)
+        except ValueError:
+            try:
+                delay = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError, IndexError, OverflowError):
+                return None
+
+        return min(max(delay, 0.0), self.max_retry_after)
+
+    def next_delay(
+        self,
+        kind: str,
+        attempts: Dict[str, int],
+        retry_after: Optional[float] = None,
+    ) -> Optional[float]:
+        """
+        Decide whether to retry and how long to wait.
+
+        Args:
+            kind: Failure kind ("connect", "read" or "status")
+            attempts: Retries already made per kind; updated in place
+            retry_after: Server-provided delay, if any
+
+        Returns:
+            Delay in seconds, or None when the retry budget is exhausted
+        """
+        used = attempts.get(kind, 0)
+        if used >= self.budgets.get(kind, 0):
+            return None
+
+        attempts[kind] = used + 1
+        delay = self.backoff(sum(attempts.values()) - 1)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+
+class CircuitBreaker:
+    """
+    Rolling error-rate circuit breaker shared by every caller of a session.
+
+    When the failure ratio over the last ``window`` requests reaches
+    ``failure_threshold`` the breaker opens and all callers pause for
+    ``cooldown`` seconds. Afterwards a single probe request is let through:
+    success closes the breaker, failure re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: float = 0.5,
+        window: int = 20,
+        min_requests: int = 10,
+        cooldown: float = 30.0,
+    ):
+        """
+        Initialize the breaker.
+
+        Args:
+            failure_threshold: Failure ratio (0-1) that opens the breaker
+            window: Number of recent outcomes considered
+            min_requests: Minimum outcomes in the window before the breaker can open
+            cooldown: Seconds callers pause once the breaker opens
+        """
+        self.failure_threshold = failure_threshold
+        self.min_requests = max(int(min_requests), 1)
+        self.cooldown = max(cooldown, 0.0)
+        self._outcomes = deque(maxlen=max(int(window), 1))
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        """Current breaker state (closed, open or half_open)."""
+        with self._lock:
+            return self._state
+
+    def before_request(self) -> float:
+        """
+        Check whether a request may proceed.
+
+        Returns:
+            0.0 when the caller may send its request, otherwise the number of
+            seconds to wait before asking again
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return 0.0
+
+            now = time.monotonic()
+            if self._state == self.OPEN:
+                remaining = self._opened_at + self.cooldown - now
+                if remaining > 0:
+                    return remaining
+                self._state = self.HALF_OPEN
+                self._probe_in_flight = False
+
+            if not self._probe_in_flight:
+                self._probe_in_flight = True
+                return 0.0
+
+            return min(1.0, self.cooldown) or 0.1
+
+    def release_probe(self) -> None:
+        """
+        Give back a half-open probe whose request ended without an outcome.
+
+        Called when a request that passed ``before_request`` is cancelled,
+        interrupted or fails with an error that says nothing about the
+        upstream, so the next caller becomes the probe instead of every
+        caller waiting for an outcome that never comes. Harmless for
+        requests that were not the probe; at worst a second probe is sent.
+        """
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._probe_in_flight = False
+
+    def record_success(self) -> None:
+        """Record a successful request."""
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._state = self.CLOSED
+                self._outcomes.clear()
+                self._probe_in_flight = False
+            self._outcomes.append(True)
+
+    def record_failure(self) -> None:
+        """Record a failed request (connection error, timeout, 429 or 5xx)."""
+        with self._lock:
+            now = time.monotonic()
+            if self._state == self.HALF_OPEN:
+                self._trip(now)
+                return
+
+            self._outcomes.append(False)
+            if self._state == self.CLOSED and len(self._outcomes) >= self.min_requests:
+                failures = sum(1 for ok in self._outcomes if not ok)
+                if failures / len(self._outcomes) >= self.failure_threshold:
+                    self._trip(now)
+
+    def _trip(self, now: float) -> None:
+        self._state = self.OPEN
+        self._opened_at = now
+        self._probe_in_flight = False
+        print(
+            f"Scraper API error rate too high; pausing requests for {self.cooldown:.1f}s"
+        )
@@ -1,24 +1,71 @@
 """
 Decodo Web Scraping API session manager.
 """
+import hashlib
+import json
 import os
 import time
-from typing import Optional, Dict, Any
+from abc import ABCMeta, abstractmethod
+from typing import Optional, Dict, Any, Union, Callable, List, Tuple, Type
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util import make_headers
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+from .adaptive import AdaptiveConcurrencyController
+from .cache import ResponseCache, payload_key
+from .cassette import Cassette, CassetteMissError
+from .rate_limiter import TokenBucketRateLimiter
+from .retry import CircuitBreaker, RetryPolicy
+from .singleflight import SingleFlight, shared_single_flight
+from .stats import SessionStats
 
 
 class DecodoUnauthorizedError(Exception):
     """Raised when the Decodo API rejects supplied credentials."""
 
 
-class ScraperAPISession:
+# Advertise every content encoding urllib3 can decode (gzip/deflate, plus br
+# or zstd when the optional decoders are installed).
+ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
+
+
+def decode_json(raw: Union[bytes, str]) -> Any:
     """
-    Session manager for Decodo Web Scraping API.
+    Decode a JSON response body.
 
-    Much simpler than proxy-based scraping - just make API calls
-    and get structured data back!
+    Decodes straight from the raw bytes (skipping charset detection and the
+    intermediate text copy) and uses orjson when it is installed.
+
+    Args:
+        raw: Response body
+
+    Returns:
+        Decoded JSON value
     """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class BaseScraperAPISession(metaclass=ABCMeta):
+    """
+    Credential, rate-limit and payload handling shared by the sync and async
+    Decodo sessions.
+
+    Subclasses implement ``scrape()``; the target helpers below simply return
+    whatever ``scrape()`` returns, so on an async session they are awaitable.
+    """
+
+    # Errors a failed scrape call may raise once retries are exhausted
+    # (transport, HTTP status, invalid body, cassette miss). Credential
+    # errors are deliberately excluded so callers cannot swallow them.
+    request_errors: Tuple[Type[BaseException], ...] = ()
 
     def __init__(
         self,
@@ -26,6 +73,16 @@ class ScraperAPISession:
         password: Optional[str] = None,
         rps: float = 1.0,
         api_endpoint: str = "https://scraper-api.decodo.com/v2/scrape",
+        pool_size: int = 10,
+        burst: Optional[float] = None,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        coalesce: bool = True,
+        adaptive: Optional[AdaptiveConcurrencyController] = None,
+        cassette: Optional[Cassette] = None,
+        hooks: Optional[List[Callable[[Dict[str, Any]], None]]] = None,
     ):
         """
         Initialize Scraper API session.
@@ -33,13 +90,31 @@ class ScraperAPISession:
         Args:
             username: Decodo scraper API username (defaults to DECODO_USERNAME env var)
             password: Decodo scraper API password (defaults to DECODO_PASSWORD env var)
-            rps: Requests per second rate limit
+            rps: Requests per second rate limit (ignored when rate_limiter is given)
             api_endpoint: Scraper API endpoint
+            pool_size: Maximum number of pooled connections kept open to the API host
+            burst: Number of requests allowed back-to-back before rps applies
+            rate_limiter: Shared limiter instance; pass the same limiter to several
+                sessions to enforce one account-wide quota
+            cache: Optional response cache consulted before every request
+            retry_policy: Backoff/retry settings for failed requests
+            circuit_breaker: Breaker pausing callers when the upstream error rate
+                spikes; may be shared by several sessions
+            coalesce: Share one upstream call between identical concurrent requests
+                made with the same credentials
+            adaptive: Optional AIMD controller that tunes concurrency and the
+                rate limiter from observed latency, 429s and 5xx responses
+            cassette: Optional cassette to record responses to or replay them from;
+                credentials are not required when replaying
+            hooks: Callbacks receiving an event dict for every request, error,
+                retry, cache hit, coalesced call and replayed response
         """
         self.username = username or os.getenv("DECODO_USERNAME")
         self.password = password or os.getenv("DECODO_PASSWORD")
+        self.cassette = cassette
+        replaying = cassette is not None and cassette.replaying
 
-        if not self.username or not self.password:
+        if (not self.username or not self.password) and not replaying:
             raise ValueError(
                 "Decodo credentials required. Set DECODO_USERNAME and DECODO_PASSWORD env vars "
                 "or pass username and password parameters. "
@@ -48,48 +123,33 @@ class ScraperAPISession:
 
         self.rps = rps
         self.api_endpoint = api_endpoint
-        self.last_request_time = 0
-        self.auth = HTTPBasicAuth(self.username, self.password)
-
-    def _rate_limit(self):
-        """Enforce rate limiting based on rps setting."""
-        if self.rps > 0:
-            min_interval = 1.0 / self.rps
-            elapsed = time.time() - self.last_request_time
-            if elapsed < min_interval:
-                time.sleep(min_interval - elapsed)
-        self.last_request_time = time.time()
-
-    def scrape(
+        self.rate_limiter = rate_limiter or TokenBucketRateLimiter(rps, burst)
+        self.pool_size = max(int(pool_size), 1)
+        self.cache = cache
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.coalesce = coalesce
+        self.stats = SessionStats()
+        self.hooks: List[Callable[[Dict[str, Any]], None]] = list(hooks or [])
+        self.adaptive = adaptive
+        if adaptive is not None:
+            adaptive.bind(self.rate_limiter)
+        self._credential_id = hashlib.sha256(
+            f"{self.username}:{self.password}".encode("utf-8")
+        ).hexdigest()[:16]
+
+    def _build_payload(
         self,
         target: str,
-        query: Optional[str] = None,
-        geo: Optional[str] = None,
-        parse: Optional[bool] = None,
-        **kwargs
+        query: Optional[str],
+        geo: Optional[str],
+        parse: Optional[bool],
+        extra: Dict[str, Any],
     ) -> Dict[str, Any]:
-        """
-        Make a scraping request using Decodo Scraper API.
-
-        Args:
-            target: Target template (e.g., 'google_maps', 'google_search')
-            query: Search query
-            geo: Geographic location (city name, country, or coordinates)
-            parse: Return parsed JSON data (True) or raw HTML (False); omit parameter when None
-            **kwargs: Additional parameters for the target
-
-        Returns:
-            Dictionary with scraping results
-
-        Raises:
-            requests.exceptions.RequestException: If request fails
-        """
-        self._rate_limit()
-
-        # Build request payload
+        """Build the JSON request payload for a scrape call."""
         payload = {
             "target": target,
-            **kwargs
+            **extra
         }
 
         if query:
@@ -101,48 +161,99 @@ class ScraperAPISession:
         if parse is not None:
             payload["parse"] = parse
 
-        try:
-            response = requests.post(
-                self.api_endpoint,
-                json=payload,
-                auth=self.auth,
-                headers={"Content-Type": "application/json"},
-                timeout=(10, 60)  # Longer timeout for rendering
-            )
+        return payload
 
-            if response.status_code == 401:
-                detail = ""
-                try:
-                    detail_json = response.json()
-                    detail = (
-                        detail_json.get("message")
-                        or detail_json.get("error")
-                        or detail_json.get("detail")
-                        or ""
-                    )
-                except ValueError:
-                    detail = response.text.strip()
-
-                message = (
-                    "Decodo API rejected the supplied credentials (HTTP 401 Unauthorized). "
-                    "Please update your username and password."
-                )
-                if detail:
-                    truncated = detail if len(detail) <= 200 else f"{detail[:197]}..."
-                    message = f"{message} Details: {truncated}"
+    def _flight_key(self, payload: Dict[str, Any]) -> tuple:
+        """Key identifying identical requests made with the same credentials."""
+        return (self.api_endpoint, self._credential_id, payload_key(payload))
+
+    def add_hook(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        """
+        Register a callback for session events.
+
+        Args:
+            callback: Called with a dict holding ``event``, ``target``, ``status``,
+                ``nbytes``, ``latency`` (network seconds) and ``wait``
+                (rate-limiter seconds)
+        """
+        self.hooks.append(callback)
+
+    def _emit(
+        self,
+        event: str,
+        target: str,
+        status: Optional[int] = None,
+        nbytes: int = 0,
+        latency: Optional[float] = None,
+        wait: float = 0.0,
+    ) -> None:
+        """Record an event in the session stats and notify hooks."""
+        self.stats.record(event, target, status=status, nbytes=nbytes, latency=latency, wait=wait)
+        if not self.hooks:
+            return
+
+        info = {
+            "event": event,
+            "target": target,
+            "status": status,
+            "nbytes": nbytes,
+            "latency": latency,
+            "wait": wait,
+        }
+        for hook in self.hooks:
+            try:
+                hook(info)
+            except Exception:
+                # Instrumentation must never interrupt scraping
+                pass
+
+    def _release_slot(self, outcome: str, latency: Optional[float] = None) -> None:
+        """Report a request outcome to the adaptive controller, if any."""
+        if self.adaptive is not None:
+            self.adaptive.release(outcome, latency)
+
+    def _congestion_outcome(self, kind: Optional[str], status: Optional[int]) -> str:
+        """Map a failed request to an adaptive controller outcome."""
+        if kind is None:
+            return AdaptiveConcurrencyController.NEUTRAL
+        if status == 429:
+            return AdaptiveConcurrencyController.THROTTLED
+        return AdaptiveConcurrencyController.ERROR
+
+    def _unauthorized_error(self, detail: str) -> DecodoUnauthorizedError:
+        """Build the error raised when Decodo answers HTTP 401."""
+        message = (
+            "Decodo API rejected the supplied credentials (HTTP 401 Unauthorized). "
+            "Please update your username and password."
+        )
+        if detail:
+            truncated = detail if len(detail) <= 200 else f"{detail[:197]}..."
+            message = f"{message} Details: {truncated}"
+
+        return DecodoUnauthorizedError(message)
 
-                raise DecodoUnauthorizedError(message)
+    def error_status(self, error: BaseException) -> Optional[int]:
+        """
+        HTTP status carried by a failed scrape call.
+
+        Args:
+            error: One of ``request_errors``
 
-            response.raise_for_status()
-            return response.json()
+        Returns:
+            Status code Decodo answered with, or None when no response arrived
+        """
+        return None
 
-        except DecodoUnauthorizedError:
-            raise
-        except requests.exceptions.RequestException as e:
-            print(f"Scraper API request failed: {e}")
-            if hasattr(e.response, 'text'):
-                print(f"Response: {e.response.text[:200]}")
-            raise
+    @abstractmethod
+    def scrape(
+        self,
+        target: str,
+        query: Optional[str] = None,
+        geo: Optional[str] = None,
+        parse: Optional[bool] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Make a scraping request; implemented by concrete sessions."""
 
     def google_maps_search(
         self,
@@ -266,3 +377,301 @@ class ScraperAPISession:
             headless=headless,
             parse=parse
         )
+
+
+class ScraperAPISession(BaseScraperAPISession):
+    """
+    Session manager for Decodo Web Scraping API.
+
+    Much simpler than proxy-based scraping - just make API calls
+    and get structured data back!
+
+    A single pooled keep-alive HTTP client is reused across every call, so
+    repeated searches and enrichment requests skip the TCP/TLS handshake.
+    Call ``close()`` (or use the session as a context manager) when done.
+    """
+
+    request_errors = (requests.exceptions.RequestException, CassetteMissError)
+
+    def __init__(
+        self,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        rps: float = 1.0,
+        api_endpoint: str = "https://scraper-api.decodo.com/v2/scrape",
+        pool_size: int = 10,
+        keep_alive: bool = True,
+        burst: Optional[float] = None,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        coalesce: bool = True,
+        single_flight: Optional[SingleFlight] = None,
+        adaptive: Optional[AdaptiveConcurrencyController] = None,
+        cassette: Optional[Cassette] = None,
+        hooks: Optional[List[Callable[[Dict[str, Any]], None]]] = None,
+    ):
+        """
+        Initialize Scraper API session.
+
+        Args:
+            username: Decodo scraper API username (defaults to DECODO_USERNAME env var)
+            password: Decodo scraper API password (defaults to DECODO_PASSWORD env var)
+            rps: Requests per second rate limit (ignored when rate_limiter is given)
+            api_endpoint: Scraper API endpoint
+            pool_size: Maximum number of pooled connections kept open to the API host
+            keep_alive: Reuse connections between requests (disable to force a new
+                connection per request)
+            burst: Number of requests allowed back-to-back before rps applies
+            rate_limiter: Shared limiter instance; pass the same limiter to several
+                sessions to enforce one account-wide quota
+            cache: Optional response cache consulted before every request
+            retry_policy: Backoff/retry settings for failed requests
+            circuit_breaker: Breaker pausing callers when the upstream error rate
+                spikes; may be shared by several sessions
+            coalesce: Share one upstream call between identical concurrent requests
+                made with the same credentials
+            single_flight: Coalescing registry (defaults to a process-wide one so
+                separate sessions with the same credentials also coalesce)
+            adaptive: Optional AIMD controller that tunes concurrency and the
+                rate limiter from observed latency, 429s and 5xx responses
+            cassette: Optional cassette to record responses to or replay them from;
+                credentials are not required when replaying
+            hooks: Callbacks receiving an event dict for every request, error,
+                retry, cache hit, coalesced call and replayed response
+        """
+        super().__init__(
+            username=username,
+            password=password,
+            rps=rps,
+            api_endpoint=api_endpoint,
+            pool_size=pool_size,
+            burst=burst,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            coalesce=coalesce,
+            adaptive=adaptive,
+            cassette=cassette,
+            hooks=hooks,
+        )
+        self.single_flight = single_flight or shared_single_flight
+        self.auth = HTTPBasicAuth(self.username or "", self.password or "")
+        self.keep_alive = keep_alive
+        self.http = self._build_http_client()
+
+    def _build_http_client(self) -> requests.Session:
+        """Create the pooled HTTP client shared by every scrape call."""
+        http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            pool_block=False,
+        )
+        http.mount("https://", adapter)
+        http.mount("http://", adapter)
+        http.auth = self.auth
+        http.headers.update({
+            "Content-Type": "application/json",
+            "Accept-Encoding": ACCEPT_ENCODING,
+            "Connection": "keep-alive" if self.keep_alive else "close",
+        })
+        return http
+
+    def close(self) -> None:
+        """Close pooled connections held by the session."""
+        self.http.close()
+
+    def __enter__(self) -> "ScraperAPISession":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _rate_limit(self) -> float:
+        """Wait for the rate limiter; returns the seconds spent waiting."""
+        return self.rate_limiter.acquire()
+
+    def error_status(self, error: BaseException) -> Optional[int]:
+        response = getattr(error, "response", None)
+        return response.status_code if response is not None else None
+
+    def scrape(
+        self,
+        target: str,
+        query: Optional[str] = None,
+        geo: Optional[str] = None,
+        parse: Optional[bool] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Make a scraping request using Decodo Scraper API.
+
+        Args:
+            target: Target template (e.g., 'google_maps', 'google_search')
+            query: Search query
+            geo: Geographic location (city name, country, or coordinates)
+            parse: Return parsed JSON data (True) or raw HTML (False); omit parameter when None
+            **kwargs: Additional parameters for the target
+
+        Returns:
+            Dictionary with scraping results
+
+        Raises:
+            requests.exceptions.RequestException: If request fails after all retries
+        """
+        payload = self._build_payload(target, query, geo, parse, kwargs)
+
+        if self.cassette is not None and self.cassette.replaying:
+            self._emit("replayed", target)
+            return self.cassette.play(payload)
+
+        data = None
+        if self.cache is not None:
+            data = self.cache.get(payload, self._credential_id)
+            if data is not None:
+                self._emit("cache_hit", target)
+
+        if data is None:
+            if self.coalesce:
+                data, shared = self.single_flight.do(
+                    self._flight_key(payload),
+                    lambda: self._send(payload),
+                )
+                if shared:
+                    self._emit("coalesced", target)
+            else:
+                data = self._send(payload)
+
+        if self.cassette is not None:
+            self.cassette.record(payload, data)
+        return data
+
+    def _send(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a payload upstream, retrying transient failures."""
+        target = payload.get("target", "")
+        attempts: Dict[str, int] = {}
+        while True:
+            self._wait_for_circuit()
+            if self.adaptive is not None:
+                try:
+                    self.adaptive.acquire()
+                except BaseException:
+                    self.circuit_breaker.release_probe()
+                    raise
+            try:
+                wait = self._rate_limit()
+            except BaseException:
+                # Interrupted while paced: give the slot (and a half-open probe) back before leaving.
+                self._release_slot(AdaptiveConcurrencyController.NEUTRAL)
+                self.circuit_breaker.release_probe()
+                raise
+
+            error = None
+            started = time.monotonic()
+            try:
+                data, status, nbytes = self._attempt(payload)
+            except requests.exceptions.RequestException as e:
+                error = e
+            except BaseException as e:
+                self._release_slot(AdaptiveConcurrencyController.NEUTRAL)
+                self.circuit_breaker.release_probe()
+                self._emit(
+                    "error",
+                    target,
+                    status=401 if isinstance(e, DecodoUnauthorizedError) else None,
+                    latency=time.monotonic() - started,
+                    wait=wait,
+                )
+                raise
+            latency = time.monotonic() - started
+
+            if error is None:
+                self._emit("request", target, status=status, nbytes=nbytes, latency=latency, wait=wait)
+                self._release_slot(AdaptiveConcurrencyController.OK, latency)
+                self.circuit_breaker.record_success()
+                if self.cache is not None:
+                    self.cache.set(payload, data, self._credential_id)
+                return data
+
+            kind = self._failure_kind(error)
+            status = error.response.status_code if error.response is not None else None
+            nbytes = len(error.response.content or b"") if error.response is not None else 0
+            self._emit("error", target, status=status, nbytes=nbytes, latency=latency, wait=wait)
+            self._release_slot(self._congestion_outcome(kind, status), latency)
+
+            delay = None
+            if kind is None:
+                self.circuit_breaker.record_success()
+            else:
+                self.circuit_breaker.record_failure()
+                retry_after = self.retry_policy.parse_retry_after(
+                    error.response.headers if error.response is not None else None
+                )
+                delay = self.retry_policy.next_delay(kind, attempts, retry_after)
+
+            if delay is None:
+                print(f"Scraper API request failed: {error}")
+                if hasattr(error.response, 'text'):
+                    print(f"Response: {error.response.text[:200]}")
+                raise error
+
+            self._emit("retry", target, status=status)
+            print(f"Scraper API request failed ({error}); retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+    def _attempt(self, payload: Dict[str, Any]) -> Tuple[Dict[str, Any], int, int]:
+        """Perform a single HTTP exchange; returns the body, status code and body size."""
+        response = self.http.post(
+            self.api_endpoint,
+            json=payload,
+            timeout=self.retry_policy.timeout,
+        )
+
+        if response.status_code == 401:
+            self.circuit_breaker.record_success()
+            detail = ""
+            try:
+                detail_json = response.json()
+                detail = (
+                    detail_json.get("message")
+                    or detail_json.get("error")
+                    or detail_json.get("detail")
+                    or ""
+                )
+            except ValueError:
+                detail = response.text.strip()
+
+            raise self._unauthorized_error(detail)
+
+        response.raise_for_status()
+        try:
+            return decode_json(response.content), response.status_code, len(response.content)
+        except ValueError as e:
+            raise requests.exceptions.InvalidJSONError(
+                f"Invalid JSON in Decodo response: {e}", response=response
+            )
+
+    def _wait_for_circuit(self) -> None:
+        """Block while the circuit breaker is open."""
+        while True:
+            delay = self.circuit_breaker.before_request()
+            if delay <= 0:
+                return
+            time.sleep(delay)
+
+    def _failure_kind(self, error: requests.exceptions.RequestException) -> Optional[str]:
+        """Classify a request failure for the retry policy (None = not retryable)."""
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return "connect"
+        if isinstance(error, requests.exceptions.ReadTimeout):
+            return "read"
+        if isinstance(error, requests.exceptions.ConnectionError):
+            return "connect"
+        if isinstance(error, requests.exceptions.HTTPError):
+            status = error.response.status_code if error.response is not None else None
+            if status in self.retry_policy.retry_statuses:
+                return "status"
+        return None
@@ -0,0 +1,152 @@
+"""
+Single-flight coalescing of identical in-flight Decodo requests.
+"""
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class _Call:
+    """A request in flight and the callers waiting on it."""
+
+    __slots__ = ("done", "result", "error", "abandoned")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.abandoned = False
+
+
+class _AsyncCall:
+    """A coroutine in flight, run as its own task, and its waiter count."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Task"):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Share one execution between threads asking for the same key at once.
+
+    The first caller for a key runs the function; callers arriving while it
+    is still running block and receive the same result (or exception).
+    Once the call finishes the key is forgotten, so later calls run again.
+    If the leader is interrupted (KeyboardInterrupt, SystemExit) the
+    interruption is not handed to the waiters; they retry the call instead.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run ``fn`` once per key among concurrent callers.
+
+        Args:
+            key: Identity of the call
+            fn: Zero-argument function producing the result
+
+        Returns:
+            Tuple of (result, shared) where shared is True when the result
+            came from another caller's execution
+        """
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                if call is None:
+                    call = _Call()
+                    self._calls[key] = call
+                    break
+
+            call.done.wait()
+            if call.abandoned:
+                continue
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except Exception as exc:
+            call.error = exc
+            raise
+        except BaseException:
+            call.abandoned = True
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+        return call.result, False
+
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running."""
+        with self._lock:
+            return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """
+    asyncio counterpart of ``SingleFlight``.
+
+    The call runs as its own task and every caller, the first one included,
+    awaits it through ``asyncio.shield``, so cancelling one caller never
+    cancels the call or hands ``CancelledError`` to the others. The task is
+    cancelled only when every caller waiting on it has been cancelled. Keys
+    are scoped to the running event loop.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _AsyncCall] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Await ``fn()`` once per key among concurrent callers.
+
+        Args:
+            key: Identity of the call
+            fn: Zero-argument coroutine function producing the result
+
+        Returns:
+            Tuple of (result, shared)
+        """
+        loop = asyncio.get_running_loop()
+        scoped_key = (id(loop), key)
+
+        call = self._calls.get(scoped_key)
+        shared = call is not None
+        if call is None:
+            call = _AsyncCall(loop.create_task(fn()))
+            self._calls[scoped_key] = call
+            call.task.add_done_callback(lambda _task: self._forget(scoped_key, call))
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task), shared
+        except asyncio.CancelledError:
+            if call.waiters == 1:
+                # Nobody else is waiting for the result.
+                call.task.cancel()
+            raise
+        finally:
+            call.waiters -= 1
+
+    def _forget(self, key: Hashable, call: _AsyncCall) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running."""
+        return len(self._calls)
+
+
+# Process-wide instances so separate sessions (e.g. one per web search) that
+# share credentials also share in-flight requests.
+shared_single_flight = SingleFlight()
+shared_async_single_flight = AsyncSingleFlight()
@@ -0,0 +1,189 @@
+"""
+Per-target request statistics for Decodo API sessions.
+"""
+import bisect
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is open-ended.
+LATENCY_BUCKETS: Tuple[float, ...] = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram."""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add one observation in seconds."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Estimate a percentile from the bucket upper bounds.
+
+        Args:
+            q: Percentile between 0 and 100
+
+        Returns:
+            Upper bound of the bucket containing the percentile, or None when empty
+        """
+        if not self.count:
+            return None
+
+        rank = q / 100.0 * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                return self.buckets[index] if index < len(self.buckets) else self.max
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        labels = [f"<={bound:g}s" for bound in self.buckets] + [f">{self.buckets[-1]:g}s"]
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else None,
+            "max": self.max if self.count else None,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class TargetStats:
+    """Counters for a single Decodo target (google_maps, google, ...)."""
+
+    def __init__(self):
+        self.requests = 0
+        self.cache_hits = 0
+        self.coalesced = 0
+        self.replayed = 0
+        self.retries = 0
+        self.errors = 0
+        self.bytes = 0
+        self.status_codes: Counter = Counter()
+        self.rate_limit_wait = 0.0
+        self.network_time = 0.0
+        self.latency = LatencyHistogram()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "cache_hits": self.cache_hits,
+            "coalesced": self.coalesced,
+            "replayed": self.replayed,
+            "retries": self.retries,
+            "errors": self.errors,
+            "bytes": self.bytes,
+            "status_codes": dict(self.status_codes),
+            "rate_limit_wait": self.rate_limit_wait,
+            "network_time": self.network_time,
+            "latency": self.latency.to_dict(),
+        }
+
+
+class SessionStats:
+    """
+    Thread-safe per-target statistics collected by a scraper session.
+
+    Sessions call ``record()`` for every event; read the numbers with
+    ``snapshot()`` or print them with ``summary_lines()``.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._targets: Dict[str, TargetStats] = {}
+
+    def record(
+        self,
+        event: str,
+        target: str,
+        status: Optional[int] = None,
+        nbytes: int = 0,
+        latency: Optional[float] = None,
+        wait: float = 0.0,
+    ) -> None:
+        """
+        Record one session event.
+
+        Args:
+            event: "request", "error", "retry", "cache_hit", "coalesced" or "replayed"
+            target: Decodo target name
+            status: HTTP status code, when a response was received
+            nbytes: Response body size in bytes
+            latency: Network time in seconds
+            wait: Seconds spent waiting in the rate limiter before the request
+        """
+        with self._lock:
+            stats = self._targets.get(target)
+            if stats is None:
+                stats = self._targets[target] = TargetStats()
+
+            if event in ("request", "error"):
+                stats.requests += 1
+                stats.bytes += nbytes
+                stats.rate_limit_wait += wait
+                if status is not None:
+                    stats.status_codes[status] += 1
+                if latency is not None:
+                    stats.network_time += latency
+                    stats.latency.observe(latency)
+                if event == "error":
+                    stats.errors += 1
+            elif event == "retry":
+                stats.retries += 1
+            elif event == "cache_hit":
+                stats.cache_hits += 1
+            elif event == "coalesced":
+                stats.coalesced += 1
+            elif event == "replayed":
+                stats.replayed += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Copy the current counters.
+
+        Returns:
+            Mapping of target name to its counters
+        """
+        with self._lock:
+            return {target: stats.to_dict() for target, stats in self._targets.items()}
+
+    def reset(self) -> None:
+        """Clear every counter."""
+        with self._lock:
+            self._targets.clear()
+
+    def summary_lines(self) -> List[str]:
+        """Human-readable per-target summary for end-of-run reports."""
+        lines = []
+        for target, stats in sorted(self.snapshot().items()):
+            latency = stats["latency"]
+            statuses = ", ".join(
+                f"{code}×{count}" for code, count in sorted(stats["status_codes"].items())
+            ) or "-"
+            lines.append(
+                f"{target}: {stats['requests']} requests, {stats['cache_hits']} cache hits, "
+                f"{stats['coalesced']} coalesced, {stats['retries']} retries, "
+                f"{stats['errors']} errors, {stats['bytes'] / 1024 / 1024:.2f} MB"
+            )
+            if stats["replayed"]:
+                lines.append(f"  replayed from cassette: {stats['replayed']}")
+            if latency["count"]:
+                lines.append(
+                    f"  network {stats['network_time']:.1f}s (mean {latency['mean']:.2f}s, "
+                    f"p50 ≤{latency['p50']:.2f}s, p95 ≤{latency['p95']:.2f}s), "
+                    f"rate-limit wait {stats['rate_limit_wait']:.1f}s, statuses {statuses}"
+                )
+        return lines
@@ -1,13 +1,24 @@
 """Google Maps provider using Decodo Scraper API."""
-from datetime import datetime
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
+import time
 import json
 import re
 from html import unescape
-from typing import Dict, Any, List, Optional, Set, Callable
+from typing import Dict, Any, AsyncIterator, Iterable, Iterator, List, Optional, Set, Callable, Tuple
 
 from bs4 import BeautifulSoup
+from lxml import etree
 
-from ..core.scraper_api_session import ScraperAPISession, DecodoUnauthorizedError
+from ..core.budget import RequestBudget
+from ..core.business import Business
+from ..core.checkpoint import SearchCheckpoint, decode_listing_keys, encode_listing_keys
+from ..core.geo import Tile, hex_tiles, subdivide
+from ..core.pagination import STOP_BUDGET, STOP_LIMIT, STOP_PAGE_CAP, PaginationPolicy, PaginationRun
+from ..core.place_cache import PlaceDetailsCache
+from ..core.scraper_api_session import BaseScraperAPISession, DecodoUnauthorizedError
 
 COUNTRY_SETTINGS = {
     "US": {"name": "United States", "locale": "en-US", "domain": "com"},
@@ -19,6 +30,275 @@ COUNTRY_SETTINGS = {
     "IE": {"name": "Ireland", "locale": "en-IE", "domain": "ie"},
 }
 
+# Listings Google returns per results page, used to plan request budgets.
+RESULTS_PER_PAGE = 20
+
+PARSER_BACKENDS = ("lxml", "bs4")
+
+_LISTING_XPATH = etree.XPath(
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' VkpGBb ')]"
+)
+_DETAILS_XPATH = etree.XPath(
+    ".//div[contains(concat(' ', normalize-space(@class), ' '), ' rllt__details ')]"
+)
+_CID_LINK_XPATH = etree.XPath(".//a[@data-cid]")
+# BeautifulSoup's get_text() ignores these; drop them so both parsers see the same text.
+_NON_TEXT_TAGS = ("script", "style", "template")
+
+_RATING_RE = re.compile(r"([0-9]+(?:[\.,][0-9]+)?)")
+_REVIEWS_RE = re.compile(r"\(([^)]+)\)")
+_NON_DIGIT_RE = re.compile(r"\D")
+_STATUS_TOKENS = (
+    "open",
+    "closed",
+    "closes",
+    "opens",
+    "hours",
+    "aberto",
+    "fechado",
+)
+_DISTANCE_UNITS = ("km", "m", "mi", "ft")
+
+_STATE_START = "APP_INITIALIZATION_STATE="
+_STATE_END = ";window.APP_FLAGS"
+_XSSI_PREFIX = ")]}'"
+# Fallback phone/email links. Anchors are located with str.find and the
+# patterns only matched in place; "tel:" is case-sensitive, "mailto:" is not.
+_TEL_RE = re.compile(r"\+?[0-9][0-9\s().-]{6,}")
+_EMAIL_RE = re.compile(r"[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}", re.IGNORECASE)
+_MAILTO_RE = re.compile(r"mailto:", re.IGNORECASE)
+# 4xx answers that reflect the account or the moment rather than the place;
+# lookups failing with these are not negatively cached.
+_TRANSIENT_LOOKUP_STATUSES = frozenset({401, 403, 407, 408, 429})
+_JSON_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+_JSON_DECODER = json.JSONDecoder()
+_MISSING = object()
+
+
+def _decode_json_path(text: str, index: int, path: Tuple[int, ...]) -> Any:
+    """
+    Decode one element of a nested JSON array without decoding the rest.
+
+    Elements before the target are skipped with ``raw_decode`` and nothing
+    after it is read, so trailing data does not need to be valid JSON.
+
+    Args:
+        text: String containing the JSON document
+        index: Offset where the outer array starts
+        path: Array indexes to follow, e.g. ``(3, 6)`` for ``doc[3][6]``
+
+    Returns:
+        The decoded element, or ``_MISSING`` when a level is not an array or
+        is too short
+    """
+    for position in path:
+        index = _JSON_WHITESPACE_RE.match(text, index).end()
+        if not text.startswith("[", index):
+            return _MISSING
+        index += 1
+        for _ in range(position):
+            index = _JSON_WHITESPACE_RE.match(text, index).end()
+            if text.startswith("]", index):
+                return _MISSING
+            _, index = _JSON_DECODER.raw_decode(text, index)
+            index = _JSON_WHITESPACE_RE.match(text, index).end()
+            if not text.startswith(",", index):
+                return _MISSING
+            index += 1
+        index = _JSON_WHITESPACE_RE.match(text, index).end()
+        if text.startswith("]", index):
+            return _MISSING
+
+    value, _ = _JSON_DECODER.raw_decode(text, index)
+    return value
+
+
+def _find_link(html: str, haystack: str, anchor: str, pattern) -> Optional[str]:
+    """First ``pattern`` match right after ``anchor``, searching ``haystack`` for the anchor."""
+    index = haystack.find(anchor)
+    while index != -1:
+        match = pattern.match(html, index + len(anchor))
+        if match:
+            return match.group(0)
+        index = haystack.find(anchor, index + 1)
+    return None
+
+
+def _find_email(html: str) -> Optional[str]:
+    """Address of the first mailto: link (scheme matched case-insensitively)."""
+    lowered = html.lower()
+    if len(lowered) == len(html):
+        return _find_link(html, lowered, "mailto:", _EMAIL_RE)
+
+    # A few non-ASCII characters change length when lowercased; offsets
+    # would no longer line up, so scan with the regex instead.
+    for match in _MAILTO_RE.finditer(html):
+        email = _EMAIL_RE.match(html, match.end())
+        if email:
+            return email.group(0)
+    return None
+
+
+def _find_state(html: str) -> int:
+    """Offset of the APP_INITIALIZATION_STATE value, or -1 when absent."""
+    start = html.find(_STATE_START)
+    while start != -1:
+        value_start = start + len(_STATE_START)
+        end = html.find(_STATE_END, value_start)
+        if end == -1:
+            return -1
+        # Same boundary as the former "=(.*?);window.APP_FLAGS" regex: one line.
+        if html.find("\n", value_start, end) == -1:
+            return value_start
+        start = html.find(_STATE_START, start + 1)
+    return -1
+
+
+class _TiledRun:
+    """
+    State of one tiled search, shared by ``iter_search_tiled`` and its async variant.
+
+    ``leads`` holds the unique listings in the order tiles found them;
+    the first ``finished`` of them have been enriched (when enabled) and
+    yielded. The checkpoint cursor records the tile queue and that count.
+    """
+
+    def __init__(
+        self,
+        key: Callable[[Business], Any],
+        tiles: Iterable[Tile],
+        limit: int,
+        enrich: bool,
+        budget: RequestBudget,
+        checkpoint: Optional[SearchCheckpoint] = None,
+    ):
+        self.key = key
+        self.limit = limit
+        self.enrich = enrich
+        self.budget = budget
+        self.checkpoint = checkpoint
+        self.leads: List[Business] = []
+        # Keys of ``leads``
+        self.keys: Set[Any] = set()
+        self.finished = 0
+        self.pending = deque(tiles)
+        # Future or task -> tile being searched
+        self.running: Dict[Any, Tile] = {}
+        self.failed: List[Tile] = []
+        self.tiles_searched = 0
+        self.subdivided = 0
+        # Unique listings found so far by any tile, including tiles still running.
+        self.found: Set[Any] = set()
+        self.found_lock = threading.Lock()
+
+    @property
+    def searching(self) -> bool:
+        """True while tiles are left and the limit is not reached."""
+        return bool(self.pending or self.running) and len(self.leads) < self.limit
+
+    def resume(self) -> List[Business]:
+        """
+        Load the checkpoint's leads and tile queue.
+
+        Returns:
+            Saved leads that were found but not yet finished
+        """
+        checkpoint = self.checkpoint
+        cursor = checkpoint.cursor if checkpoint is not None else None
+        if cursor is None:
+            return []
+
+        self.budget.charge(checkpoint.spent)
+        for business in checkpoint.leads:
+            key = self.key(business)
+            if key not in self.keys:
+                self.keys.add(key)
+                self.leads.append(business)
+        self.found.update(self.keys)
+        self.tiles_searched = cursor["tiles_searched"]
+        self.subdivided = cursor["subdivided"]
+        self.pending = deque(Tile(*tile) for tile in cursor["pending"])
+        self.finished = cursor["enriched"]
+        print(
+            f"Google Maps: Resuming with {len(self.leads)} saved listings, "
+            f"{len(self.pending)} tiles left, {self.finished} enriched"
+        )
+        return self.leads[self.finished:]
+
+    def state(self) -> Dict[str, Any]:
+        """Checkpoint cursor for the current state."""
+        # Running and failed tiles go back on the queue: their listings are not saved.
+        return {
+            "pending": [list(tile) for tile in [*self.running.values(), *self.pending, *self.failed]],
+            "tiles_searched": self.tiles_searched,
+            "subdivided": self.subdivided,
+            "enriched": self.finished,
+        }
+
+    def claim(self, listings: List[Business]) -> int:
+        """Register listings found by a tile; returns the unique listings found so far."""
+        with self.found_lock:
+            self.found.update(self.key(business) for business in listings)
+            return len(self.found)
+
+    def reserved(self) -> int:
+        """Place-details calls the found but unfinished leads (plus one more) will need."""
+        if not self.enrich:
+            return 0
+        with self.found_lock:
+            return max(min(len(self.found), self.limit) - self.finished, 0) + 1
+
+    def merge(self, tile: Tile, listings: List[Business], saturated: bool, max_depth: int) -> List[Business]:
+        """
+        Merge a finished tile's listings and queue its subtiles when it was saturated.
+
+        Returns:
+            Listings not found by earlier tiles, up to the limit
+        """
+        self.tiles_searched += 1
+        added = []
+        for business in listings:
+            if len(self.leads) >= self.limit:
+                break
+            key = self.key(business)
+            if key not in self.keys:
+                self.keys.add(key)
+                self.leads.append(business)
+                added.append(business)
+
+        if saturated and tile.depth < max_depth:
+            self.pending.extend(subdivide(tile))
+            self.subdivided += 1
+        if self.checkpoint is not None:
+            self.checkpoint.append(added, cursor=self.state(), spent=self.budget.spent)
+        return added
+
+    def finish(self, business: Business) -> None:
+        """Count a lead as yielded, saving its contact details."""
+        self.finished += 1
+        if self.checkpoint is not None and self.enrich:
+            # Leads are finished in order, so a count is enough to resume.
+            self.checkpoint.replace(
+                self.finished - 1, business, cursor=self.state(), spent=self.budget.spent
+            )
+
+    def report(self) -> None:
+        """Print the outcome and complete the checkpoint when nothing is left to do."""
+        print(
+            f"Google Maps: {self.tiles_searched} tiles searched ({self.subdivided} subdivided), "
+            f"{len(self.leads)} unique listings"
+        )
+        print(f"Google Maps: Found {len(self.leads)} businesses")
+        if self.budget.limited:
+            print(f"Google Maps: Used {self.budget.spent} of {self.budget.max_requests} budgeted requests")
+        if self.checkpoint is None:
+            return
+        # Only failed tiles are searched again; with any, the search stays open.
+        self.pending.clear()
+        self.checkpoint.save_cursor(self.state(), spent=self.budget.spent)
+        if not self.failed and self.finished >= len(self.leads):
+            self.checkpoint.complete()
+
 
 class GoogleMapsProvider:
     """
@@ -27,14 +307,40 @@ class GoogleMapsProvider:
     This is much simpler than manual scraping - Decodo handles everything!
     """
 
-    def __init__(self, session: ScraperAPISession):
+    def __init__(
+        self,
+        session: BaseScraperAPISession,
+        parser_backend: str = "lxml",
+        place_cache: Optional[PlaceDetailsCache] = None,
+        pagination_policy: Optional[PaginationPolicy] = None,
+        parse_executor: Optional[Executor] = None,
+    ):
         """
         Initialize Google Maps provider.
 
         Args:
-            session: ScraperAPISession instance
+            session: ScraperAPISession instance (or AsyncScraperAPISession for search_async)
+            parser_backend: "lxml" for the XPath listing parser (falls back to
+                BeautifulSoup on markup it cannot handle) or "bs4"
+            place_cache: Optional persistent CID -> contact details cache
+                consulted before every place-details request
+            pagination_policy: Decides when further results pages stop
+                paying off (defaults to ``PaginationPolicy()``)
+            parse_executor: Optional executor (normally a process pool from
+                ``create_parse_executor``) that parses results and place
+                pages off the calling interpreter's GIL
         """
+        if parser_backend not in PARSER_BACKENDS:
+            raise ValueError(
+                f"Unknown parser backend: {parser_backend!r} (use {' or '.join(PARSER_BACKENDS)})"
+            )
         self.session = session
+        self.parser_backend = parser_backend
+        self.place_cache = place_cache
+        self.pagination_policy = pagination_policy or PaginationPolicy()
+        self.parse_executor = parse_executor
+        # Why the most recent search/search_async stopped requesting pages.
+        self.last_stop_reason: Optional[str] = None
 
     def search(
         self,
@@ -46,11 +352,83 @@ class GoogleMapsProvider:
         latitude: Optional[float] = None,
         longitude: Optional[float] = None,
         radius_km: Optional[float] = None,
-        progress_callback: Optional[Callable[[int, int], None]] = None,
-    ) -> List[Dict[str, Any]]:
+        progress_callback: Optional[Callable[..., None]] = None,
+        max_requests: Optional[int] = None,
+        enrich_concurrency: int = 4,
+        enrich_progress_callback: Optional[Callable[[int, int], None]] = None,
+        prefetch: bool = True,
+        checkpoint: Optional[SearchCheckpoint] = None,
+    ) -> List[Business]:
         """
         Search for businesses on Google Maps.
 
+        Collects ``iter_search`` into a list; see it for the arguments.
+
+        Returns:
+            List of business records
+        """
+        return list(self.iter_search(
+            query,
+            city,
+            limit,
+            country=country,
+            enrich=enrich,
+            latitude=latitude,
+            longitude=longitude,
+            radius_km=radius_km,
+            progress_callback=progress_callback,
+            max_requests=max_requests,
+            enrich_concurrency=enrich_concurrency,
+            enrich_progress_callback=enrich_progress_callback,
+            prefetch=prefetch,
+            checkpoint=checkpoint,
+        ))
+
+    def iter_search(
+        self,
+        query: str,
+        city: str,
+        limit: int = 100,
+        country: str = None,
+        enrich: bool = True,
+        latitude: Optional[float] = None,
+        longitude: Optional[float] = None,
+        radius_km: Optional[float] = None,
+        progress_callback: Optional[Callable[..., None]] = None,
+        max_requests: Optional[int] = None,
+        enrich_concurrency: int = 4,
+        enrich_progress_callback: Optional[Callable[[int, int], None]] = None,
+        prefetch: bool = True,
+        checkpoint: Optional[SearchCheckpoint] = None,
+    ) -> Iterator[Business]:
+        """
+        Search for businesses on Google Maps, yielding each one when it is ready.
+
+        Businesses are yielded in results order as soon as they are parsed
+        (and, with ``enrich``, as soon as their place details arrive), so
+        callers can export or display leads while later pages are still
+        being fetched. Closing the generator early stops the search and
+        releases its worker threads.
+
+        With ``prefetch`` the next results page is requested as soon as the
+        current one is parsed, so it downloads while this page is enriched.
+        A page is only prefetched when the serial loop would have fetched it
+        too: the pagination policy wants another page and ``limit`` (and the
+        request budget) is not yet reached.
+
+        Paging stops early, before ``limit``, when the provider's
+        ``pagination_policy`` sees a repeated page, a page with nothing new
+        or a run of low-yield pages; the reason is printed and kept in
+        ``last_stop_reason``.
+
+        With a ``checkpoint`` every lead is saved as it is yielded, together
+        with a cursor (next page, listings seen, pagination state) at the
+        start of each page. Opening the same checkpoint again after a crash
+        first yields the saved leads, then continues from the interrupted
+        page without re-fetching or re-enriching anything already saved. A
+        search that ran out of request budget can be resumed with a larger
+        one; any other finished search only returns its saved leads.
+
         Args:
             query: Search keyword (e.g., "dentist", "pizza")
             city: City name
@@ -60,95 +438,1131 @@ class GoogleMapsProvider:
             latitude: Optional latitude for radius-based searches
             longitude: Optional longitude for radius-based searches
             radius_km: Optional radius in kilometers for radius-based searches
-
-        Returns:
-            List of business dictionaries
+            progress_callback: Called with (collected, limit), plus the remaining
+                request budget as a third argument when max_requests is set
+            max_requests: Optional cap on Decodo calls (search pages plus place details)
+            enrich_concurrency: Place-details lookups run in parallel (still paced
+                by the session rate limiter)
+            enrich_progress_callback: Called with (enriched, queued) as place-details
+                lookups finish
+            prefetch: Request the next results page while the current one is enriched
+            checkpoint: Optional checkpoint to save progress to and resume from
+
+        Yields:
+            Business records
         """
         if limit <= 0:
-            return []
+            return
 
-        businesses: List[Dict[str, Any]] = []
+        collected = 0
         seen_ids: Set[Any] = set()
         page = 1
+        carried = 0
         detail_cache: Dict[str, Dict[str, Optional[str]]] = {}
-        use_radius = latitude is not None and longitude is not None
+        budget = RequestBudget(max_requests)
+        enrich_counts = {"done": 0, "queued": 0}
+        run = self.pagination_policy.start()
+        self.last_stop_reason = None
+        complete = False
+        executor = None
+        if enrich and enrich_concurrency > 1:
+            executor = ThreadPoolExecutor(
+                max_workers=enrich_concurrency,
+                thread_name_prefix="leads-enrich",
+            )
+        pager = ThreadPoolExecutor(max_workers=1, thread_name_prefix="leads-page") if prefetch else None
+        next_page = None
+        ready: Iterable[Business] = ()
 
         try:
             # Make API call
             print(f"Google Maps: Searching for '{query}' in {city}...")
+            self._print_estimate(limit, enrich, max_requests)
+
+            search_query, geo, locale, domain = self._prepare_search(
+                query, city, country, latitude, longitude, radius_km
+            )
+
+            if checkpoint is not None:
+                page, carried = self._resume_search(checkpoint, seen_ids, run, budget)
+                for business in checkpoint.leads[:limit]:
+                    collected += 1
+                    yield business
+
+            while collected < limit and not (checkpoint is not None and checkpoint.completed):
+                if checkpoint is not None:
+                    self._save_cursor(checkpoint, page, seen_ids, collected, run, budget)
+                if next_page is not None:
+                    response = next_page.result()
+                    next_page = None
+                else:
+                    if not self._spend_page(budget, enrich):
+                        run.stop(STOP_BUDGET)
+                        break
+                    response = self._request_page(search_query, geo, limit, locale, domain, page)
 
-            geo = self._build_geo(city, country, latitude, longitude, radius_km)
-            locale = self._derive_locale(country)
-            domain = self._derive_domain(country)
-            search_query = query.strip()
-            if city and not use_radius:
-                search_query = f"{query} {city}".strip()
-
-            while len(businesses) < limit:
-                response = self.session.google_maps_search(
-                    query=search_query,
-                    geo=geo,
-                    limit=limit,
-                    locale=locale,
-                    domain=domain,
-                    google_results_language="en",
-                    page_from=str(page),
+                # Keep only the parsed listings and release the response envelope.
+                page_keys: List[Any] = []
+                parsed = self._parse_response(
+                    response, city, limit - collected, seen_ids, page_keys
                 )
+                response = None
+                keep_paging = self._observe_page(run, page_keys, parsed, collected, limit, carried)
+                if not parsed and not carried:
+                    break
+                carried = 0
 
-                results = response.get("results", [])
-                if not results:
+                page += 1
+                if keep_paging and pager is not None and self._prefetch_allowed(
+                    collected + len(parsed), limit, parsed, detail_cache, budget, enrich
+                ):
+                    next_page = pager.submit(
+                        self._request_page, search_query, geo, limit, locale, domain, page
+                    )
+
+                ready = parsed
+                if enrich:
+                    ready = self._iter_enriched(
+                        parsed,
+                        domain=domain,
+                        locale=locale,
+                        cache=detail_cache,
+                        budget=budget,
+                        executor=executor,
+                        counts=enrich_counts,
+                        progress_callback=enrich_progress_callback,
+                    )
+                for business in ready:
+                    collected += 1
+                    if checkpoint is not None:
+                        checkpoint.append((business,), spent=budget.spent)
+                    yield business
+                parsed = None
+                self._report_progress(progress_callback, collected, limit, budget)
+                if not keep_paging:
                     break
 
-                page_count = 0
+            self._print_stop_reason(run)
+            print(f"Google Maps: Found {collected} businesses")
+            if budget.limited:
+                print(f"Google Maps: Used {budget.spent} of {budget.max_requests} budgeted requests")
+            complete = run.stop_reason != STOP_BUDGET
 
-                for item in results:
-                    html = item.get("content")
-                    if not html:
-                        continue
+        except DecodoUnauthorizedError:
+            raise
+        except Exception as e:
+            print(f"Google Maps search error: {e}")
+        finally:
+            if isinstance(ready, Iterator):
+                # Cancel queued lookups before waiting for the workers.
+                ready.close()
+            if next_page is not None:
+                next_page.cancel()
+            if pager is not None:
+                pager.shutdown(wait=True)
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+        if checkpoint is not None and complete and not checkpoint.completed:
+            checkpoint.complete()
+        self._report_progress(progress_callback, collected, limit, budget)
+
+    async def search_async(
+        self,
+        query: str,
+        city: str,
+        limit: int = 100,
+        country: str = None,
+        enrich: bool = True,
+        latitude: Optional[float] = None,
+        longitude: Optional[float] = None,
+        radius_km: Optional[float] = None,
+        progress_callback: Optional[Callable[..., None]] = None,
+        max_requests: Optional[int] = None,
+        enrich_progress_callback: Optional[Callable[[int, int], None]] = None,
+        prefetch: bool = True,
+        checkpoint: Optional[SearchCheckpoint] = None,
+    ) -> List[Business]:
+        """
+        Async variant of ``search`` for use with ``AsyncScraperAPISession``.
+
+        Collects ``iter_search_async`` into a list; see it for the arguments.
+
+        Returns:
+            List of business records
+        """
+        return [
+            business
+            async for business in self.iter_search_async(
+                query,
+                city,
+                limit,
+                country=country,
+                enrich=enrich,
+                latitude=latitude,
+                longitude=longitude,
+                radius_km=radius_km,
+                progress_callback=progress_callback,
+                max_requests=max_requests,
+                enrich_progress_callback=enrich_progress_callback,
+                prefetch=prefetch,
+                checkpoint=checkpoint,
+            )
+        ]
+
+    async def iter_search_async(
+        self,
+        query: str,
+        city: str,
+        limit: int = 100,
+        country: str = None,
+        enrich: bool = True,
+        latitude: Optional[float] = None,
+        longitude: Optional[float] = None,
+        radius_km: Optional[float] = None,
+        progress_callback: Optional[Callable[..., None]] = None,
+        max_requests: Optional[int] = None,
+        enrich_progress_callback: Optional[Callable[[int, int], None]] = None,
+        prefetch: bool = True,
+        checkpoint: Optional[SearchCheckpoint] = None,
+    ) -> AsyncIterator[Business]:
+        """
+        Async variant of ``iter_search`` for use with ``AsyncScraperAPISession``.
+
+        Place-details lookups for each results page are issued concurrently,
+        bounded by the session's in-flight limit and rate limiter, and each
+        business is yielded, in results order, once its own lookup finishes.
+        The next page is prefetched, paging stopped and a ``checkpoint``
+        saved and resumed the same way as in ``iter_search``; closing the
+        generator cancels outstanding requests.
+
+        Args:
+            query: Search keyword (e.g., "dentist", "pizza")
+            city: City name
+            limit: Maximum number of results
+            country: Optional country code (e.g., "US", "CA")
+            enrich: If True, fetch additional contact details (phone, email, website) for each business
+            latitude: Optional latitude for radius-based searches
+            longitude: Optional longitude for radius-based searches
+            radius_km: Optional radius in kilometers for radius-based searches
+            progress_callback: Called with (collected, limit), plus the remaining
+                request budget as a third argument when max_requests is set
+            max_requests: Optional cap on Decodo calls (search pages plus place details)
+            enrich_progress_callback: Called with (enriched, queued) as place-details
+                lookups finish
+            prefetch: Request the next results page while the current one is enriched
+            checkpoint: Optional checkpoint to save progress to and resume from
+
+        Yields:
+            Business records
+        """
+        if limit <= 0:
+            return
+
+        collected = 0
+        seen_ids: Set[Any] = set()
+        page = 1
+        carried = 0
+        detail_cache: Dict[str, Any] = {}
+        budget = RequestBudget(max_requests)
+        enrich_counts = {"done": 0, "queued": 0}
+        run = self.pagination_policy.start()
+        self.last_stop_reason = None
+        complete = False
+        next_page = None
+        pending: List["asyncio.Future[None]"] = []
+
+        try:
+            print(f"Google Maps: Searching for '{query}' in {city}...")
+            self._print_estimate(limit, enrich, max_requests)
 
-                    remaining = max(limit - len(businesses), 0)
-                    if remaining == 0:
+            search_query, geo, locale, domain = self._prepare_search(
+                query, city, country, latitude, longitude, radius_km
+            )
+
+            if checkpoint is not None:
+                page, carried = self._resume_search(checkpoint, seen_ids, run, budget)
+                for business in checkpoint.leads[:limit]:
+                    collected += 1
+                    yield business
+
+            while collected < limit and not (checkpoint is not None and checkpoint.completed):
+                if checkpoint is not None:
+                    self._save_cursor(checkpoint, page, seen_ids, collected, run, budget)
+                if next_page is not None:
+                    response = await next_page
+                    next_page = None
+                else:
+                    if not self._spend_page(budget, enrich):
+                        run.stop(STOP_BUDGET)
                         break
+                    response = await self._request_page(search_query, geo, limit, locale, domain, page)
 
-                    parsed = self._parse_results_html(html, city, remaining, seen_ids)
-                    if enrich:
-                        for business in parsed:
-                            self._enrich_business_details(
-                                business,
-                                domain=domain,
-                                locale=locale,
-                                cache=detail_cache,
-                            )
-                    if parsed:
-                        page_count += len(parsed)
-                        businesses.extend(parsed)
-                        if progress_callback:
-                            try:
-                                progress_callback(len(businesses), limit)
-                            except Exception:
-                                # Progress updates should never interrupt scraping
-                                pass
-
-                if page_count == 0:
+                # Keep only the parsed listings and release the response envelope.
+                page_keys: List[Any] = []
+                parsed = await self._parse_response_async(
+                    response, city, limit - collected, seen_ids, page_keys
+                )
+                response = None
+                keep_paging = self._observe_page(run, page_keys, parsed, collected, limit, carried)
+                if not parsed and not carried:
                     break
+                carried = 0
 
                 page += 1
+                if keep_paging and prefetch and self._prefetch_allowed(
+                    collected + len(parsed), limit, parsed, detail_cache, budget, enrich
+                ):
+                    next_page = asyncio.ensure_future(
+                        self._request_page(search_query, geo, limit, locale, domain, page)
+                    )
+
+                if enrich:
+                    pending = [
+                        asyncio.ensure_future(self._enrich_business_details_async(
+                            business,
+                            domain=domain,
+                            locale=locale,
+                            cache=detail_cache,
+                            budget=budget,
+                            counts=enrich_counts,
+                            progress_callback=enrich_progress_callback,
+                        ))
+                        for business in parsed
+                    ]
+                for index, business in enumerate(parsed):
+                    if pending:
+                        await pending[index]
+                    collected += 1
+                    if checkpoint is not None:
+                        checkpoint.append((business,), spent=budget.spent)
+                    yield business
+                pending = []
+                parsed = None
+                self._report_progress(progress_callback, collected, limit, budget)
+                if not keep_paging:
+                    break
+
+            self._print_stop_reason(run)
+            print(f"Google Maps: Found {collected} businesses")
+            if budget.limited:
+                print(f"Google Maps: Used {budget.spent} of {budget.max_requests} budgeted requests")
+            complete = run.stop_reason != STOP_BUDGET
+
+        except DecodoUnauthorizedError:
+            raise
+        except Exception as e:
+            print(f"Google Maps search error: {e}")
+        finally:
+            for task in pending:
+                task.cancel()
+            if next_page is not None and not next_page.done():
+                next_page.cancel()
+
+        if checkpoint is not None and complete and not checkpoint.completed:
+            checkpoint.complete()
+        self._report_progress(progress_callback, collected, limit, budget)
+
+    def search_tiled(
+        self,
+        query: str,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        limit: int = 500,
+        city: str = "",
+        country: str = None,
+        enrich: bool = True,
+        tile_radius_km: Optional[float] = None,
+        max_depth: int = 2,
+        max_tile_pages: int = 5,
+        tile_concurrency: int = 4,
+        progress_callback: Optional[Callable[..., None]] = None,
+        max_requests: Optional[int] = None,
+        enrich_concurrency: int = 4,
+        enrich_progress_callback: Optional[Callable[[int, int], None]] = None,
+        checkpoint: Optional[SearchCheckpoint] = None,
+    ) -> List[Business]:
+        """
+        Search a large radius as a hex grid of smaller, overlapping circles.
+
+        Collects ``iter_search_tiled`` into a list; see it for the arguments.
+
+        Returns:
+            List of business records
+        """
+        return list(self.iter_search_tiled(
+            query,
+            latitude,
+            longitude,
+            radius_km,
+            limit=limit,
+            city=city,
+            country=country,
+            enrich=enrich,
+            tile_radius_km=tile_radius_km,
+            max_depth=max_depth,
+            max_tile_pages=max_tile_pages,
+            tile_concurrency=tile_concurrency,
+            progress_callback=progress_callback,
+            max_requests=max_requests,
+            enrich_concurrency=enrich_concurrency,
+            enrich_progress_callback=enrich_progress_callback,
+            checkpoint=checkpoint,
+        ))
+
+    def iter_search_tiled(
+        self,
+        query: str,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        limit: int = 500,
+        city: str = "",
+        country: str = None,
+        enrich: bool = True,
+        tile_radius_km: Optional[float] = None,
+        max_depth: int = 2,
+        max_tile_pages: int = 5,
+        tile_concurrency: int = 4,
+        progress_callback: Optional[Callable[..., None]] = None,
+        max_requests: Optional[int] = None,
+        enrich_concurrency: int = 4,
+        enrich_progress_callback: Optional[Callable[[int, int], None]] = None,
+        checkpoint: Optional[SearchCheckpoint] = None,
+    ) -> Iterator[Business]:
+        """
+        Search a large radius as a hex grid of smaller, overlapping circles.
+
+        A single radius query stops yielding new listings after a few pages.
+        Tiles are searched concurrently (paced by the session rate limiter),
+        merged by Google CID, and a tile that still returns new listings on
+        its last allowed page is split into seven half-radius tiles, down to
+        ``max_depth`` levels. Sparse areas are therefore not searched at a
+        finer grain than they need.
+
+        The new listings of each finished tile are enriched the same way as
+        in ``iter_search`` (place cache, one lookup per CID, shared request
+        budget) and yielded while the other tiles are still being searched.
+        Closing the generator early stops the search.
+
+        With a ``checkpoint`` the listings of each finished tile are saved
+        with the queue of tiles still to search, and each lead once it is
+        enriched. A resumed search first yields the saved leads, finishes
+        the ones that were not enriched yet, then searches the remaining
+        tiles (tiles that were running are searched again).
+
+        Args:
+            query: Search keyword (e.g., "restaurant")
+            latitude: Center latitude
+            longitude: Center longitude
+            radius_km: Radius of the whole area in kilometers
+            limit: Maximum number of unique results
+            city: City label stored on each business
+            country: Optional country code for locale and domain
+            enrich: If True, fetch contact details for each business
+            tile_radius_km: Radius of the top-level tiles (default: half of radius_km, 7 tiles)
+            max_depth: How many times a saturated tile may be subdivided
+            max_tile_pages: Results pages fetched per tile before it counts as saturated
+            tile_concurrency: Tiles searched in parallel
+            progress_callback: Called with (collected, limit), plus the remaining
+                request budget as a third argument when max_requests is set
+            max_requests: Optional cap on Decodo calls (search pages plus place details)
+            enrich_concurrency: Place-details lookups run in parallel
+            enrich_progress_callback: Called with (enriched, queued) as place-details
+                lookups finish
+            checkpoint: Optional checkpoint to save progress to and resume from
+
+        Yields:
+            Business records
+        """
+        if limit <= 0:
+            return
+        if checkpoint is not None and checkpoint.completed:
+            print(f"Google Maps: Search already finished, reusing {len(checkpoint.leads)} saved businesses")
+            yield from checkpoint.leads[:limit]
+            return
+
+        locale = self._derive_locale(country)
+        domain = self._derive_domain(country)
+        budget = RequestBudget(max_requests)
+        run = _TiledRun(
+            self._listing_key,
+            hex_tiles(latitude, longitude, radius_km, tile_radius_km or radius_km / 2.0),
+            limit,
+            enrich,
+            budget,
+            checkpoint,
+        )
+        detail_cache: Dict[str, Dict[str, Optional[str]]] = {}
+        enrich_counts = {"done": 0, "queued": 0}
+        stop = threading.Event()
+        pool = ThreadPoolExecutor(max_workers=max(tile_concurrency, 1), thread_name_prefix="leads-tile")
+        executor = None
+        if enrich and enrich_concurrency > 1:
+            executor = ThreadPoolExecutor(
+                max_workers=enrich_concurrency,
+                thread_name_prefix="leads-enrich",
+            )
+        ready: Iterable[Business] = ()
+
+        try:
+            batch = run.resume()
+            yield from run.leads[:run.finished]
+            print(
+                f"Google Maps: Searching for '{query}' in {len(run.pending)} tiles "
+                f"around ({latitude:.4f}, {longitude:.4f})..."
+            )
+
+            while True:
+                if batch:
+                    ready = batch
+                    if enrich:
+                        ready = self._iter_enriched(
+                            batch,
+                            domain=domain,
+                            locale=locale,
+                            cache=detail_cache,
+                            budget=budget,
+                            executor=executor,
+                            counts=enrich_counts,
+                            progress_callback=enrich_progress_callback,
+                        )
+                    for business in ready:
+                        run.finish(business)
+                        yield business
+                    ready = ()
+                if not run.searching:
+                    break
+
+                while run.pending and len(run.running) < max(tile_concurrency, 1):
+                    tile = run.pending.popleft()
+                    future = pool.submit(
+                        self._search_tile,
+                        query, tile, city, limit, locale, domain, max_tile_pages, budget,
+                        run.reserved, run.claim, stop,
+                    )
+                    run.running[future] = tile
+
+                batch = []
+                done, _ = wait(list(run.running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    tile = run.running.pop(future)
+                    try:
+                        listings, saturated = future.result()
+                    except DecodoUnauthorizedError:
+                        raise
+                    except Exception as exc:
+                        print(f"Google Maps: Tile ({tile.latitude}, {tile.longitude}) failed: {exc}")
+                        run.failed.append(tile)
+                        continue
+                    batch.extend(run.merge(tile, listings, saturated, max_depth))
+                self._report_progress(progress_callback, len(run.leads), limit, budget)
+
+            run.report()
 
-            print(f"Google Maps: Found {len(businesses)} businesses")
+        except DecodoUnauthorizedError:
+            raise
+        except Exception as e:
+            print(f"Google Maps search error: {e}")
+        finally:
+            if isinstance(ready, Iterator):
+                # Cancel queued lookups before waiting for the workers.
+                ready.close()
+            stop.set()
+            for future in run.running:
+                future.cancel()
+            pool.shutdown(wait=True)
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+        self._report_progress(progress_callback, run.finished, limit, budget)
+
+    async def search_tiled_async(
+        self,
+        query: str,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        limit: int = 500,
+        city: str = "",
+        country: str = None,
+        enrich: bool = True,
+        tile_radius_km: Optional[float] = None,
+        max_depth: int = 2,
+        max_tile_pages: int = 5,
+        tile_concurrency: int = 4,
+        progress_callback: Optional[Callable[..., None]] = None,
+        max_requests: Optional[int] = None,
+        enrich_progress_callback: Optional[Callable[[int, int], None]] = None,
+        checkpoint: Optional[SearchCheckpoint] = None,
+    ) -> List[Business]:
+        """
+        Async variant of ``search_tiled`` for use with ``AsyncScraperAPISession``.
+
+        Collects ``iter_search_tiled_async`` into a list; see it for the arguments.
+
+        Returns:
+            List of business records
+        """
+        return [
+            business
+            async for business in self.iter_search_tiled_async(
+                query,
+                latitude,
+                longitude,
+                radius_km,
+                limit=limit,
+                city=city,
+                country=country,
+                enrich=enrich,
+                tile_radius_km=tile_radius_km,
+                max_depth=max_depth,
+                max_tile_pages=max_tile_pages,
+                tile_concurrency=tile_concurrency,
+                progress_callback=progress_callback,
+                max_requests=max_requests,
+                enrich_progress_callback=enrich_progress_callback,
+                checkpoint=checkpoint,
+            )
+        ]
+
+    async def iter_search_tiled_async(
+        self,
+        query: str,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        limit: int = 500,
+        city: str = "",
+        country: str = None,
+        enrich: bool = True,
+        tile_radius_km: Optional[float] = None,
+        max_depth: int = 2,
+        max_tile_pages: int = 5,
+        tile_concurrency: int = 4,
+        progress_callback: Optional[Callable[..., None]] = None,
+        max_requests: Optional[int] = None,
+        enrich_progress_callback: Optional[Callable[[int, int], None]] = None,
+        checkpoint: Optional[SearchCheckpoint] = None,
+    ) -> AsyncIterator[Business]:
+        """
+        Async variant of ``iter_search_tiled`` for use with ``AsyncScraperAPISession``.
+
+        Up to ``tile_concurrency`` tiles are searched as concurrent tasks and
+        the place-details lookups of each tile's new listings are issued
+        concurrently, as in ``iter_search_async``. Closing the generator
+        cancels outstanding requests.
+
+        Args:
+            query: Search keyword (e.g., "restaurant")
+            latitude: Center latitude
+            longitude: Center longitude
+            radius_km: Radius of the whole area in kilometers
+            limit: Maximum number of unique results
+            city: City label stored on each business
+            country: Optional country code for locale and domain
+            enrich: If True, fetch contact details for each business
+            tile_radius_km: Radius of the top-level tiles (default: half of radius_km, 7 tiles)
+            max_depth: How many times a saturated tile may be subdivided
+            max_tile_pages: Results pages fetched per tile before it counts as saturated
+            tile_concurrency: Tiles searched in parallel
+            progress_callback: Called with (collected, limit), plus the remaining
+                request budget as a third argument when max_requests is set
+            max_requests: Optional cap on Decodo calls (search pages plus place details)
+            enrich_progress_callback: Called with (enriched, queued) as place-details
+                lookups finish
+            checkpoint: Optional checkpoint to save progress to and resume from
+
+        Yields:
+            Business records
+        """
+        if limit <= 0:
+            return
+        if checkpoint is not None and checkpoint.completed:
+            print(f"Google Maps: Search already finished, reusing {len(checkpoint.leads)} saved businesses")
+            for business in checkpoint.leads[:limit]:
+                yield business
+            return
+
+        locale = self._derive_locale(country)
+        domain = self._derive_domain(country)
+        budget = RequestBudget(max_requests)
+        run = _TiledRun(
+            self._listing_key,
+            hex_tiles(latitude, longitude, radius_km, tile_radius_km or radius_km / 2.0),
+            limit,
+            enrich,
+            budget,
+            checkpoint,
+        )
+        detail_cache: Dict[str, Any] = {}
+        enrich_counts = {"done": 0, "queued": 0}
+        pending: List["asyncio.Future[None]"] = []
+
+        try:
+            batch = run.resume()
+            for business in run.leads[:run.finished]:
+                yield business
+            print(
+                f"Google Maps: Searching for '{query}' in {len(run.pending)} tiles "
+                f"around ({latitude:.4f}, {longitude:.4f})..."
+            )
+
+            while True:
+                if enrich:
+                    pending = [
+                        asyncio.ensure_future(self._enrich_business_details_async(
+                            business,
+                            domain=domain,
+                            locale=locale,
+                            cache=detail_cache,
+                            budget=budget,
+                            counts=enrich_counts,
+                            progress_callback=enrich_progress_callback,
+                        ))
+                        for business in batch
+                    ]
+                for index, business in enumerate(batch):
+                    if pending:
+                        await pending[index]
+                    run.finish(business)
+                    yield business
+                pending = []
+                if not run.searching:
+                    break
+
+                while run.pending and len(run.running) < max(tile_concurrency, 1):
+                    tile = run.pending.popleft()
+                    task = asyncio.ensure_future(self._search_tile_async(
+                        query, tile, city, limit, locale, domain, max_tile_pages, budget,
+                        run.reserved, run.claim,
+                    ))
+                    run.running[task] = tile
+
+                batch = []
+                done, _ = await asyncio.wait(list(run.running), return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    tile = run.running.pop(task)
+                    try:
+                        listings, saturated = task.result()
+                    except DecodoUnauthorizedError:
+                        raise
+                    except Exception as exc:
+                        print(f"Google Maps: Tile ({tile.latitude}, {tile.longitude}) failed: {exc}")
+                        run.failed.append(tile)
+                        continue
+                    batch.extend(run.merge(tile, listings, saturated, max_depth))
+                self._report_progress(progress_callback, len(run.leads), limit, budget)
+
+            run.report()
 
         except DecodoUnauthorizedError:
             raise
         except Exception as e:
             print(f"Google Maps search error: {e}")
+        finally:
+            for task in [*pending, *run.running]:
+                task.cancel()
+
+        self._report_progress(progress_callback, run.finished, limit, budget)
+
+    def _search_tile(
+        self,
+        query: str,
+        tile: Tile,
+        city: str,
+        limit: int,
+        locale: str,
+        domain: str,
+        max_pages: int,
+        budget: RequestBudget,
+        reserved: Callable[[], int],
+        claim: Callable[[List[Business]], int],
+        stop: Optional[threading.Event] = None,
+    ) -> Tuple[List[Business], bool]:
+        """
+        Page through one tile.
+
+        ``claim`` registers listings with the whole search and returns the
+        number of unique listings found so far; the tile stops paging once
+        that reaches ``limit``, when ``stop`` is set, or earlier when the
+        pagination policy sees the tile running dry.
+
+        Returns:
+            Tuple of (listings, saturated) where saturated means every
+            allowed page was still productive
+        """
+        geo = self._build_geo(city, None, tile.latitude, tile.longitude, tile.radius_km)
+        seen_ids: Set[Any] = set()
+        listings: List[Business] = []
+        run = self.pagination_policy.start()
+
+        for page in range(1, max_pages + 1):
+            if stop is not None and stop.is_set():
+                return listings, False
+            if not self._spend_tile_page(budget, reserved):
+                return listings, False
+
+            response = self._request_page(query.strip(), geo, limit, locale, domain, page)
+            page_keys: List[Any] = []
+            parsed = self._parse_response(response, city, 0, seen_ids, page_keys)
+            response = None
+            done, saturated = self._observe_tile_page(run, page_keys, parsed, listings, limit, claim)
+            if done:
+                return listings, saturated
+
+        return listings, True
+
+    async def _search_tile_async(
+        self,
+        query: str,
+        tile: Tile,
+        city: str,
+        limit: int,
+        locale: str,
+        domain: str,
+        max_pages: int,
+        budget: RequestBudget,
+        reserved: Callable[[], int],
+        claim: Callable[[List[Business]], int],
+    ) -> Tuple[List[Business], bool]:
+        """Async variant of ``_search_tile``; cancelling the task stops the tile."""
+        geo = self._build_geo(city, None, tile.latitude, tile.longitude, tile.radius_km)
+        seen_ids: Set[Any] = set()
+        listings: List[Business] = []
+        run = self.pagination_policy.start()
+
+        for page in range(1, max_pages + 1):
+            if not self._spend_tile_page(budget, reserved):
+                return listings, False
+
+            response = await self._request_page(query.strip(), geo, limit, locale, domain, page)
+            page_keys: List[Any] = []
+            parsed = await self._parse_response_async(response, city, 0, seen_ids, page_keys)
+            response = None
+            done, saturated = self._observe_tile_page(run, page_keys, parsed, listings, limit, claim)
+            if done:
+                return listings, saturated
+
+        return listings, True
+
+    def _spend_tile_page(self, budget: RequestBudget, reserved: Callable[[], int]) -> bool:
+        """Charge a tile's results page, keeping enough budget to enrich the leads already found."""
+        if budget.limited and not budget.can_spend(reserved() + 1):
+            return False
+        return budget.try_spend()
+
+    def _observe_tile_page(
+        self,
+        run: PaginationRun,
+        page_keys: List[Any],
+        parsed: List[Business],
+        listings: List[Business],
+        limit: int,
+        claim: Callable[[List[Business]], int],
+    ) -> Tuple[bool, bool]:
+        """
+        Record a tile's parsed page.
+
+        Returns:
+            Tuple of (tile done, saturated)
+        """
+        keep_paging = run.observe(page_keys, len(parsed))
+        listings.extend(parsed)
+        if not parsed or claim(parsed) >= limit:
+            return True, False
+        if not keep_paging:
+            # A page cap counts as saturation; running dry does not.
+            return True, run.stop_reason == STOP_PAGE_CAP
+        return False, False
+
+    def _listing_key(self, business: Business) -> Any:
+        return business.get("google_cid") or (
+            business["name"].lower(), business.get("address") or ""
+        )
+
+    def _prepare_search(
+        self,
+        query: str,
+        city: str,
+        country: Optional[str],
+        latitude: Optional[float],
+        longitude: Optional[float],
+        radius_km: Optional[float],
+    ) -> Tuple[str, Optional[str], str, str]:
+        """Resolve the query string, geo, locale and domain for a search."""
+        use_radius = latitude is not None and longitude is not None
+        geo = self._build_geo(city, country, latitude, longitude, radius_km)
+        locale = self._derive_locale(country)
+        domain = self._derive_domain(country)
+        search_query = query.strip()
+        if city and not use_radius:
+            search_query = f"{query} {city}".strip()
+        return search_query, geo, locale, domain
+
+    def estimate_requests(
+        self,
+        limit: int,
+        enrich: bool = True,
+        max_requests: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """
+        Estimate the Decodo calls a search needs.
+
+        Each results page costs one ``google_maps_search`` call and yields up to
+        ``RESULTS_PER_PAGE`` listings; enrichment adds one
+        ``google_maps_place_details`` call per listing. Under a budget the plan
+        keeps only as many leads as can be fully enriched, fetching just the
+        pages those leads need.
+
+        Args:
+            limit: Maximum number of results
+            enrich: Whether place details are fetched for each result
+            max_requests: Optional cap on Decodo calls
+
+        Returns:
+            Dictionary with planned ``leads``, ``pages``, ``details`` and ``total`` calls
+        """
+        leads = max(limit, 0)
+        if max_requests is not None:
+            budget = max(max_requests, 0)
+            if enrich:
+                # Every enriched lead costs one details call plus a share of a page.
+                affordable = budget * RESULTS_PER_PAGE // (RESULTS_PER_PAGE + 1)
+                while affordable and self._pages_for(affordable) + affordable > budget:
+                    affordable -= 1
+            else:
+                affordable = budget * RESULTS_PER_PAGE
+            leads = min(leads, affordable)
+
+        pages = self._pages_for(leads)
+        details = leads if enrich else 0
+        return {"leads": leads, "pages": pages, "details": details, "total": pages + details}
+
+    def _pages_for(self, leads: int) -> int:
+        return -(-leads // RESULTS_PER_PAGE)
+
+    def _print_estimate(self, limit: int, enrich: bool, max_requests: Optional[int]) -> None:
+        plan = self.estimate_requests(limit, enrich, max_requests)
+        print(
+            f"Google Maps: Estimated {plan['total']} Decodo requests "
+            f"({plan['pages']} pages + {plan['details']} place details)"
+        )
+        if max_requests is not None and plan["leads"] < limit:
+            print(
+                f"Google Maps: Budget of {max_requests} requests covers about "
+                f"{plan['leads']} {'enriched ' if enrich else ''}leads"
+            )
+
+    def _request_page(
+        self,
+        search_query: str,
+        geo: Optional[str],
+        limit: int,
+        locale: str,
+        domain: str,
+        page: int,
+    ):
+        """Request one results page (a coroutine on async sessions)."""
+        return self.session.google_maps_search(
+            query=search_query,
+            geo=geo,
+            limit=limit,
+            locale=locale,
+            domain=domain,
+            google_results_language="en",
+            page_from=str(page),
+        )
+
+    def _parse_response(
+        self,
+        response: Dict[str, Any],
+        city: str,
+        remaining: int,
+        seen_ids: Set[Any],
+        page_keys: Optional[List[Any]] = None,
+    ) -> List[Business]:
+        """
+        Parse every HTML payload of a results response into new listings.
+
+        Args:
+            response: Decodo response envelope
+            city: City name stored on each listing
+            remaining: Maximum number of new listings to keep (0 = no cap)
+            seen_ids: Listing keys already collected; updated in place
+            page_keys: Optional list that receives the key of every listing
+                on the page, including ones already seen
+
+        Returns:
+            New listings
+        """
+        listings: List[Business] = []
+        pages = self._page_contents(response)
+        for index, html in enumerate(pages):
+            # Drop each raw page as soon as it is parsed.
+            pages[index] = None
+            if not html or (remaining and len(listings) >= remaining):
+                continue
+            listings.extend(
+                self._parse_results_html(
+                    html, city, remaining - len(listings) if remaining else 0, seen_ids, page_keys
+                )
+            )
+        return listings
+
+    async def _parse_response_async(
+        self,
+        response: Dict[str, Any],
+        city: str,
+        remaining: int,
+        seen_ids: Set[Any],
+        page_keys: Optional[List[Any]] = None,
+    ) -> List[Business]:
+        """``_parse_response`` that awaits the parse executor instead of blocking the event loop."""
+        if self.parse_executor is None:
+            return self._parse_response(response, city, remaining, seen_ids, page_keys)
+
+        listings: List[Business] = []
+        pages = self._page_contents(response)
+        for index, html in enumerate(pages):
+            pages[index] = None
+            if not html or (remaining and len(listings) >= remaining):
+                continue
+            parsed = await asyncio.wrap_future(
+                self.parse_executor.submit(parse_results_page, html, city, self.parser_backend)
+            )
+            listings.extend(
+                self._collect_listings(
+                    parsed, remaining - len(listings) if remaining else 0, seen_ids, page_keys
+                )
+            )
+        return listings
+
+    def _prefetch_allowed(
+        self,
+        collected: int,
+        limit: int,
+        parsed: List[Business],
+        cache: Dict[str, Any],
+        budget: RequestBudget,
+        enrich: bool,
+    ) -> bool:
+        """Charge the next page early if the serial loop would request it after enrichment."""
+        if collected >= limit:
+            return False
+        if budget.limited:
+            pending = 0
+            if enrich:
+                pending = len({
+                    business["google_cid"]
+                    for business in parsed
+                    if business.get("google_cid") and business["google_cid"] not in cache
+                })
+            # Leave the current page's lookups and one more enriched lead affordable.
+            if not budget.can_spend(pending + (2 if enrich else 1)):
+                return False
+        return budget.try_spend()
+
+    def _spend_page(self, budget: RequestBudget, enrich: bool) -> bool:
+        """Charge a results page, keeping room to enrich at least one lead from it."""
+        if enrich and not budget.can_spend(2):
+            return False
+        return budget.try_spend()
+
+    def _observe_page(
+        self,
+        run: PaginationRun,
+        page_keys: List[Any],
+        parsed: List[Business],
+        collected: int,
+        limit: int,
+        carried: int = 0,
+    ) -> bool:
+        """
+        Feed a parsed page to the pagination run; False when no further page is wanted.
 
+        ``carried`` counts listings of this page that a resumed checkpoint
+        already saved, so they still count as new for the yield checks.
+        """
+        if parsed and limit and collected + len(parsed) >= limit:
+            # The listing cap truncates page_keys, so judge the page by the limit alone.
+            run.pages += 1
+            return run.stop(STOP_LIMIT)
+        return run.observe(page_keys, len(parsed) + carried)
+
+    def _resume_search(
+        self,
+        checkpoint: SearchCheckpoint,
+        seen_ids: Set[Any],
+        run: PaginationRun,
+        budget: RequestBudget,
+    ) -> Tuple[int, int]:
+        """
+        Load a checkpoint's cursor into a fresh paged search.
+
+        Returns:
+            Tuple of (page to request next, leads of that page already saved)
+        """
+        budget.charge(checkpoint.spent)
+        seen_ids.update(self._listing_key(business) for business in checkpoint.leads)
+        cursor = checkpoint.cursor
+        if cursor is None:
+            return 1, 0
+
+        seen_ids.update(decode_listing_keys(cursor["seen"]))
+        run.restore(cursor["run"])
+        if checkpoint.completed:
+            print(f"Google Maps: Search already finished, reusing {len(checkpoint.leads)} saved businesses")
+        else:
+            print(
+                f"Google Maps: Resuming at page {cursor['page']} with "
+                f"{len(checkpoint.leads)} saved businesses"
+            )
+        return cursor["page"], len(checkpoint.leads) - cursor["collected"]
+
+    def _save_cursor(
+        self,
+        checkpoint: SearchCheckpoint,
+        page: int,
+        seen_ids: Set[Any],
+        collected: int,
+        run: PaginationRun,
+        budget: RequestBudget,
+    ) -> None:
+        """Record where a paged search stands before it consumes ``page``."""
+        checkpoint.save_cursor(
+            {
+                "page": page,
+                "seen": encode_listing_keys(seen_ids),
+                "collected": collected,
+                "run": run.snapshot(),
+            },
+            spent=budget.spent,
+        )
+
+    def _print_stop_reason(self, run: PaginationRun) -> None:
+        self.last_stop_reason = run.stop_reason
+        if run.stop_reason:
+            print(f"Google Maps: Stopped paging after {run.pages} page(s): {run.stop_reason}")
+
+    def _report_progress(
+        self,
+        progress_callback: Optional[Callable[..., None]],
+        collected: int,
+        limit: int,
+        budget: Optional[RequestBudget] = None,
+    ) -> None:
         if progress_callback:
             try:
-                progress_callback(len(businesses), limit)
+                if budget is not None and budget.limited:
+                    progress_callback(collected, limit, budget.remaining)
+                else:
+                    progress_callback(collected, limit)
             except Exception:
+                # Progress updates should never interrupt scraping
                 pass
 
-        return businesses
-
     def _match_country_code(self, country: Optional[str]) -> Optional[str]:
         if not country:
             return None
@@ -212,29 +1626,107 @@ class GoogleMapsProvider:
             return COUNTRY_SETTINGS[code].get("domain", "com")
         return "com"
 
-    def _parse_results_html(self, html: str, city: str, limit: int, seen_ids: Set[Any]) -> List[Dict[str, Any]]:
-        """Parse HTML returned from Decodo into business dictionaries."""
-        soup = BeautifulSoup(html, "lxml")
+    def _parse_results_html(
+        self,
+        html: str,
+        city: str,
+        limit: int,
+        seen_ids: Set[Any],
+        page_keys: Optional[List[Any]] = None,
+    ) -> List[Business]:
+        """Parse HTML returned from Decodo into business records."""
+        if self.parse_executor is not None:
+            listings = self.parse_executor.submit(
+                parse_results_page, html, city, self.parser_backend
+            ).result()
+            return self._collect_listings(listings, limit, seen_ids, page_keys)
+
+        if self.parser_backend == "lxml":
+            keys_before = len(page_keys) if page_keys is not None else 0
+            try:
+                return self._collect_listings(
+                    self._iter_listings_lxml(html, city), limit, seen_ids, page_keys
+                )
+            except Exception:
+                # Unusual markup (e.g. an XML declaration in a str): use the tolerant parser.
+                if page_keys is not None:
+                    del page_keys[keys_before:]
+        return self._collect_listings(self._iter_listings_bs4(html, city), limit, seen_ids, page_keys)
+
+    def _collect_listings(
+        self,
+        businesses: Iterable[Optional[Business]],
+        limit: int,
+        seen_ids: Set[Any],
+        page_keys: Optional[List[Any]] = None,
+    ) -> List[Business]:
+        """Keep unseen listings up to ``limit``; ``seen_ids`` only changes on success."""
         listings = []
+        added: Set[Any] = set()
 
-        for block in soup.select("div.VkpGBb"):
-            business = self._parse_listing_block(block, city)
+        for business in businesses:
             if business:
-                identifier = business.get("google_cid")
-                if not identifier:
-                    identifier = (business["name"].lower(), business.get("address") or "")
-                if identifier in seen_ids:
+                identifier = self._listing_key(business)
+                if page_keys is not None:
+                    page_keys.append(identifier)
+                if identifier in seen_ids or identifier in added:
                     continue
-                seen_ids.add(identifier)
+                added.add(identifier)
                 listings.append(business)
 
             if limit and len(listings) >= limit:
                 break
 
+        seen_ids.update(added)
         return listings
 
-    def _parse_listing_block(self, block, city: str) -> Dict[str, Any]:
-        """Convert a single Google local listing block into a business dict."""
+    def _iter_listings_lxml(self, html: str, city: str) -> Iterator[Optional[Business]]:
+        root = etree.HTML(html)
+        if root is None:
+            return
+        etree.strip_elements(root, *_NON_TEXT_TAGS, with_tail=False)
+
+        for block in _LISTING_XPATH(root):
+            yield self._parse_listing_element(block, city)
+
+    def _iter_listings_bs4(self, html: str, city: str) -> Iterator[Optional[Business]]:
+        soup = BeautifulSoup(html, "lxml")
+        try:
+            for block in soup.select("div.VkpGBb"):
+                yield self._parse_listing_block(block, city)
+        finally:
+            # Free the parse tree eagerly instead of waiting for the cycle collector.
+            soup.decompose()
+
+    def _parse_listing_element(self, block, city: str) -> Optional[Business]:
+        """lxml counterpart of ``_parse_listing_block``."""
+        details = _DETAILS_XPATH(block)
+        if not details:
+            return None
+
+        divs = list(details[0].iterdescendants("div"))
+        if not divs:
+            return None
+
+        name = self._element_text(divs[0])
+        if not name:
+            return None
+
+        lines = [self._element_text(div) for div in divs[1:]]
+
+        cid = None
+        links = _CID_LINK_XPATH(block)
+        if links:
+            cid = links[0].get("data-cid")
+
+        return self._build_business(name, lines, cid, city)
+
+    def _element_text(self, element) -> str:
+        """Equivalent of BeautifulSoup's ``get_text(" ", strip=True)``."""
+        return " ".join(text.strip() for text in element.itertext() if text.strip())
+
+    def _parse_listing_block(self, block, city: str) -> Business:
+        """Convert a single Google local listing block into a business record."""
         details = block.select_one("div.rllt__details")
         if not details:
             return None
@@ -249,22 +1741,37 @@ class GoogleMapsProvider:
 
         lines = [div.get_text(" ", strip=True) for div in divs[1:]]
 
+        cid = None
+        link = block.select_one("a[data-cid]")
+        if link and link.has_attr("data-cid"):
+            cid = link["data-cid"]
+
+        return self._build_business(name, lines, cid, city)
+
+    def _build_business(
+        self,
+        name: str,
+        lines: List[str],
+        cid: Optional[str],
+        city: str,
+    ) -> Business:
+        """Interpret the text lines of a listing block, whichever parser produced them."""
         rating = None
         reviews_count = None
         category = None
 
         if lines:
             rating_line = lines[0]
-            rating_match = re.search(r"([0-9]+(?:[\.,][0-9]+)?)", rating_line)
+            rating_match = _RATING_RE.search(rating_line)
             if rating_match:
                 try:
                     rating = float(rating_match.group(1).replace(",", "."))
                 except ValueError:
                     rating = None
 
-            reviews_match = re.search(r"\(([^)]+)\)", rating_line)
+            reviews_match = _REVIEWS_RE.search(rating_line)
             if reviews_match:
-                reviews_digits = re.sub(r"\D", "", reviews_match.group(1))
+                reviews_digits = _NON_DIGIT_RE.sub("", reviews_match.group(1))
                 if reviews_digits:
                     try:
                         reviews_count = int(reviews_digits)
@@ -279,16 +1786,6 @@ class GoogleMapsProvider:
         status = None
         review_snippet = None
 
-        status_tokens = [
-            "open",
-            "closed",
-            "closes",
-            "opens",
-            "hours",
-            "aberto",
-            "fechado",
-        ]
-
         for line in lines[1:]:
             if not line:
                 continue
@@ -303,7 +1800,7 @@ class GoogleMapsProvider:
                 parts = [part.strip() for part in line.split("·") if part.strip()]
                 if parts:
                     first = parts[0]
-                    if any(unit in first for unit in ["km", "m", "mi", "ft"]):
+                    if any(unit in first for unit in _DISTANCE_UNITS):
                         distance = first
                         if len(parts) > 1:
                             address = " · ".join(parts[1:])
@@ -311,91 +1808,299 @@ class GoogleMapsProvider:
                     address = " · ".join(parts)
                 continue
 
-            if not address and not any(token in lowered for token in status_tokens):
+            is_status = any(token in lowered for token in _STATUS_TOKENS)
+
+            if not address and not is_status:
                 address = line
                 continue
 
-            if any(token in lowered for token in status_tokens):
+            if is_status:
                 status = line
 
-        cid = None
-        maps_url = None
-        link = block.select_one("a[data-cid]")
-        if link and link.has_attr("data-cid"):
-            cid = link["data-cid"]
-            maps_url = f"https://www.google.com/maps?cid={cid}"
+        maps_url = f"https://www.google.com/maps?cid={cid}" if cid is not None else None
+
+        return Business(
+            name=name,
+            category=category,
+            website=maps_url,
+            rating=rating,
+            reviews_count=reviews_count,
+            address=address,
+            city=city,
+            source="Google Maps",
+            scraped_at=time.time(),
+            distance=distance,
+            status=status,
+            review_snippet=review_snippet,
+            google_cid=cid,
+            google_maps_url=maps_url,
+        )
 
-        return {
-            "name": name,
-            "category": category,
-            "phone": None,
-            "email": None,
-            "website": maps_url,
-            "rating": rating,
-            "reviews_count": reviews_count,
-            "address": address,
-            "city": city,
-            "country": None,
-            "lat": None,
-            "lon": None,
-            "source": "Google Maps",
-            "scraped_at": datetime.utcnow().isoformat(),
-            "distance": distance,
-            "status": status,
-            "review_snippet": review_snippet,
-            "google_cid": cid,
-            "google_maps_url": maps_url,
-        }
+    def enrich_business(
+        self,
+        business: Business,
+        country: Optional[str] = None,
+        budget: Optional[RequestBudget] = None,
+    ) -> bool:
+        """
+        Fetch contact details for one listing, e.g. from a search run with ``enrich=False``.
+
+        Args:
+            business: Business record, updated in place
+            country: Country code or name the search used, for the Google domain
+            budget: Optional request budget charged for the lookup
+
+        Returns:
+            True when details were looked up (from the place cache or Decodo),
+            False when the listing has no CID or the budget is exhausted
+        """
+        cid = business.get("google_cid")
+        if not cid:
+            return False
+
+        details = self.place_cache.get(cid) if self.place_cache is not None else None
+        if details is None:
+            if budget is not None and not budget.try_spend():
+                return False
+            details = self._fetch_contact_details(
+                cid, self._derive_domain(country), self._derive_locale(country)
+            )
+        self._apply_contact_details(business, details)
+        return True
 
-    def _enrich_business_details(
+    def _iter_enriched(
         self,
-        business: Dict[str, Any],
+        businesses: List[Business],
         domain: str,
         locale: str,
         cache: Dict[str, Dict[str, Optional[str]]],
+        budget: Optional[RequestBudget] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
+        counts: Optional[Dict[str, int]] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> Iterator[Business]:
+        """
+        Enrich a page of businesses, yielding each one in page order once its details are in.
+
+        Each CID missing from ``cache`` is looked up once, on ``executor``
+        when given, and all lookups are submitted before the first business
+        is yielded. Once ``budget`` runs out no further lookups are made,
+        but listings found in the place cache are still filled in. Only
+        this thread touches ``cache`` and the business dicts, so workers
+        never race on them.
+        """
+        counts = counts if counts is not None else {"done": 0, "queued": 0}
+        cids: List[str] = []
+        for business in businesses:
+            cid = business.get("google_cid")
+            if not cid or cid in cache or cid in cids:
+                continue
+            stored = self.place_cache.get(cid) if self.place_cache is not None else None
+            if stored is not None:
+                cache[cid] = stored
+                continue
+            if budget is not None and not budget.try_spend():
+                # Out of budget: stop new lookups, keep filling cache hits.
+                continue
+            cids.append(cid)
+        counts["queued"] += len(cids)
+
+        futures: Dict[str, Future] = {}
+        if executor is not None:
+            futures = {
+                cid: executor.submit(self._fetch_contact_details, cid, domain, locale)
+                for cid in cids
+            }
+        queued = set(cids)
+
+        try:
+            for business in businesses:
+                cid = business.get("google_cid")
+                if cid:
+                    if cid in queued:
+                        queued.discard(cid)
+                        future = futures.get(cid)
+                        if future is not None:
+                            cache[cid] = future.result()
+                        else:
+                            cache[cid] = self._fetch_contact_details(cid, domain, locale)
+                        self._report_enrich_progress(progress_callback, counts)
+                    self._apply_contact_details(business, cache.get(cid))
+                yield business
+        finally:
+            # The consumer stopped early: drop lookups nobody will read.
+            for future in futures.values():
+                future.cancel()
+
+    def _fetch_contact_details(
+        self,
+        cid: str,
+        domain: str,
+        locale: str,
+    ) -> Dict[str, Optional[str]]:
+        try:
+            response = self.session.google_maps_place_details(
+                cid=cid,
+                domain=domain,
+                locale=locale,
+            )
+        except self.session.request_errors as exc:
+            return self._lookup_failed(cid, exc)
+        return self._store_place(cid, self._first_content(response))
+
+    def _lookup_failed(self, cid: str, error: BaseException) -> Dict[str, Optional[str]]:
+        """
+        Report a place lookup that raised after the session's retries.
+
+        Only an upstream rejection of this CID is negatively cached;
+        transport errors, throttling and 5xx answers say nothing about the
+        place, so a later run may look it up again.
+        """
+        print(f"Google Maps: Failed to enrich CID {cid}: {error}")
+        status = self.session.error_status(error)
+        if status is not None and 400 <= status < 500 and status not in _TRANSIENT_LOOKUP_STATUSES:
+            return self._record_place(cid, None)
+        return {}
+
+    def _store_place(self, cid: str, content: Optional[str]) -> Dict[str, Optional[str]]:
+        """Parse a place page and record the outcome in the place cache."""
+        if content is None:
+            return self._record_place(cid, None)
+        if self.parse_executor is not None:
+            details = self.parse_executor.submit(parse_place_page, content).result()
+        else:
+            details = self._extract_contact_details(content)
+        return self._record_place(cid, details)
+
+    async def _store_place_async(self, cid: str, content: Optional[str]) -> Dict[str, Optional[str]]:
+        """``_store_place`` that awaits the parse executor instead of blocking the event loop."""
+        if content is None or self.parse_executor is None:
+            return self._store_place(cid, content)
+        details = await asyncio.wrap_future(self.parse_executor.submit(parse_place_page, content))
+        return self._record_place(cid, details)
+
+    def _record_place(
+        self, cid: str, details: Optional[Dict[str, Optional[str]]]
+    ) -> Dict[str, Optional[str]]:
+        """Record a lookup in the place cache; None marks a failed lookup."""
+        if details is None:
+            if self.place_cache is not None:
+                self.place_cache.record_failure(cid)
+            return {}
+
+        if self.place_cache is not None:
+            self.place_cache.set(cid, details)
+        return details
+
+    def _report_enrich_progress(
+        self,
+        progress_callback: Optional[Callable[[int, int], None]],
+        counts: Dict[str, int],
+    ) -> None:
+        counts["done"] += 1
+        if progress_callback:
+            try:
+                progress_callback(counts["done"], counts["queued"])
+            except Exception:
+                # Progress updates should never interrupt scraping
+                pass
+
+    async def _enrich_business_details_async(
+        self,
+        business: Business,
+        domain: str,
+        locale: str,
+        cache: Dict[str, Any],
+        budget: Optional[RequestBudget] = None,
+        counts: Optional[Dict[str, int]] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
     ) -> None:
-        """Fetch additional contact details (phone/email/website) for a business."""
+        """Async variant of ``_iter_enriched`` for a single business.
+
+        The cache stores one task per CID so concurrent lookups of the same
+        place share a single request.
+        """
         cid = business.get("google_cid")
         if not cid:
             return
 
-        cached = cache.get(cid)
-        if cached is None:
-            try:
-                response = self.session.google_maps_place_details(
-                    cid=cid,
-                    domain=domain,
-                    locale=locale,
+        task = cache.get(cid)
+        if task is None and self.place_cache is not None:
+            stored = self.place_cache.get(cid)
+            if stored is not None:
+                task = asyncio.get_running_loop().create_future()
+                task.set_result(stored)
+                cache[cid] = task
+        if task is None:
+            if budget is not None and not budget.try_spend():
+                return
+            task = asyncio.ensure_future(self._fetch_contact_details_async(cid, domain, locale))
+            cache[cid] = task
+            if counts is not None:
+                counts["queued"] += 1
+                task.add_done_callback(
+                    lambda _task: self._report_enrich_progress(progress_callback, counts)
                 )
-                html = None
-                for result in response.get("results", []):
-                    content = result.get("content")
-                    if content:
-                        html = content
-                        break
-                cached = self._extract_contact_details(html)
-            except Exception as exc:
-                print(f"Google Maps: Failed to enrich CID {cid}: {exc}")
-                cached = {}
-            cache[cid] = cached
 
-        if not cached:
+        self._apply_contact_details(business, await task)
+
+    async def _fetch_contact_details_async(
+        self,
+        cid: str,
+        domain: str,
+        locale: str,
+    ) -> Dict[str, Optional[str]]:
+        try:
+            response = await self.session.google_maps_place_details(
+                cid=cid,
+                domain=domain,
+                locale=locale,
+            )
+        except self.session.request_errors as exc:
+            return self._lookup_failed(cid, exc)
+        return await self._store_place_async(cid, self._first_content(response))
+
+    def _page_contents(self, response: Dict[str, Any]) -> List[Optional[str]]:
+        """Return the HTML payloads of a Decodo response."""
+        return [result.get("content") for result in response.get("results", [])]
+
+    def _first_content(self, response: Dict[str, Any]) -> Optional[str]:
+        """Return the first non-empty HTML payload from a Decodo response."""
+        for result in response.get("results", []):
+            content = result.get("content")
+            if content:
+                return content
+        return None
+
+    def _apply_contact_details(
+        self,
+        business: Business,
+        details: Optional[Dict[str, Optional[str]]],
+    ) -> None:
+        """Copy non-empty contact fields onto a business record."""
+        if not details:
             return
 
-        phone = cached.get("phone")
+        phone = details.get("phone")
         if phone:
             business["phone"] = phone
 
-        website = cached.get("website")
+        website = details.get("website")
         if website:
             business["website"] = website
 
-        email = cached.get("email")
+        email = details.get("email")
         if email:
             business["email"] = email
 
     def _extract_contact_details(self, html: Optional[str]) -> Dict[str, Optional[str]]:
-        """Parse phone, email, and website from a Google Maps place HTML page."""
+        """
+        Parse phone, email, and website from a Google Maps place HTML page.
+
+        Only ``APP_INITIALIZATION_STATE[3][6]`` and the place entries inside
+        it are decoded, and ``tel:``/``mailto:`` fallbacks are located with
+        plain substring search instead of full-page regexes.
+        """
         details: Dict[str, Optional[str]] = {
             "phone": None,
             "email": None,
@@ -406,68 +2111,106 @@ class GoogleMapsProvider:
             return details
 
         try:
-            init_match = re.search(
-                r"APP_INITIALIZATION_STATE=(.*?);window\.APP_FLAGS", html
-            )
-            if init_match:
-                state = json.loads(init_match.group(1))
-                blob = None
-                if isinstance(state, list) and len(state) > 3:
-                    section = state[3]
-                    if isinstance(section, list) and len(section) > 6:
-                        blob = section[6]
-                if isinstance(blob, str) and blob.startswith(")]}'"):
-                    place_data = json.loads(blob[4:])
-                    if (
-                        isinstance(place_data, list)
-                        and len(place_data) > 6
-                        and isinstance(place_data[6], list)
-                    ):
-                        for entry in place_data[6]:
-                            if not isinstance(entry, list):
-                                continue
-
-                            if len(entry) > 5 and isinstance(entry[5], list):
-                                tel_meta = entry[5][0] if entry[5] else None
-                                if (
-                                    isinstance(tel_meta, str)
-                                    and tel_meta.startswith("tel:")
-                                ):
-                                    pretty = (
-                                        entry[0]
-                                        if entry and isinstance(entry[0], str)
-                                        else tel_meta.split(":", 1)[-1]
-                                    )
-                                    details["phone"] = (
-                                        pretty.replace("\u202a", "")
-                                        .replace("\u202c", "")
-                                        .strip()
-                                    )
-
-                            if entry and isinstance(entry[0], str):
-                                candidate = unescape(entry[0])
-                                if candidate.startswith("http"):
-                                    lowered = candidate.lower()
-                                    if "google.com/maps" in lowered:
-                                        continue
-                                    if lowered.startswith("https://maps.app.goo.gl"):
-                                        continue
-                                    if not details["website"]:
-                                        details["website"] = candidate
+            state_start = _find_state(html)
+            if state_start != -1:
+                blob = _decode_json_path(html, state_start, (3, 6))
+                if isinstance(blob, str) and blob.startswith(_XSSI_PREFIX):
+                    entries = _decode_json_path(blob, len(_XSSI_PREFIX), (6,))
+                    if isinstance(entries, list):
+                        self._apply_place_entries(details, entries)
         except Exception:
             pass
 
         if not details["phone"]:
-            tel_match = re.search(r"tel:\+?[0-9][0-9\s().-]{6,}", html)
-            if tel_match:
-                details["phone"] = tel_match.group(0).split(":", 1)[-1].strip()
-
-        email_match = re.search(
-            r"mailto:([A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,})",
-            html,
-            re.IGNORECASE,
-        )
-        if email_match:
-            details["email"] = email_match.group(1)
+            phone = _find_link(html, html, "tel:", _TEL_RE)
+            if phone:
+                details["phone"] = phone.strip()
+
+        email = _find_email(html)
+        if email:
+            details["email"] = email
 
         return details
+
+    def _apply_place_entries(self, details: Dict[str, Optional[str]], entries: List[Any]) -> None:
+        """Pick the phone and website out of the place-data entry list."""
+        for entry in entries:
+            if not isinstance(entry, list):
+                continue
+
+            if len(entry) > 5 and isinstance(entry[5], list):
+                tel_meta = entry[5][0] if entry[5] else None
+                if isinstance(tel_meta, str) and tel_meta.startswith("tel:"):
+                    pretty = (
+                        entry[0]
+                        if entry and isinstance(entry[0], str)
+                        else tel_meta.split(":", 1)[-1]
+                    )
+                    details["phone"] = (
+                        pretty.replace("\u202a", "")
+                        .replace("\u202c", "")
+                        .strip()
+                    )
+
+            if entry and isinstance(entry[0], str):
+                candidate = unescape(entry[0])
+                if candidate.startswith("http"):
+                    lowered = candidate.lower()
+                    if "google.com/maps" in lowered:
+                        continue
+                    if lowered.startswith("https://maps.app.goo.gl"):
+                        continue
+                    if not details["website"]:
+                        details["website"] = candidate
+
+
+# Worker-side parsers for ``parse_executor``. They only need the parsing
+# methods, so they are built without a session and reused per process.
+_WORKER_PARSERS: Dict[str, GoogleMapsProvider] = {}
+
+
+def _worker_parser(parser_backend: str) -> GoogleMapsProvider:
+    parser = _WORKER_PARSERS.get(parser_backend)
+    if parser is None:
+        parser = GoogleMapsProvider(None, parser_backend=parser_backend)
+        _WORKER_PARSERS[parser_backend] = parser
+    return parser
+
+
+def parse_results_page(html: str, city: str, parser_backend: str = "lxml") -> List[Business]:
+    """
+    Parse a Google results page into listing records.
+
+    Module-level so it can run in a process pool; deduplication against the
+    rest of the search happens in the calling process.
+
+    Args:
+        html: Results page HTML
+        city: City name stored on each listing
+        parser_backend: "lxml" or "bs4"
+
+    Returns:
+        Every listing on the page, in page order
+    """
+    parser = _worker_parser(parser_backend)
+    if parser_backend == "lxml":
+        try:
+            return [business for business in parser._iter_listings_lxml(html, city) if business]
+        except Exception:
+            pass
+    return [business for business in parser._iter_listings_bs4(html, city) if business]
+
+
+def parse_place_page(html: str) -> Dict[str, Optional[str]]:
+    """
+    Extract phone, email and website from a Google place page.
+
+    Module-level so it can run in a process pool.
+
+    Args:
+        html: Place details page HTML
+
+    Returns:
+        Contact details dictionary
+    """
+    return _worker_parser("lxml")._extract_contact_details(html)
@@ -0,0 +1,83 @@
+"""
+Registry of lead providers and the names they can be selected by.
+"""
+from typing import Dict, Iterable, List, Type
+
+from .google_maps import GoogleMapsProvider
+
+
+# Canonical provider name -> provider class
+PROVIDERS: Dict[str, Type] = {}
+
+# Every accepted name (canonical or alias) -> canonical name
+_NAMES: Dict[str, str] = {}
+
+
+def register_provider(name: str, provider_class: Type, aliases: Iterable[str] = ()) -> None:
+    """
+    Make a provider selectable by name.
+
+    Args:
+        name: Canonical name (e.g. "google")
+        provider_class: Class taking a Decodo session as its first argument
+        aliases: Other names selecting the same provider
+
+    Raises:
+        ValueError: If a name already selects a different provider
+    """
+    name = name.strip().lower()
+    names = [name, *(alias.strip().lower() for alias in aliases)]
+    for candidate in names:
+        existing = _NAMES.get(candidate)
+        if existing is not None and existing != name:
+            raise ValueError(f"Provider name '{candidate}' is already used by '{existing}'")
+
+    PROVIDERS[name] = provider_class
+    for candidate in names:
+        _NAMES[candidate] = name
+
+
+def provider_names() -> List[str]:
+    """
+    Every accepted provider name, canonical names and aliases.
+
+    Returns:
+        Names in registration order
+    """
+    return list(_NAMES)
+
+
+def resolve_providers(names: Iterable[str]) -> List[str]:
+    """
+    Canonicalize a list of provider names.
+
+    Aliases are mapped to their canonical name and repeats are dropped, so
+    "google,gmaps" selects Google Maps once instead of running the same
+    paid search twice.
+
+    Args:
+        names: Provider names or aliases, case-insensitive
+
+    Returns:
+        Distinct canonical names, in order of first mention
+
+    Raises:
+        ValueError: If a name is not registered
+    """
+    requested = [name.strip().lower() for name in names if name.strip()]
+    unknown = [name for name in requested if name not in _NAMES]
+    if unknown:
+        raise ValueError(f"Invalid providers: {', '.join(unknown)}")
+
+    resolved: List[str] = []
+    classes = set()
+    for name in requested:
+        canonical = _NAMES[name]
+        provider_class = PROVIDERS[canonical]
+        if provider_class not in classes:
+            classes.add(provider_class)
+            resolved.append(canonical)
+    return resolved
+
+
+register_provider("google", GoogleMapsProvider, aliases=("googlemaps", "gmaps"))
@@ -31,6 +31,10 @@ setup(
         "python-dotenv>=1.0.0",
         "click>=8.1.0",
     ],
+    extras_require={
+        "async": ["aiohttp>=3.9.0"],
+        "fast": ["orjson>=3.9.0"],
+    },
     entry_points={
         "console_scripts": [
             "leads-finder=leads_finder.core.cli:main",
@@ -0,0 +1,127 @@
+"""
+Shared fixtures: a local stand-in for the Decodo scraper API.
+"""
+import json
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional
+
+import pytest
+
+from leads_finder.core.retry import CircuitBreaker, RetryPolicy
+from leads_finder.core.scraper_api_session import ScraperAPISession
+from leads_finder.providers.google_maps import GoogleMapsProvider
+
+
+class FakeDecodo:
+    """
+    Minimal Decodo scraper API served from a local thread.
+
+    Every POST is recorded in ``requests``, its headers in ``headers``.
+    Statuses queued with ``fail(...)`` are answered first, one per
+    request; after that each request gets a 200 whose body
+    ``content(payload)`` builds.
+    """
+
+    def __init__(self):
+        self.requests: List[Dict[str, Any]] = []
+        self.headers: List[Dict[str, str]] = []
+        self.content: Callable[[Dict[str, Any]], Any] = lambda payload: "<html></html>"
+        self._failures = deque()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v2/scrape"
+
+    def fail(self, *statuses: int, retry_after: Optional[str] = "0") -> None:
+        """Answer the next requests with these error statuses, in order."""
+        with self._lock:
+            self._failures.extend((status, retry_after) for status in statuses)
+
+    def _next(self, payload: Dict[str, Any], headers: Dict[str, str]):
+        with self._lock:
+            self.requests.append(payload)
+            self.headers.append(headers)
+            if self._failures:
+                return self._failures.popleft()
+        return 200, None
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out as separate writes; without this a
+            # keep-alive client waits out the peer's delayed ACK on each one.
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                status, retry_after = fake._next(payload, dict(self.headers))
+                if status == 200:
+                    body = {"results": [{"content": fake.content(payload), "status_code": 200}]}
+                else:
+                    body = {"message": f"status {status}"}
+                raw = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(raw)))
+                if status != 200 and retry_after is not None:
+                    self.send_header("Retry-After", retry_after)
+                self.end_headers()
+                self.wfile.write(raw)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "FakeDecodo":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def decodo():
+    """A running ``FakeDecodo`` server, stopped after the test."""
+    server = FakeDecodo().start()
+    try:
+        yield server
+    finally:
+        server.stop()
+
+
+@pytest.fixture
+def make_provider(decodo):
+    """
+    Factory for a ``GoogleMapsProvider`` talking to ``decodo``.
+
+    The session sends every request exactly once: no retries, no breaker
+    trips and no coalescing, so each test sees the failures it queues.
+    """
+    def make(place_cache=None, session_class=ScraperAPISession):
+        session = session_class(
+            username="user",
+            password="pass",
+            rps=0,
+            api_endpoint=decodo.url,
+            retry_policy=RetryPolicy(connect_retries=0, read_retries=0, status_retries=0, backoff_base=0.0),
+            circuit_breaker=CircuitBreaker(min_requests=1000),
+            coalesce=False,
+        )
+        return GoogleMapsProvider(session, place_cache=place_cache)
+
+    return make
@@ -0,0 +1,227 @@
+"""
+Reference copies of the original BeautifulSoup results parser and regex
+contact extractor, kept so parity tests can compare the current parsers
+against them on the same HTML.
+"""
+import json
+import re
+from html import unescape
+from typing import Any, Dict, List, Optional, Set
+
+from bs4 import BeautifulSoup
+
+
+def parse_results_html(html: str, city: str, limit: int, seen_ids: Set[Any]) -> List[Dict[str, Any]]:
+    """Parse HTML returned from Decodo into business dictionaries."""
+    soup = BeautifulSoup(html, "lxml")
+    listings = []
+
+    for block in soup.select("div.VkpGBb"):
+        business = parse_listing_block(block, city)
+        if business:
+            identifier = business.get("google_cid")
+            if not identifier:
+                identifier = (business["name"].lower(), business.get("address") or "")
+            if identifier in seen_ids:
+                continue
+            seen_ids.add(identifier)
+            listings.append(business)
+
+        if limit and len(listings) >= limit:
+            break
+
+    soup.decompose()
+    return listings
+
+
+def parse_listing_block(block, city: str) -> Optional[Dict[str, Any]]:
+    """Convert a single Google local listing block into a business dict."""
+    details = block.select_one("div.rllt__details")
+    if not details:
+        return None
+
+    divs = details.find_all("div")
+    if not divs:
+        return None
+
+    name = divs[0].get_text(" ", strip=True)
+    if not name:
+        return None
+
+    lines = [div.get_text(" ", strip=True) for div in divs[1:]]
+
+    rating = None
+    reviews_count = None
+    category = None
+
+    if lines:
+        rating_line = lines[0]
+        rating_match = re.search(r"([0-9]+(?:[\.,][0-9]+)?)", rating_line)
+        if rating_match:
+            try:
+                rating = float(rating_match.group(1).replace(",", "."))
+            except ValueError:
+                rating = None
+
+        reviews_match = re.search(r"\(([^)]+)\)", rating_line)
+        if reviews_match:
+            reviews_digits = re.sub(r"\D", "", reviews_match.group(1))
+            if reviews_digits:
+                try:
+                    reviews_count = int(reviews_digits)
+                except ValueError:
+                    reviews_count = None
+
+        if "·" in rating_line:
+            category = rating_line.split("·")[-1].strip()
+
+    distance = None
+    address = None
+    status = None
+    review_snippet = None
+
+    status_tokens = [
+        "open",
+        "closed",
+        "closes",
+        "opens",
+        "hours",
+        "aberto",
+        "fechado",
+    ]
+
+    for line in lines[1:]:
+        if not line:
+            continue
+
+        if line.startswith("\"") and not review_snippet:
+            review_snippet = line.strip('"')
+            continue
+
+        lowered = line.lower()
+
+        if "·" in line and not address:
+            parts = [part.strip() for part in line.split("·") if part.strip()]
+            if parts:
+                first = parts[0]
+                if any(unit in first for unit in ["km", "m", "mi", "ft"]):
+                    distance = first
+                    if len(parts) > 1:
+                        address = " · ".join(parts[1:])
+                        continue
+                address = " · ".join(parts)
+            continue
+
+        if not address and not any(token in lowered for token in status_tokens):
+            address = line
+            continue
+
+        if any(token in lowered for token in status_tokens):
+            status = line
+
+    cid = None
+    maps_url = None
+    link = block.select_one("a[data-cid]")
+    if link and link.has_attr("data-cid"):
+        cid = link["data-cid"]
+        maps_url = f"https://www.google.com/maps?cid={cid}"
+
+    return {
+        "name": name,
+        "category": category,
+        "phone": None,
+        "email": None,
+        "website": maps_url,
+        "rating": rating,
+        "reviews_count": reviews_count,
+        "address": address,
+        "city": city,
+        "country": None,
+        "lat": None,
+        "lon": None,
+        "source": "Google Maps",
+        "distance": distance,
+        "status": status,
+        "review_snippet": review_snippet,
+        "google_cid": cid,
+        "google_maps_url": maps_url,
+    }
+
+
+def extract_contact_details(html: Optional[str]) -> Dict[str, Optional[str]]:
+    """Parse phone, email, and website from a Google Maps place HTML page."""
+    details: Dict[str, Optional[str]] = {
+        "phone": None,
+        "email": None,
+        "website": None,
+    }
+
+    if not html:
+        return details
+
+    try:
+        init_match = re.search(
+            r"APP_INITIALIZATION_STATE=(.*?);window\.APP_FLAGS", html
+        )
+        if init_match:
+            state = json.loads(init_match.group(1))
+            blob = None
+            if isinstance(state, list) and len(state) > 3:
+                section = state[3]
+                if isinstance(section, list) and len(section) > 6:
+                    blob = section[6]
+            if isinstance(blob, str) and blob.startswith(")]}'"):
+                place_data = json.loads(blob[4:])
+                if (
+                    isinstance(place_data, list)
+                    and len(place_data) > 6
+                    and isinstance(place_data[6], list)
+                ):
+                    for entry in place_data[6]:
+                        if not isinstance(entry, list):
+                            continue
+
+                        if len(entry) > 5 and isinstance(entry[5], list):
+                            tel_meta = entry[5][0] if entry[5] else None
+                            if (
+                                isinstance(tel_meta, str)
+                                and tel_meta.startswith("tel:")
+                            ):
+                                pretty = (
+                                    entry[0]
+                                    if entry and isinstance(entry[0], str)
+                                    else tel_meta.split(":", 1)[-1]
+                                )
+                                details["phone"] = (
+                                    pretty.replace("\u202a", "")
+                                    .replace("\u202c", "")
+                                    .strip()
+                                )
+
+                        if entry and isinstance(entry[0], str):
+                            candidate = unescape(entry[0])
+                            if candidate.startswith("http"):
+                                lowered = candidate.lower()
+                                if "google.com/maps" in lowered:
+                                    continue
+                                if lowered.startswith("https://maps.app.goo.gl"):
+                                    continue
+                                if not details["website"]:
+                                    details["website"] = candidate
+    except Exception:
+        pass
+
+    if not details["phone"]:
+        tel_match = re.search(r"tel:\+?[0-9][0-9\s().-]{6,}", html)
+        if tel_match:
+            details["phone"] = tel_match.group(0).split(":", 1)[-1].strip()
+
+    email_match = re.search(
+        r"mailto:([A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,})",
+        html,
+        re.IGNORECASE,
+    )
+    if email_match:
+        details["email"] = email_match.group(1)
+
+    return details
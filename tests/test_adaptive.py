@@ -0,0 +1,102 @@
+"""
+AIMD controller behaviour against a throttling Decodo server.
+"""
+import pytest
+
+from leads_finder.core.adaptive import AdaptiveConcurrencyController
+from leads_finder.core.retry import CircuitBreaker, RetryPolicy
+from leads_finder.core.scraper_api_session import ScraperAPISession
+
+
+def make_session(decodo, rps, **adaptive_options):
+    # Loopback latencies jitter by orders of magnitude; only test status signals.
+    options = dict(
+        initial_limit=2, min_rate=1.0, max_rate=20.0, rate_step=5.0, latency_tolerance=1e6
+    )
+    options.update(adaptive_options)
+    return ScraperAPISession(
+        username="user",
+        password="pass",
+        rps=rps,
+        api_endpoint=decodo.url,
+        retry_policy=RetryPolicy(backoff_base=0.0, jitter=False),
+        circuit_breaker=CircuitBreaker(min_requests=1000),
+        coalesce=False,
+        adaptive=AdaptiveConcurrencyController(**options),
+    )
+
+
+def on_retry(session, record):
+    """Call ``record()`` after every retry and collect what it returns."""
+    seen = []
+
+    def hook(event):
+        if event["event"] == "retry":
+            seen.append(record())
+
+    session.add_hook(hook)
+    return seen
+
+
+def scrape(session, n=1):
+    for i in range(n):
+        session.scrape("universal", url=f"https://example.com/{i}")
+
+
+@pytest.mark.parametrize("status, outcome", [(429, "throttled"), (503, "error")])
+def test_backs_off_on_congestion_then_recovers(decodo, status, outcome):
+    session = make_session(decodo, rps=20.0)
+    adaptive = session.adaptive
+    rates_at_retry = on_retry(
+        session, lambda: (adaptive.rate, adaptive.limit, session.rate_limiter.rate)
+    )
+
+    # Enough healthy requests to establish a latency baseline.
+    scrape(session, 6)
+    assert adaptive.rate == 20.0
+    limit_before = adaptive.limit
+
+    decodo.fail(status)
+    scrape(session)
+
+    assert rates_at_retry == [(10.0, max(limit_before // 2, 1), 10.0)]
+    assert adaptive.snapshot()["outcomes"][outcome] == 1
+    assert len(decodo.requests) == 8
+
+    scrape(session, 6)
+    assert adaptive.rate == 20.0
+    assert session.rate_limiter.rate == 20.0
+    assert adaptive.limit > rates_at_retry[0][1]
+    assert adaptive.snapshot()["in_flight"] == 0
+    session.close()
+
+
+def test_repeated_throttling_keeps_backing_off(decodo):
+    session = make_session(decodo, rps=20.0)
+    adaptive = session.adaptive
+    rates_at_retry = on_retry(session, lambda: adaptive.rate)
+
+    scrape(session, 6)
+    decodo.fail(429, 429, 429)
+    scrape(session)
+
+    assert len(rates_at_retry) == 3
+    assert rates_at_retry == sorted(rates_at_retry, reverse=True)
+    assert rates_at_retry[-1] < 10.0
+    session.close()
+
+
+def test_unlimited_rate_stays_unlimited_until_first_backoff(decodo):
+    session = make_session(decodo, rps=0, max_rate=10.0)
+    adaptive = session.adaptive
+
+    scrape(session, 6)
+    assert adaptive.rate is None
+    assert session.rate_limiter.rate == 0
+
+    decodo.fail(429)
+    scrape(session)
+    assert adaptive.rate is not None
+    assert session.rate_limiter.rate == adaptive.rate
+    assert adaptive.rate <= 10.0
+    session.close()
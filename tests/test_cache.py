@@ -0,0 +1,25 @@
+"""
+Response cache scoping.
+"""
+from leads_finder.core.cache import ResponseCache
+from leads_finder.core.scraper_api_session import ScraperAPISession
+
+
+def make_session(decodo, cache, password):
+    return ScraperAPISession(
+        username="user", password=password, rps=0, api_endpoint=decodo.url, cache=cache
+    )
+
+
+def test_cached_responses_are_scoped_to_credentials(decodo, tmp_path):
+    cache = ResponseCache(path=str(tmp_path / "responses.sqlite3"))
+    first = make_session(decodo, cache, "first")
+    again = make_session(decodo, cache, "first")
+    other = make_session(decodo, cache, "second")
+
+    for session in (first, again, other):
+        session.scrape("universal", url="https://example.com/")
+        session.close()
+
+    assert len(decodo.requests) == 2
+    assert cache.stats()["entries"] == 2
@@ -0,0 +1,51 @@
+"""
+Deduplication rules, batch and incremental.
+"""
+import random
+
+from leads_finder.core.dedupe import Deduplicator, deduplicate_businesses
+
+NAMES = [
+    "Blue Bottle Coffee", "Blue Bottle Cafe", "Blue Botle Coffee", "Joe's Pizza",
+    "Joes Pizza", "Joe's Pizzeria", "Austin Dental Care", "Austin Dental", "A",
+    "", "Smile Dental Studio", "Smile Dental Studios", "The Coffee House",
+    "Coffee House", "Tacodeli", "Taco Deli",
+]
+CITIES = ["Austin", "austin", "Dallas", None]
+PHONES = [None, "+1 512-555-0100", "(512) 555 0100", "+1 214 555 0199"]
+
+
+def random_businesses(rng, count):
+    return [
+        {
+            "name": rng.choice(NAMES),
+            "city": rng.choice(CITIES),
+            "phone": rng.choice(PHONES),
+            "source": f"row-{i}",
+        }
+        for i in range(count)
+    ]
+
+
+def test_fuzzy_match_only_within_a_city():
+    businesses = [
+        {"name": "Blue Bottle Coffee", "city": "Austin"},
+        {"name": "Blue Botle Coffee", "city": "Austin"},
+        {"name": "Blue Botle Coffee", "city": "Dallas"},
+    ]
+
+    assert [b["city"] for b in deduplicate_businesses(businesses)] == ["Austin", "Dallas"]
+
+
+def test_deduplicator_keeps_what_deduplicate_businesses_keeps():
+    rng = random.Random(7)
+    for _ in range(50):
+        businesses = random_businesses(rng, rng.randint(0, 60))
+        deduplicator = Deduplicator()
+
+        kept = deduplicator.add_all(businesses)
+
+        expected = deduplicate_businesses(businesses)
+        assert deduplicator.businesses == expected
+        assert kept == len(expected)
+        assert deduplicator.duplicates == len(businesses) - len(expected)
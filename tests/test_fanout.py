@@ -0,0 +1,89 @@
+"""
+Merging concurrent provider streams.
+"""
+import threading
+import time
+
+import pytest
+
+from leads_finder.core.fanout import merge_streams
+
+
+class FakeProvider:
+    """Yields ``count`` leads, one every ``delay`` seconds, from its own thread."""
+
+    def __init__(self, name, count, delay=0.01, fail_after=None):
+        self.name = name
+        self.count = count
+        self.delay = delay
+        self.fail_after = fail_after
+        self.threads = set()
+        self.produced = 0
+        self.closed = False
+
+    def iter_search(self):
+        try:
+            for i in range(self.count):
+                if self.fail_after is not None and i == self.fail_after:
+                    raise RuntimeError(f"{self.name} failed")
+                time.sleep(self.delay)
+                self.threads.add(threading.get_ident())
+                self.produced += 1
+                yield {"name": f"{self.name}-{i}"}
+        finally:
+            self.closed = True
+
+
+def test_streams_run_concurrently():
+    google = FakeProvider("google", 10, delay=0.05)
+    other = FakeProvider("other", 10, delay=0.05)
+
+    started = time.monotonic()
+    merged = list(merge_streams({"google": google.iter_search, "other": other.iter_search}))
+    elapsed = time.monotonic() - started
+
+    assert sorted(item["name"] for _, item in merged) == sorted(
+        [f"google-{i}" for i in range(10)] + [f"other-{i}" for i in range(10)]
+    )
+    assert google.threads.isdisjoint(other.threads)
+    assert threading.get_ident() not in google.threads | other.threads
+    # Run one after the other the streams would take a full second.
+    assert elapsed < 0.8
+
+
+def test_failing_stream_reports_error_and_others_continue():
+    google = FakeProvider("google", 5)
+    broken = FakeProvider("broken", 5, fail_after=2)
+    errors = []
+
+    merged = list(merge_streams(
+        {"google": google.iter_search, "broken": broken.iter_search},
+        on_error=lambda name, error: errors.append((name, str(error))),
+    ))
+
+    assert errors == [("broken", "broken failed")]
+    assert sum(1 for name, _ in merged if name == "google") == 5
+    assert sum(1 for name, _ in merged if name == "broken") == 2
+
+
+def test_failing_stream_without_handler_raises():
+    streams = {
+        "google": FakeProvider("google", 5).iter_search,
+        "broken": FakeProvider("broken", 5, fail_after=0).iter_search,
+    }
+
+    with pytest.raises(RuntimeError, match="broken failed"):
+        list(merge_streams(streams))
+
+
+def test_closing_early_stops_every_stream():
+    google = FakeProvider("google", 1000)
+    other = FakeProvider("other", 1000)
+
+    merged = merge_streams({"google": google.iter_search, "other": other.iter_search})
+    for _ in range(4):
+        next(merged)
+    merged.close()
+
+    assert google.closed and other.closed
+    assert google.produced < 1000 and other.produced < 1000
@@ -0,0 +1,51 @@
+"""
+Hex tiling: the tiles cover the whole search area.
+"""
+import math
+
+import pytest
+
+from leads_finder.core.geo import KM_PER_DEGREE_LATITUDE, hex_tiles, subdivide
+
+LATITUDE, LONGITUDE = 30.27, -97.74
+
+
+def planar(tile):
+    """Tile center as km offsets from the area center, in the projection hex_tiles uses."""
+    km_per_degree_lng = KM_PER_DEGREE_LATITUDE * math.cos(math.radians(LATITUDE))
+    return (
+        (tile.longitude - LONGITUDE) * km_per_degree_lng,
+        (tile.latitude - LATITUDE) * KM_PER_DEGREE_LATITUDE,
+    )
+
+
+def uncovered(radius_km, tiles, steps=120):
+    """Sample points on a grid over the disc; return those no tile reaches."""
+    centers = [(planar(tile), tile.radius_km) for tile in tiles]
+    missed = []
+    for i in range(steps + 1):
+        for j in range(steps + 1):
+            x = radius_km * (2 * i / steps - 1)
+            y = radius_km * (2 * j / steps - 1)
+            if math.hypot(x, y) > radius_km:
+                continue
+            # 1 m slack for the coordinates rounded to 6 decimals.
+            if not any(math.hypot(x - cx, y - cy) <= r + 1e-3 for (cx, cy), r in centers):
+                missed.append((x, y))
+    return missed
+
+
+@pytest.mark.parametrize("radius_km, tile_radius_km", [(20, 5), (100, 10), (15, 4), (10, 5), (9, 2.5)])
+def test_tiles_cover_the_whole_area(radius_km, tile_radius_km):
+    tiles = hex_tiles(LATITUDE, LONGITUDE, radius_km, tile_radius_km)
+
+    assert uncovered(radius_km, tiles) == []
+    # Every tile overlaps the area.
+    assert all(math.hypot(*planar(tile)) < radius_km + tile_radius_km for tile in tiles)
+
+
+def test_default_tiling_and_subdivision_keep_seven_tiles():
+    (center, *ring) = hex_tiles(LATITUDE, LONGITUDE, 10, 5)
+
+    assert len(ring) == 6
+    assert len(subdivide(center)) == 7
@@ -0,0 +1,102 @@
+"""
+Parity of the results and place-page parsers with the original implementations.
+"""
+import glob
+import os
+
+import pytest
+
+import legacy_google_maps as legacy
+from leads_finder.providers.google_maps import GoogleMapsProvider
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+RESULTS_PAGES = sorted(glob.glob(os.path.join(FIXTURES, "results_page_*.html")))
+PLACE_PAGES = sorted(glob.glob(os.path.join(FIXTURES, "place_*.html")))
+XML_DECLARATION = '<?xml version="1.0" encoding="utf-8"?>\n'
+
+
+def read(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def assert_same_businesses(expected, actual):
+    assert len(actual) == len(expected)
+    for old, new in zip(expected, actual):
+        for field, value in old.items():
+            assert new[field] == value, f"{old['name']}: {field}"
+
+
+@pytest.mark.parametrize("backend", ["lxml", "bs4"])
+@pytest.mark.parametrize("limit", [0, 7])
+@pytest.mark.parametrize("path", RESULTS_PAGES, ids=os.path.basename)
+def test_results_parser_matches_original(path, limit, backend):
+    html = read(path)
+    provider = GoogleMapsProvider(None, parser_backend=backend)
+
+    expected = legacy.parse_results_html(html, "Toronto", limit, set())
+    actual = provider._parse_results_html(html, "Toronto", limit, set())
+
+    assert expected
+    assert_same_businesses(expected, actual)
+
+
+@pytest.mark.filterwarnings("ignore::bs4.XMLParsedAsHTMLWarning")
+@pytest.mark.parametrize("path", RESULTS_PAGES, ids=os.path.basename)
+def test_lxml_parser_falls_back_to_bs4(path):
+    html = XML_DECLARATION + read(path)
+    provider = GoogleMapsProvider(None, parser_backend="lxml")
+    with pytest.raises(ValueError):
+        list(provider._iter_listings_lxml(html, "Toronto"))
+
+    expected = legacy.parse_results_html(html, "Toronto", 0, set())
+    page_keys = []
+    actual = provider._parse_results_html(html, "Toronto", 0, set(), page_keys)
+
+    assert_same_businesses(expected, actual)
+    # Keys recorded by the failed lxml pass are discarded, not doubled.
+    plain_keys = []
+    provider._parse_results_html(read(path), "Toronto", 0, set(), plain_keys)
+    assert page_keys == plain_keys
+
+
+def test_results_parser_skips_listings_seen_on_earlier_pages():
+    first, second = (read(path) for path in RESULTS_PAGES)
+    provider = GoogleMapsProvider(None)
+    legacy_seen, seen = set(), set()
+
+    for html in (first, second, first):
+        expected = legacy.parse_results_html(html, "Toronto", 0, legacy_seen)
+        actual = provider._parse_results_html(html, "Toronto", 0, seen)
+        assert_same_businesses(expected, actual)
+
+    assert seen == legacy_seen
+
+
+@pytest.mark.parametrize("path", PLACE_PAGES, ids=os.path.basename)
+def test_contact_extractor_matches_original(path):
+    html = read(path)
+
+    expected = legacy.extract_contact_details(html)
+
+    assert GoogleMapsProvider(None)._extract_contact_details(html) == expected
+    assert any(expected.values())
+
+
+@pytest.mark.parametrize("html", [
+    None,
+    "",
+    "tel:abc tel:12 tel:+1 555 123 4567 mailto:bad mailto:x@y MailTo:ok@ex.com",
+    "İstanbul MAILTO:a@b.cc tel:555-1234567",
+    'APP_INITIALIZATION_STATE=[1,2,3,[0,1,2,3,4,5,"nope"]];window.APP_FLAGS',
+    'APP_INITIALIZATION_STATE=[ 1 , 2,3 , [ 0,1,2,3,4,5 , '
+    '")]}\'\\n[0,1,2,3,4,5,[[\\"https://a.example\\"]]]" ] ];window.APP_FLAGS',
+    "APP_INITIALIZATION_STATE=[[],[],[],[]];window.APP_FLAGS mailto:q@w.org",
+    "APP_INITIALIZATION_STATE=[];window.APP_FLAGS",
+    'APP_INITIALIZATION_STATE={"a":1};window.APP_FLAGS',
+    "APP_INITIALIZATION_STATE=[1,\n2];window.APP_FLAGS tel:+44 20 7946 0000",
+])
+def test_contact_extractor_edge_cases_match_original(html):
+    expected = legacy.extract_contact_details(html)
+
+    assert GoogleMapsProvider(None)._extract_contact_details(html) == expected
@@ -0,0 +1,93 @@
+"""
+On-demand enrichment: idle workers release the session, close() stops them,
+failed rows are reported and retried.
+"""
+import threading
+
+from leads_finder.core.business import Business
+from leads_finder.core.lazy_enrich import LazyEnricher
+
+
+def make_rows(count):
+    return [Business(name=f"Business {index}", place_id=f"place-{index}") for index in range(count)]
+
+
+def fill_phone(business):
+    business["phone"] = "+1 555 0100"
+
+
+def test_session_is_released_when_the_workers_go_idle():
+    idle = threading.Event()
+    enricher = LazyEnricher(make_rows(3), fill_phone, idle_timeout=0.05, on_idle=idle.set)
+
+    enricher.request([0, 1])
+    assert enricher.wait([0, 1], timeout=5)
+    assert idle.wait(5)
+    assert enricher.rows([0, 1])[0]["phone"] == "+1 555 0100"
+
+    # A later request starts new workers and they go idle again.
+    idle.clear()
+    enricher.request([2])
+    assert enricher.wait([2], timeout=5)
+    assert idle.wait(5)
+    assert enricher.enriched == 3
+
+
+def test_close_stops_the_workers_and_releases_the_session():
+    started = threading.Event()
+    release = threading.Event()
+    idle = threading.Event()
+
+    def slow(business):
+        started.set()
+        release.wait(5)
+        fill_phone(business)
+
+    enricher = LazyEnricher(make_rows(4), slow, workers=1, idle_timeout=60, on_idle=idle.set)
+    enricher.request(range(4))
+    assert started.wait(5)
+
+    enricher.close()
+    assert not idle.is_set()  # the row being enriched finishes first
+    release.set()
+    assert idle.wait(5)
+
+    enricher.request([1, 2])
+    assert enricher.enriched == 1
+    assert enricher.pending(range(4)) == [1, 2, 3]
+
+
+def test_close_without_workers_releases_the_session_at_once():
+    closed = []
+    enricher = LazyEnricher(make_rows(2), fill_phone, on_idle=lambda: closed.append(True))
+
+    enricher.close()
+    enricher.close()
+
+    assert closed == [True]
+
+
+def test_failed_rows_are_reported_and_retried_on_request():
+    attempts = []
+
+    def flaky(business):
+        attempts.append(business["name"])
+        if attempts.count(business["name"]) == 1 and business["name"] == "Business 1":
+            raise RuntimeError("lookup failed")
+        fill_phone(business)
+
+    enricher = LazyEnricher(make_rows(3), flaky, idle_timeout=0.05)
+
+    enricher.request(range(3))
+    assert enricher.wait(range(3), timeout=5)
+    assert enricher.failed(range(3)) == [1]
+    assert enricher.pending(range(3)) == []
+    assert enricher.enriched == 2
+    assert enricher.rows([1])[1]["phone"] is None
+
+    enricher.request([0, 1])
+    assert enricher.wait([1], timeout=5)
+    assert enricher.failed(range(3)) == []
+    assert enricher.rows([1])[1]["phone"] == "+1 555 0100"
+    assert enricher.enriched == 3
+    assert attempts.count("Business 0") == 1
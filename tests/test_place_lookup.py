@@ -0,0 +1,114 @@
+"""
+Place-details lookups: which failures are negatively cached.
+"""
+import asyncio
+
+import pytest
+
+from leads_finder.core.budget import RequestBudget
+from leads_finder.core.business import Business
+from leads_finder.core.place_cache import PlaceDetailsCache
+from leads_finder.core.scraper_api_session import DecodoUnauthorizedError
+
+PLACE_PAGE = '<html><a href="tel:+1 555 123 4567">Call</a></html>'
+
+
+@pytest.fixture
+def place_cache(tmp_path):
+    return PlaceDetailsCache(path=str(tmp_path / "places.sqlite3"))
+
+
+def listing(cid="123"):
+    return Business(name="Cafe", city="Austin", google_cid=cid)
+
+
+def test_successful_lookup_is_cached(decodo, place_cache, make_provider):
+    decodo.content = lambda payload: PLACE_PAGE
+    provider = make_provider(place_cache)
+    business = listing()
+
+    assert provider.enrich_business(business)
+    assert business["phone"] == "+1 555 123 4567"
+    assert place_cache.get("123")["phone"] == "+1 555 123 4567"
+
+
+@pytest.mark.parametrize("status", [404, 422])
+def test_upstream_rejection_is_negatively_cached(decodo, place_cache, status, make_provider):
+    provider = make_provider(place_cache)
+    decodo.fail(status)
+
+    assert provider.enrich_business(listing())
+    assert place_cache.get("123") == {}
+
+
+def test_empty_page_is_negatively_cached(decodo, place_cache, make_provider):
+    decodo.content = lambda payload: ""
+    provider = make_provider(place_cache)
+
+    assert provider.enrich_business(listing())
+    assert place_cache.get("123") == {}
+
+
+@pytest.mark.parametrize("status", [403, 429, 503])
+def test_transient_failure_is_not_cached(decodo, place_cache, status, make_provider):
+    provider = make_provider(place_cache)
+    decodo.fail(status)
+
+    assert provider.enrich_business(listing())
+    assert place_cache.get("123") is None
+
+
+def test_transport_error_is_not_cached(decodo, place_cache, make_provider):
+    decodo.stop()
+    provider = make_provider(place_cache)
+
+    assert provider.enrich_business(listing())
+    assert place_cache.get("123") is None
+
+
+def test_unauthorized_propagates(decodo, place_cache, make_provider):
+    provider = make_provider(place_cache)
+    decodo.fail(401)
+
+    with pytest.raises(DecodoUnauthorizedError):
+        provider.enrich_business(listing())
+    assert place_cache.get("123") is None
+
+
+def test_spent_budget_still_fills_cached_places(decodo, place_cache, make_provider):
+    decodo.content = lambda payload: PLACE_PAGE
+    provider = make_provider(place_cache)
+    place_cache.set("cached", {"phone": "+1 555 000 0000"})
+    businesses = [listing("first"), listing("over-budget"), listing("cached")]
+
+    enriched = list(provider._iter_enriched(
+        businesses, "com", "en-US", cache={}, budget=RequestBudget(max_requests=1)
+    ))
+
+    assert [business["phone"] for business in enriched] == [
+        "+1 555 123 4567", None, "+1 555 000 0000",
+    ]
+    assert len(decodo.requests) == 1
+
+
+def test_async_lookup_failures(decodo, place_cache, make_provider):
+    pytest.importorskip("aiohttp")
+    from leads_finder.core.async_scraper_api_session import AsyncScraperAPISession
+
+    provider = make_provider(place_cache, AsyncScraperAPISession)
+
+    async def lookup(cid):
+        try:
+            return await provider._fetch_contact_details_async(cid, "com", "en-US")
+        finally:
+            await provider.session.close()
+
+    decodo.fail(404, 503, 401)
+    assert asyncio.run(lookup("404")) == {}
+    assert asyncio.run(lookup("503")) == {}
+    with pytest.raises(DecodoUnauthorizedError):
+        asyncio.run(lookup("401"))
+
+    assert place_cache.get("404") == {}
+    assert place_cache.get("503") is None
+    assert place_cache.get("401") is None
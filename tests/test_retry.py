@@ -0,0 +1,162 @@
+"""
+Retries and the circuit breaker against a failing Decodo server.
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+import requests
+
+from leads_finder.core.retry import CircuitBreaker, RetryPolicy
+from leads_finder.core.scraper_api_session import ScraperAPISession
+
+
+def make_session(decodo, breaker=None, session_class=ScraperAPISession, **retry_options):
+    options = dict(backoff_base=0.0, jitter=False)
+    options.update(retry_options)
+    return session_class(
+        username="user",
+        password="pass",
+        rps=0,
+        api_endpoint=decodo.url,
+        retry_policy=RetryPolicy(**options),
+        circuit_breaker=breaker or CircuitBreaker(min_requests=1000),
+        coalesce=False,
+    )
+
+
+def scrape(session, i=0):
+    return session.scrape("universal", url=f"https://example.com/{i}")
+
+
+def trip(breaker):
+    while breaker.state != CircuitBreaker.OPEN:
+        breaker.record_failure()
+
+
+def test_retries_a_server_error_then_succeeds(decodo):
+    session = make_session(decodo)
+    decodo.fail(502, 503)
+
+    assert scrape(session)["results"]
+    assert len(decodo.requests) == 3
+
+
+def test_honors_retry_after(decodo):
+    session = make_session(decodo)
+    decodo.fail(429, retry_after="0.3")
+
+    started = time.monotonic()
+    scrape(session)
+
+    assert time.monotonic() - started >= 0.25
+    assert len(decodo.requests) == 2
+
+
+def test_gives_up_after_the_retry_limit(decodo):
+    session = make_session(decodo, status_retries=1)
+    decodo.fail(502, 502)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        scrape(session)
+    assert len(decodo.requests) == 2
+
+
+def test_client_errors_are_not_retried(decodo):
+    breaker = CircuitBreaker(min_requests=1)
+    session = make_session(decodo, breaker)
+    decodo.fail(404)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        scrape(session)
+    assert len(decodo.requests) == 1
+    # A rejected request says nothing about upstream health.
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_breaker_opens_probes_and_closes(decodo):
+    breaker = CircuitBreaker(failure_threshold=0.5, window=2, min_requests=2, cooldown=0.2)
+    session = make_session(decodo, breaker, status_retries=0)
+    decodo.fail(502, 502)
+
+    for i in range(2):
+        with pytest.raises(requests.exceptions.HTTPError):
+            scrape(session, i)
+    assert breaker.state == CircuitBreaker.OPEN
+
+    # The next caller waits out the cooldown, then its probe closes the breaker.
+    decodo.fail(502)
+    started = time.monotonic()
+    with pytest.raises(requests.exceptions.HTTPError):
+        scrape(session, 2)
+    assert time.monotonic() - started >= 0.15
+    assert breaker.state == CircuitBreaker.OPEN  # the failed probe re-opened it
+
+    scrape(session, 3)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_released_probe_lets_the_next_caller_probe():
+    breaker = CircuitBreaker(min_requests=1, cooldown=0.0)
+    trip(breaker)
+
+    assert breaker.before_request() == 0.0  # the probe
+    assert breaker.before_request() > 0
+    breaker.release_probe()
+
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.before_request() == 0.0
+
+
+def test_interrupted_probe_does_not_wedge_the_breaker(decodo, monkeypatch):
+    breaker = CircuitBreaker(min_requests=1, cooldown=0.0)
+    session = make_session(decodo, breaker)
+    trip(breaker)
+
+    def interrupted():
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(session, "_rate_limit", interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        scrape(session)
+    monkeypatch.undo()
+
+    # A wedged breaker would keep the next caller waiting forever.
+    results = []
+    caller = threading.Thread(target=lambda: results.append(scrape(session)), daemon=True)
+    caller.start()
+    caller.join(timeout=5)
+    assert results and results[0]["results"]
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_cancelled_async_probe_does_not_wedge_the_breaker(decodo):
+    pytest.importorskip("aiohttp")
+    from leads_finder.core.async_scraper_api_session import AsyncScraperAPISession
+
+    breaker = CircuitBreaker(min_requests=1, cooldown=0.0)
+    session = make_session(decodo, breaker, AsyncScraperAPISession)
+    trip(breaker)
+
+    async def run():
+        try:
+            rate_limit = session._rate_limit
+
+            async def stalled():
+                await asyncio.sleep(60)
+
+            session._rate_limit = stalled
+            probe = asyncio.ensure_future(scrape(session))
+            await asyncio.sleep(0.05)
+            probe.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await probe
+
+            session._rate_limit = rate_limit
+            return await asyncio.wait_for(scrape(session, 1), timeout=5)
+        finally:
+            await session.close()
+
+    assert asyncio.run(run())["results"]
+    assert breaker.state == CircuitBreaker.CLOSED
@@ -0,0 +1,31 @@
+"""
+Session construction and the shared session base class.
+"""
+import pytest
+
+from leads_finder.core.scraper_api_session import BaseScraperAPISession, ScraperAPISession
+
+
+def test_base_session_requires_scrape():
+    class Incomplete(BaseScraperAPISession):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete(username="user", password="pass")
+
+    ScraperAPISession(username="user", password="pass").close()
+
+
+@pytest.mark.filterwarnings("error::DeprecationWarning")
+def test_async_session_sends_basic_auth_without_deprecated_api(decodo):
+    pytest.importorskip("aiohttp")
+    import asyncio
+
+    from leads_finder.core.async_scraper_api_session import AsyncScraperAPISession
+
+    async def scrape():
+        async with AsyncScraperAPISession(username="user", password="pass", api_endpoint=decodo.url) as session:
+            return await session.scrape("universal", url="https://example.com")
+
+    assert asyncio.run(scrape())["results"]
+    assert decodo.headers[0]["Authorization"] == "Basic dXNlcjpwYXNz"
@@ -0,0 +1,143 @@
+"""
+Coalescing of identical in-flight calls.
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from leads_finder.core.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def test_async_waiter_survives_leader_cancellation():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "page"
+
+    async def main():
+        leader = asyncio.ensure_future(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await waiter
+
+    assert asyncio.run(main()) == ("page", True)
+    assert calls == [1]
+    assert flight.in_flight() == 0
+
+
+def test_async_call_is_cancelled_when_every_caller_is():
+    flight = AsyncSingleFlight()
+    finished = []
+
+    async def fetch():
+        await asyncio.sleep(1)
+        finished.append(1)
+
+    async def main():
+        callers = [asyncio.ensure_future(flight.do("key", fetch)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+        await asyncio.sleep(0)
+        return flight.in_flight()
+
+    assert asyncio.run(main()) == 0
+    assert finished == []
+
+
+def test_async_error_is_shared():
+    flight = AsyncSingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def main():
+        return await asyncio.gather(
+            flight.do("key", fetch), flight.do("key", fetch), return_exceptions=True
+        )
+
+    results = asyncio.run(main())
+    assert [type(result) for result in results] == [ValueError, ValueError]
+
+
+def test_interrupted_leader_makes_waiters_retry():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+    outcomes = {}
+
+    def interrupted():
+        calls.append("leader")
+        started.set()
+        release.wait()
+        raise KeyboardInterrupt
+
+    def fetch():
+        calls.append("waiter")
+        return "page"
+
+    def lead():
+        try:
+            flight.do("key", interrupted)
+        except KeyboardInterrupt:
+            outcomes["leader"] = "interrupted"
+
+    def wait():
+        outcomes["waiter"] = flight.do("key", fetch)
+
+    leader = threading.Thread(target=lead)
+    leader.start()
+    started.wait()
+    waiter = threading.Thread(target=wait)
+    waiter.start()
+    time.sleep(0.05)  # let the waiter block on the leader's call
+    release.set()
+    leader.join()
+    waiter.join()
+
+    assert outcomes == {"leader": "interrupted", "waiter": ("page", False)}
+    assert calls == ["leader", "waiter"]
+
+
+def test_error_is_shared_between_threads():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    errors = []
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait()
+        raise ValueError("boom")
+
+    def call():
+        try:
+            flight.do("key", fetch)
+        except ValueError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=call) for _ in range(2)]
+    threads[0].start()
+    started.wait()
+    threads[1].start()
+    time.sleep(0.05)  # let the second thread block on the first one's call
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(errors) == 2
+    assert calls == [1]
@@ -0,0 +1,125 @@
+"""
+Tiled searches: streaming, shared enrichment path, async variant and resume.
+"""
+import asyncio
+import re
+import zlib
+from collections import Counter
+
+import pytest
+
+from leads_finder.core.checkpoint import CheckpointStore
+from leads_finder.core.place_cache import PlaceDetailsCache
+
+PLACE_PAGE = '<html><a href="tel:+1 555 123 4567">Call</a></html>'
+
+LISTING = (
+    '<div class="VkpGBb"><div class="rllt__details"><div><span>{name}</span></div>'
+    '<div><span>{name} Street</span></div></div><a data-cid="{cid}">x</a></div>'
+)
+
+# Listed by every tile, so the merge must drop the repeats.
+SHARED_CID = "9000000000000001"
+
+SEARCH = dict(limit=100, city="Austin", tile_radius_km=1.0, max_depth=0, max_tile_pages=2)
+
+
+def results_page(payload):
+    """Page 1 of a tile lists two places of its own plus the shared one; page 2 is empty."""
+    if payload["target"] != "google_maps":
+        return PLACE_PAGE
+    if payload["page_from"] != "1":
+        return "<html></html>"
+    lat, lng = re.findall(r"-?\d+\.\d+", payload["geo"])[:2]
+    tile = zlib.crc32(f"{lat},{lng}".encode())
+    cids = [f"1{tile:012d}001", f"1{tile:012d}002", SHARED_CID]
+    return "<html><body>" + "".join(
+        LISTING.format(name=f"Place {cid}", cid=cid) for cid in cids
+    ) + "</body></html>"
+
+
+def lookups(decodo):
+    return Counter(
+        re.search(r"cid=(\d+)", payload["url"]).group(1)
+        for payload in decodo.requests
+        if payload["target"] == "google"
+    )
+
+
+def test_tiles_stream_enriched_unique_leads(decodo, tmp_path, make_provider):
+    decodo.content = results_page
+    place_cache = PlaceDetailsCache(path=str(tmp_path / "places.sqlite3"))
+    place_cache.set(SHARED_CID, {"phone": "+1 555 000 0000"})
+    provider = make_provider(place_cache)
+
+    stream = provider.iter_search_tiled("cafe", 30.27, -97.74, 1.8, **SEARCH)
+    first = next(stream)
+    assert first["phone"]
+    leads = [first, *stream]
+
+    cids = [business["google_cid"] for business in leads]
+    assert len(cids) == len(set(cids)) == 2 * 7 + 1
+    assert all(business["phone"] for business in leads)
+    # The shared listing comes from the place cache; every other CID is fetched once.
+    assert SHARED_CID not in lookups(decodo)
+    assert set(lookups(decodo).values()) == {1}
+    assert len(lookups(decodo)) == 2 * 7
+
+
+def test_budget_covers_pages_and_lookups(decodo, make_provider):
+    decodo.content = results_page
+    provider = make_provider()
+
+    leads = provider.search_tiled("cafe", 30.27, -97.74, 1.8, max_requests=10, **SEARCH)
+
+    assert len(decodo.requests) <= 10
+    assert sum(lookups(decodo).values()) == sum(1 for business in leads if business["phone"])
+
+
+def test_async_tiles_match_the_sync_search(decodo, make_provider):
+    pytest.importorskip("aiohttp")
+    from leads_finder.core.async_scraper_api_session import AsyncScraperAPISession
+
+    decodo.content = results_page
+    expected = make_provider().search_tiled("cafe", 30.27, -97.74, 1.8, **SEARCH)
+    decodo.requests.clear()
+    provider = make_provider(session_class=AsyncScraperAPISession)
+
+    async def search():
+        try:
+            return await provider.search_tiled_async("cafe", 30.27, -97.74, 1.8, **SEARCH)
+        finally:
+            await provider.session.close()
+
+    leads = asyncio.run(search())
+
+    assert {business["google_cid"] for business in leads} == {
+        business["google_cid"] for business in expected
+    }
+    assert all(business["phone"] for business in leads)
+    assert set(lookups(decodo).values()) == {1}
+
+
+def test_resume_finishes_saved_leads_without_repeating_lookups(decodo, tmp_path, make_provider):
+    decodo.content = results_page
+    store = CheckpointStore(str(tmp_path / "checkpoints.sqlite3"))
+    # Lookups already paid for when the first run stopped are kept by the place cache.
+    provider = make_provider(PlaceDetailsCache(path=str(tmp_path / "places.sqlite3")))
+
+    stream = provider.iter_search_tiled(
+        "cafe", 30.27, -97.74, 1.8, tile_concurrency=1,
+        checkpoint=store.open("tiled", {}, resume=False), **SEARCH
+    )
+    first = next(stream)
+    stream.close()
+
+    checkpoint = store.open("tiled", {})
+    assert not checkpoint.completed
+    leads = list(provider.iter_search_tiled("cafe", 30.27, -97.74, 1.8, checkpoint=checkpoint, **SEARCH))
+
+    assert leads[0]["google_cid"] == first["google_cid"]
+    assert len({business["google_cid"] for business in leads}) == len(leads) == 2 * 7 + 1
+    assert all(business["phone"] for business in leads)
+    assert set(lookups(decodo).values()) == {1}
+    assert store.open("tiled", {}).completed
+    store.close()
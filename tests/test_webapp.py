@@ -0,0 +1,106 @@
+"""
+Web app search ids, checkpoint ownership and pruning.
+"""
+import time
+
+import pytest
+
+from leads_finder.core.checkpoint import CheckpointStore
+
+webapp = pytest.importorskip("webapp.app")
+
+OWNER = {"X-Decodo-Username": "owner", "X-Decodo-Password": "secret"}
+OTHER = {"X-Decodo-Username": "someone", "X-Decodo-Password": "else"}
+
+
+@pytest.fixture
+def app(monkeypatch, tmp_path):
+    store = CheckpointStore(str(tmp_path / "checkpoints.sqlite3"))
+    started = []
+    monkeypatch.setattr(webapp, "checkpoints", store)
+    monkeypatch.setattr(webapp, "perform_search", lambda *args, **kwargs: started.append(kwargs))
+    monkeypatch.setattr(webapp, "active_searches", {})
+    webapp.app.config["TESTING"] = True
+    webapp.app.started = started
+    yield webapp.app
+    store.close()
+
+
+def save_search(search_id, username="owner", password="secret"):
+    params = {
+        "query": "dentist", "city": "Austin", "limit": 20, "country": None, "enrich": True,
+        "latitude": None, "longitude": None, "radius_km": None, "max_requests": None,
+        "tiled": False, "lazy_enrich": False,
+        "owner": webapp.credential_fingerprint(username, password),
+    }
+    return webapp.checkpoints.open(search_id, params, resume=False)
+
+
+def test_identical_searches_get_distinct_ids(app):
+    client = app.test_client()
+    body = {"query": "dentist", "city": "Austin", "limit": 10}
+
+    first = client.post("/api/search", json=body, headers=OWNER).get_json()["search_id"]
+    second = client.post("/api/search", json=body, headers=OWNER).get_json()["search_id"]
+
+    assert first != second
+    assert len(first) == 32
+
+
+def test_resume_requires_the_owner_credentials(app):
+    save_search("abc123")
+    client = app.test_client()
+
+    denied = client.post("/api/search/abc123/resume", headers=OTHER)
+    assert denied.status_code == 403
+    assert app.started == []
+
+    resumed = client.post("/api/search/abc123/resume", headers=OWNER)
+    assert resumed.status_code == 200
+    assert resumed.get_json()["status"] == "resumed"
+
+    deadline = time.monotonic() + 5
+    while not app.started and time.monotonic() < deadline:
+        time.sleep(0.01)
+    (kwargs,) = app.started
+    assert "owner" not in kwargs
+    assert kwargs["username"] == "owner" and kwargs["resume"] is True
+
+
+def test_fingerprint_is_salted():
+    first = webapp.credential_fingerprint("owner", "secret")
+    second = webapp.credential_fingerprint("owner", "secret")
+
+    assert first != second
+    assert "secret" not in first
+    assert webapp.owns_checkpoint({"params": {"owner": first}}, "owner", "secret")
+    assert not webapp.owns_checkpoint({"params": {"owner": first}}, "owner", "wrong")
+    assert not webapp.owns_checkpoint({"params": {}}, "owner", "secret")
+
+
+def test_stale_checkpoints_are_pruned(app, monkeypatch):
+    save_search("old")
+    monkeypatch.setattr(webapp, "CHECKPOINT_MAX_AGE", 0)
+    monkeypatch.setattr(webapp, "checkpoints_pruned_at", 0.0)
+
+    webapp.prune_checkpoints()
+
+    assert webapp.checkpoints.find("old") is None
+
+
+def test_stale_finished_searches_are_evicted(app, monkeypatch):
+    closed = []
+    stale = webapp.SearchProgress("stale")
+    stale.set_results([])
+    stale.close = lambda: closed.append("stale")
+    stale.last_access = time.time() - 10
+    running = webapp.SearchProgress("running")
+    running.last_access = time.time() - 10
+    webapp.active_searches.update(stale=stale, running=running)
+    monkeypatch.setattr(webapp, "SEARCH_RESULTS_TTL", 5)
+
+    app.test_client().post("/api/search", json={"query": "dentist", "city": "Austin"}, headers=OWNER)
+
+    assert "stale" not in webapp.active_searches
+    assert "running" in webapp.active_searches
+    assert closed == ["stale"]
@@ -4,9 +4,12 @@ Flask web application for Local Leads Finder.
 Provides a modern web interface for the lead generation tool.
 """
 import os
+import hashlib
+import hmac
 import json
 import time
 import threading
+import uuid
 from datetime import datetime
 from flask import Flask, render_template, request, jsonify, Response, send_file, url_for
 from flask_cors import CORS
@@ -19,8 +22,15 @@ import io
 import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+from leads_finder.core.budget import RequestBudget
+from leads_finder.core.business import as_dicts, json_default
+from leads_finder.core.checkpoint import DEFAULT_CHECKPOINT_PATH, CheckpointStore
+from leads_finder.core.lazy_enrich import PRIORITY_EXPORT, PRIORITY_VISIBLE, LazyEnricher
+from leads_finder.core.parse_pool import create_parse_executor
+from leads_finder.core.place_cache import DEFAULT_PLACES_PATH, PlaceDetailsCache
 from leads_finder.core.scraper_api_session import ScraperAPISession, DecodoUnauthorizedError
 from leads_finder.core.dedupe import deduplicate_businesses
+from leads_finder.core.export import CSV_COLUMNS, csv_row
 from leads_finder.providers.google_maps import GoogleMapsProvider
 
 # Load environment variables
@@ -32,6 +42,82 @@ CORS(app)
 # Store active searches
 active_searches = {}
 
+# Finished searches are dropped this long after they were last read
+# (SEARCH_RESULTS_TTL seconds), closing their on-demand enricher and session
+SEARCH_RESULTS_TTL = float(os.getenv('SEARCH_RESULTS_TTL', 60 * 60))
+
+# Place details cache shared by every search (and with the CLI when the path matches)
+try:
+    place_cache = PlaceDetailsCache(os.getenv('PLACE_CACHE_PATH', DEFAULT_PLACES_PATH))
+except Exception as e:
+    app.logger.warning(f"Place details cache disabled: {e}")
+    place_cache = None
+
+# Checkpoints keyed by search id, so searches cut short by a worker restart
+# or an API outage can be resumed (POST /api/search/<id>/resume)
+try:
+    checkpoints = CheckpointStore(os.getenv('CHECKPOINT_PATH', DEFAULT_CHECKPOINT_PATH))
+except Exception as e:
+    app.logger.warning(f"Search checkpoints disabled: {e}")
+    checkpoints = None
+
+# Interrupted searches stay resumable this long (CHECKPOINT_MAX_AGE seconds);
+# finished searches drop their checkpoint right away
+CHECKPOINT_MAX_AGE = float(os.getenv('CHECKPOINT_MAX_AGE', 24 * 60 * 60))
+CHECKPOINT_PRUNE_INTERVAL = 60 * 60
+checkpoints_pruned_at = 0.0
+checkpoints_prune_lock = threading.Lock()
+
+
+def prune_checkpoints():
+    """Drop checkpoints older than CHECKPOINT_MAX_AGE, at most once per interval."""
+    global checkpoints_pruned_at
+    if checkpoints is None:
+        return
+    with checkpoints_prune_lock:
+        now = time.time()
+        if now - checkpoints_pruned_at < CHECKPOINT_PRUNE_INTERVAL:
+            return
+        checkpoints_pruned_at = now
+    try:
+        checkpoints.prune(CHECKPOINT_MAX_AGE)
+    except Exception as e:
+        app.logger.warning(f"Could not prune search checkpoints: {e}")
+
+
+def credential_fingerprint(username: str, password: str, salt: str = None) -> str:
+    """Salted hash of a Decodo login, stored with a checkpoint to identify its owner."""
+    salt = salt or uuid.uuid4().hex
+    digest = hashlib.sha256(f"{salt}:{username}:{password}".encode('utf-8')).hexdigest()
+    return f"{salt}${digest}"
+
+
+def owns_checkpoint(saved: dict, username: str, password: str) -> bool:
+    """Whether a saved search was started with these credentials."""
+    owner = saved['params'].get('owner') or ''
+    salt = owner.partition('$')[0]
+    return bool(salt) and hmac.compare_digest(owner, credential_fingerprint(username, password, salt))
+
+
+prune_checkpoints()
+
+# Optional process pool shared by every search, so HTML parsing in one search
+# thread does not stall progress polling and the other searches (PARSE_WORKERS=0 disables)
+parse_executor = None
+parse_executor_lock = threading.Lock()
+
+
+def get_parse_executor():
+    """Create the shared parse pool on first use."""
+    global parse_executor
+    workers = int(os.getenv('PARSE_WORKERS', '0') or 0)
+    if workers <= 0:
+        return None
+    with parse_executor_lock:
+        if parse_executor is None:
+            parse_executor = create_parse_executor(workers)
+        return parse_executor
+
 
 # Error handlers to ensure all errors return JSON
 @app.errorhandler(400)
@@ -83,6 +169,12 @@ class SearchProgress:
         self.total_found = 0
         self.unique_count = 0
         self.completed = False
+        # Set when contact details are fetched on demand after the search completes
+        self.enricher = None
+        # True when the search stopped early and its checkpoint can be resumed
+        self.resumable = False
+        # Last time a client read this search, for evicting finished searches
+        self.last_access = time.time()
 
     def update(self, status: str = None, progress: int = None, message: str = None):
         """Update progress information."""
@@ -108,14 +200,46 @@ class SearchProgress:
         self.status = "error"
         self.completed = True
 
+    def close(self):
+        """Stop on-demand enrichment, releasing its session."""
+        if self.enricher is not None:
+            self.enricher.close()
+
+
+def find_search(search_id: str):
+    """Look up a search and mark it as recently used."""
+    progress = active_searches.get(search_id)
+    if progress is not None:
+        progress.last_access = time.time()
+    return progress
+
+
+def evict_searches():
+    """Drop finished searches nobody has read for SEARCH_RESULTS_TTL seconds."""
+    cutoff = time.time() - SEARCH_RESULTS_TTL
+    for search_id, progress in list(active_searches.items()):
+        if progress.completed and progress.last_access < cutoff:
+            if active_searches.pop(search_id, None) is progress:
+                progress.close()
+
 
 def perform_search(search_id: str, query: str, city: str, limit: int, country: str = None, enrich: bool = True,
                    latitude: float = None, longitude: float = None, radius_km: float = None,
-                   username: str = None, password: str = None):
+                   username: str = None, password: str = None, max_requests: int = None,
+                   tiled: bool = False, lazy_enrich: bool = False, resume: bool = False):
     """
     Perform the actual search in a background thread.
+
+    With ``lazy_enrich`` the search only collects listings; contact details
+    are fetched afterwards for the rows the user views or exports. Progress
+    is checkpointed under the search id; with ``resume`` the search picks up
+    from its checkpoint instead of starting over.
     """
     progress = active_searches[search_id]
+    session = None
+    checkpoint = None
+    lazy = enrich and lazy_enrich
+    budget_left = {'requests': max_requests}
 
     try:
         # Initialize session
@@ -129,9 +253,24 @@ def perform_search(search_id: str, query: str, city: str, limit: int, country: s
         )
 
         # Initialize provider
-        provider = GoogleMapsProvider(session)
+        provider = GoogleMapsProvider(
+            session, place_cache=place_cache, parse_executor=get_parse_executor()
+        )
 
-        def report_collection_progress(collected: int, expected_total: int):
+        if checkpoints is not None:
+            # Credentials are not stored, only a salted fingerprint of them;
+            # a resume request supplies them again and must match it.
+            params = {
+                'query': query, 'city': city, 'limit': limit, 'country': country, 'enrich': enrich,
+                'latitude': latitude, 'longitude': longitude, 'radius_km': radius_km,
+                'max_requests': max_requests, 'tiled': tiled, 'lazy_enrich': lazy_enrich,
+                'owner': credential_fingerprint(username, password),
+            }
+            checkpoint = checkpoints.open(search_id, params, resume=resume)
+            if checkpoint.resumed:
+                progress.update("searching", 30, f"Resuming search with {len(checkpoint.leads)} saved results...")
+
+        def report_collection_progress(collected: int, expected_total: int, requests_left: int = None):
             """Update progress bar as results stream in."""
             if progress.completed:
                 return
@@ -155,9 +294,21 @@ def perform_search(search_id: str, query: str, city: str, limit: int, country: s
                 dynamic_progress = progress.progress
 
             message = f"Collecting results... {collected} found"
+            if requests_left is not None:
+                budget_left['requests'] = requests_left
+                message += f" ({requests_left} requests left in budget)"
             progress.update(status="searching", progress=dynamic_progress, message=message)
             progress.total_found = collected
 
+        def report_enrichment_progress(enriched: int, queued: int):
+            """Show place-details lookups separately from listing collection."""
+            if progress.completed:
+                return
+            progress.update(
+                status="enriching",
+                message=f"Enriching contact details... {enriched}/{queued} places",
+            )
+
         # Determine search type and message
         if latitude is not None and longitude is not None:
             location_str = f"({latitude:.4f}, {longitude:.4f})"
@@ -169,21 +320,57 @@ def perform_search(search_id: str, query: str, city: str, limit: int, country: s
 
         # Perform search
         enrich_msg = " with enrichment" if enrich else ""
-        businesses = provider.search(
-            query, city, limit,
-            country=country,
-            enrich=enrich,
-            latitude=latitude,
-            longitude=longitude,
-            radius_km=radius_km,
-            progress_callback=report_collection_progress
-        )
+        if tiled and latitude is not None and longitude is not None and radius_km:
+            stream = provider.iter_search_tiled(
+                query, latitude, longitude, radius_km,
+                limit=limit,
+                city=city,
+                country=country,
+                enrich=enrich and not lazy,
+                progress_callback=report_collection_progress,
+                max_requests=max_requests,
+                enrich_progress_callback=report_enrichment_progress,
+                checkpoint=checkpoint,
+            )
+        else:
+            stream = provider.iter_search(
+                query, city, limit,
+                country=country,
+                enrich=enrich and not lazy,
+                latitude=latitude,
+                longitude=longitude,
+                radius_km=radius_km,
+                progress_callback=report_collection_progress,
+                max_requests=max_requests,
+                enrich_progress_callback=report_enrichment_progress,
+                checkpoint=checkpoint,
+            )
+        # Stream leads so the progress counter moves with every enriched business.
+        businesses = []
+        for business in stream:
+            businesses.append(business)
+            progress.total_found = len(businesses)
         progress.total_found = len(businesses)
+        progress.resumable = checkpoint is not None and not checkpoint.completed
+        if checkpoint is not None and checkpoint.completed:
+            # Nothing left to resume; the results live on in active_searches.
+            checkpoints.delete(search_id)
 
         # Deduplicate
         progress.update("processing", 85, f"Processing {len(businesses)} results...")
         unique_businesses = deduplicate_businesses(businesses)
 
+        if lazy and unique_businesses:
+            # The session now belongs to the enricher; its connections are
+            # released whenever the enricher goes idle, and for good on eviction.
+            lookup_budget = RequestBudget(budget_left['requests'])
+            progress.enricher = LazyEnricher(
+                unique_businesses,
+                lambda business: provider.enrich_business(business, country, lookup_budget),
+                on_idle=session.close,
+            )
+            session = None
+
         # Complete
         progress.update("completed", 100, f"Found {len(unique_businesses)} unique businesses")
         progress.set_results(unique_businesses)
@@ -193,8 +380,12 @@ def perform_search(search_id: str, query: str, city: str, limit: int, country: s
         progress.update(status="error", progress=100, message=error_message)
         progress.set_error(f"AUTH_REQUIRED::{error_message}")
     except Exception as e:
+        progress.resumable = checkpoint is not None and not checkpoint.completed
         progress.update(status="error", progress=100, message=str(e))
         progress.set_error(str(e))
+    finally:
+        if session is not None:
+            session.close()
 
 
 @app.route('/')
@@ -235,6 +426,11 @@ def start_search():
         limit = int(data.get('limit', 100))
         country = (data.get('country') or '').strip() or None
         enrich = data.get('enrich', True)  # Default to True (enrichment enabled)
+        max_requests = data.get('max_requests')
+        tiled = bool(data.get('tiled', False))
+        lazy_enrich = bool(data.get('lazy_enrich', False))
+        if max_requests is not None:
+            max_requests = int(max_requests)
 
         # Location-based search parameters
         latitude = data.get('latitude')
@@ -274,8 +470,14 @@ def start_search():
     if limit < 1 or limit > 1000:
         return jsonify({'error': 'Limit must be between 1 and 1000'}), 400
 
-    # Generate search ID
-    search_id = f"{int(time.time())}_{query}_{city}".replace(' ', '_')
+    if max_requests is not None and max_requests < 1:
+        return jsonify({'error': 'Request budget must be at least 1'}), 400
+
+    # Random, unguessable search ID: also the checkpoint key, so identical
+    # searches started together never share or wipe each other's state
+    search_id = uuid.uuid4().hex
+    prune_checkpoints()
+    evict_searches()
 
     # Create progress tracker
     progress = SearchProgress(search_id)
@@ -284,7 +486,8 @@ def start_search():
     # Start search in background thread
     thread = threading.Thread(
         target=perform_search,
-        args=(search_id, query, city, limit, country, enrich, latitude, longitude, radius_km, username, password)
+        args=(search_id, query, city, limit, country, enrich, latitude, longitude, radius_km, username, password,
+              max_requests, tiled, lazy_enrich)
     )
     thread.daemon = True
     thread.start()
@@ -295,10 +498,54 @@ def start_search():
     })
 
 
+@app.route('/api/search/<search_id>/resume', methods=['POST'])
+def resume_search(search_id):
+    """Continue an interrupted search from its checkpoint, e.g. after a server restart."""
+    username = request.headers.get('X-Decodo-Username')
+    password = request.headers.get('X-Decodo-Password')
+    if not username or not password:
+        return jsonify({
+            'error': 'Missing API credentials. Please configure your Decodo username and password.',
+            'auth_required': True
+        }), 401
+
+    progress = find_search(search_id)
+    if progress and not progress.completed:
+        return jsonify({'search_id': search_id, 'status': 'running'})
+
+    saved = checkpoints.find(search_id) if checkpoints is not None else None
+    if saved is None:
+        return jsonify({'error': 'No saved progress for this search'}), 404
+
+    if not owns_checkpoint(saved, username, password):
+        return jsonify({'error': 'This search was started with different Decodo credentials'}), 403
+
+    params = {key: value for key, value in saved['params'].items() if key != 'owner'}
+    if progress is not None:
+        # The finished attempt is replaced; release its enricher's session.
+        progress.close()
+    progress = SearchProgress(search_id)
+    active_searches[search_id] = progress
+
+    thread = threading.Thread(
+        target=perform_search,
+        args=(search_id,),
+        kwargs={**params, 'username': username, 'password': password, 'resume': True}
+    )
+    thread.daemon = True
+    thread.start()
+
+    return jsonify({
+        'search_id': search_id,
+        'status': 'resumed',
+        'saved': saved['leads']
+    })
+
+
 @app.route('/api/search/<search_id>/progress')
 def get_progress(search_id):
     """Get progress of a search operation."""
-    progress = active_searches.get(search_id)
+    progress = find_search(search_id)
 
     if not progress:
         return jsonify({'error': 'Search not found'}), 404
@@ -311,14 +558,16 @@ def get_progress(search_id):
         'total_found': progress.total_found,
         'unique_count': progress.unique_count,
         'completed': progress.completed,
-        'error': progress.error
+        'error': progress.error,
+        'lazy_enrich': progress.enricher is not None,
+        'resumable': progress.resumable,
     })
 
 
 @app.route('/api/search/<search_id>/results')
 def get_results(search_id):
     """Get results of a completed search."""
-    progress = active_searches.get(search_id)
+    progress = find_search(search_id)
 
     if not progress:
         return jsonify({'error': 'Search not found'}), 404
@@ -326,17 +575,60 @@ def get_results(search_id):
     if not progress.completed:
         return jsonify({'error': 'Search not completed yet'}), 400
 
+    results = progress.results
+    if progress.enricher is not None:
+        # Enriched rows are copied under the enricher's lock; the rest never change.
+        enriched = progress.enricher.rows(range(len(results)))
+        results = [enriched.get(index, row) for index, row in enumerate(results)]
+
     return jsonify({
         'search_id': search_id,
-        'results': progress.results,
-        'count': len(progress.results)
+        'results': as_dicts(results),
+        'count': len(results),
+        'pending': progress.enricher.pending(range(len(results))) if progress.enricher else [],
+        'failed': progress.enricher.failed(range(len(results))) if progress.enricher else [],
+        'resumable': progress.resumable
+    })
+
+
+@app.route('/api/search/<search_id>/enrich', methods=['POST'])
+def enrich_rows(search_id):
+    """Queue result rows for on-demand enrichment and return the ones that are ready."""
+    progress = find_search(search_id)
+
+    if not progress:
+        return jsonify({'error': 'Search not found'}), 404
+
+    if not progress.completed:
+        return jsonify({'error': 'Search not completed yet'}), 400
+
+    enricher = progress.enricher
+    if enricher is None:
+        return jsonify({'error': 'Search was not run with on-demand enrichment'}), 400
+
+    try:
+        data = request.get_json() or {}
+        indexes = [int(index) for index in data.get('indexes', [])]
+    except (ValueError, TypeError, AttributeError) as e:
+        return jsonify({'error': f'Invalid input data: {str(e)}'}), 400
+
+    # Rows on screen jump ahead of anything queued earlier; failed rows are retried.
+    enricher.request(indexes, PRIORITY_VISIBLE)
+
+    return jsonify({
+        'search_id': search_id,
+        'results': {str(index): row.to_dict() for index, row in enricher.rows(indexes).items()},
+        'pending': enricher.pending(indexes),
+        'failed': enricher.failed(indexes),
+        'enriched': enricher.enriched,
+        'total': enricher.total
     })
 
 
 @app.route('/api/search/<search_id>/export/<format>')
 def export_results(search_id, format):
     """Export results in CSV or JSON format."""
-    progress = active_searches.get(search_id)
+    progress = find_search(search_id)
 
     if not progress:
         return jsonify({'error': 'Search not found'}), 404
@@ -345,25 +637,22 @@ def export_results(search_id, format):
         return jsonify({'error': 'Search not completed yet'}), 400
 
     results = progress.results
+    if progress.enricher is not None and format in ('csv', 'json'):
+        # Exports contain every row, so finish enriching them first; rows that
+        # still fail are exported without contact details.
+        indexes = range(len(results))
+        progress.enricher.request(indexes, PRIORITY_EXPORT)
+        progress.enricher.wait(indexes)
+        results = [row for _, row in sorted(progress.enricher.rows(indexes).items())]
 
     if format == 'csv':
         # Generate CSV
         output = io.StringIO()
 
         if results:
-            fieldnames = [
-                'name', 'category', 'phone', 'email', 'website',
-                'google_maps_url', 'rating', 'reviews_count',
-                'address', 'city', 'country', 'lat', 'lon',
-                'source', 'scraped_at'
-            ]
-
-            writer = csv.DictWriter(output, fieldnames=fieldnames, extrasaction='ignore')
-            writer.writeheader()
-
-            for result in results:
-                row = {field: result.get(field) for field in fieldnames}
-                writer.writerow(row)
+            writer = csv.writer(output)
+            writer.writerow(CSV_COLUMNS)
+            writer.writerows(csv_row(result) for result in results)
 
         # Create response
         output.seek(0)
@@ -377,7 +666,7 @@ def export_results(search_id, format):
 
     elif format == 'json':
         # Generate JSON
-        output = json.dumps(results, indent=2)
+        output = json.dumps(results, indent=2, default=json_default)
 
         return Response(
             output,
@@ -8,6 +8,9 @@ let allResults = [];
 let currentPage = 1;
 let pageSize = 25;
 let currentEnrichState = true; // Track enrichment state
+let pendingRows = new Set(); // Row indexes still waiting for on-demand enrichment
+let failedRows = new Set(); // Row indexes whose on-demand enrichment failed; retried when shown again
+let enrichTimer = null;
 
 // Country options (ISO 3166-1 alpha-2 codes)
 const COUNTRY_OPTIONS = [
@@ -256,6 +259,7 @@ const resultsCount = document.getElementById('resultsCount');
 const resultsBody = document.getElementById('resultsBody');
 const exportCsvBtn = document.getElementById('exportCsvBtn');
 const exportJsonBtn = document.getElementById('exportJsonBtn');
+const resumeSearchBtn = document.getElementById('resumeSearchBtn');
 
 // Pagination elements
 const pageSizeSelect = document.getElementById('pageSize');
@@ -410,6 +414,7 @@ function setupEventListeners() {
     searchForm.addEventListener('submit', handleSearch);
     exportCsvBtn.addEventListener('click', () => exportResults('csv'));
     exportJsonBtn.addEventListener('click', () => exportResults('json'));
+    resumeSearchBtn.addEventListener('click', handleResume);
 
     // Pagination
     pageSizeSelect.addEventListener('change', handlePageSizeChange);
@@ -636,9 +641,15 @@ async function handleSearch(e) {
     const data = {
         query: formData.get('query'),
         limit: parseInt(formData.get('limit')),
-        enrich: currentEnrichState
+        enrich: currentEnrichState,
+        lazy_enrich: currentEnrichState && document.getElementById('lazyEnrich').checked
     };
 
+    const maxRequests = formData.get('max_requests');
+    if (maxRequests) {
+        data.max_requests = parseInt(maxRequests);
+    }
+
     // Add location-specific or city-specific fields
     if (locationMode === 'map') {
         // Location mode
@@ -654,6 +665,7 @@ async function handleSearch(e) {
         data.latitude = parseFloat(latitude);
         data.longitude = parseFloat(longitude);
         data.radius_km = parseFloat(radius);
+        data.tiled = document.getElementById('tiled').checked;
         data.city = ''; // Empty city for location mode
     } else {
         // City mode
@@ -677,6 +689,11 @@ async function handleSearch(e) {
         return;
     }
 
+    if (data.max_requests !== undefined && !(data.max_requests >= 1)) {
+        showError('Request budget must be at least 1');
+        return;
+    }
+
     // Disable form
     disableForm();
 
@@ -791,6 +808,11 @@ async function checkProgress() {
 
     const response = await fetch(`${API_BASE}/api/search/${currentSearchId}/progress`);
 
+    // The server restarted mid-search; continue from its checkpoint
+    if (response.status === 404 && await resumeSearch()) {
+        return;
+    }
+
     if (!response.ok) {
         throw new Error('Failed to fetch progress');
     }
@@ -864,7 +886,8 @@ async function loadResults() {
             throw new Error('Invalid results response from server');
         }
 
-        displayResults(data.results, currentEnrichState);
+        displayResults(data.results, currentEnrichState, data.pending || [], data.failed || []);
+        resumeSearchBtn.style.display = data.resumable ? '' : 'none';
 
         // Show results card, hide progress
         progressCard.style.display = 'none';
@@ -876,11 +899,50 @@ async function loadResults() {
     }
 }
 
+// Ask the server to continue the current search from its checkpoint
+async function resumeSearch() {
+    const credentials = getCredentials();
+    if (!currentSearchId || !credentials) return false;
+
+    try {
+        const response = await fetch(`${API_BASE}/api/search/${currentSearchId}/resume`, {
+            method: 'POST',
+            headers: {
+                'X-Decodo-Username': credentials.username,
+                'X-Decodo-Password': credentials.password
+            }
+        });
+        return response.ok;
+    } catch (error) {
+        console.error('Resume error:', error);
+        return false;
+    }
+}
+
+// Resume Button
+async function handleResume() {
+    disableForm();
+    resultsCard.style.display = 'none';
+    progressCard.style.display = 'block';
+    resetProgress();
+
+    if (await resumeSearch()) {
+        startProgressPolling();
+    } else {
+        showError('Could not resume the search. Please start a new one.');
+        enableForm();
+        progressCard.style.display = 'none';
+        resultsCard.style.display = 'block';
+    }
+}
+
 // Display Results
-function displayResults(results, enrichEnabled) {
+function displayResults(results, enrichEnabled, pending = [], failed = []) {
     // Store all results
     allResults = results;
     currentPage = 1;
+    pendingRows = new Set(pending);
+    failedRows = new Set(failed);
 
     // Update total count
     resultsCount.textContent = results.length;
@@ -934,6 +996,79 @@ function renderPage() {
 
     // Update pagination controls
     updatePaginationControls();
+
+    // Fetch contact details for the rows now on screen
+    requestVisibleEnrichment();
+}
+
+// Request On-Demand Enrichment For Visible Rows
+async function requestVisibleEnrichment() {
+    if (enrichTimer) {
+        clearTimeout(enrichTimer);
+        enrichTimer = null;
+    }
+
+    if (!currentSearchId || (pendingRows.size === 0 && failedRows.size === 0)) return;
+
+    const startIndex = (currentPage - 1) * pageSize;
+    const endIndex = Math.min(startIndex + pageSize, allResults.length);
+    const indexes = [];
+    for (let index = startIndex; index < endIndex; index++) {
+        if (pendingRows.has(index) || failedRows.has(index)) {
+            indexes.push(index);
+        }
+    }
+
+    if (indexes.length === 0) return;
+
+    const searchId = currentSearchId;
+
+    try {
+        const response = await fetch(`${API_BASE}/api/search/${searchId}/enrich`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ indexes })
+        });
+
+        if (!response.ok) {
+            throw new Error('Failed to enrich results');
+        }
+
+        const data = await response.json();
+
+        // Ignore answers for a search that has since been replaced
+        if (searchId !== currentSearchId) return;
+
+        const failed = new Set(data.failed || []);
+        Object.entries(data.results || {}).forEach(([index, business]) => {
+            patchResultRow(parseInt(index), business, failed.has(parseInt(index)));
+        });
+
+        // Keep polling while rows on this page are still being enriched
+        if ((data.pending || []).length > 0) {
+            enrichTimer = setTimeout(requestVisibleEnrichment, 1000);
+        }
+    } catch (error) {
+        console.error('Enrichment error:', error);
+    }
+}
+
+// Replace A Row With Its Enriched Version (or mark it as failed)
+function patchResultRow(index, business, failed = false) {
+    allResults[index] = business;
+    pendingRows.delete(index);
+    if (failed) {
+        failedRows.add(index);
+    } else {
+        failedRows.delete(index);
+    }
+
+    const row = resultsBody.querySelector(`tr[data-index="${index}"]`);
+    if (row) {
+        const updatedRow = createResultRow(business, index);
+        updatedRow.className = '';
+        row.replaceWith(updatedRow);
+    }
 }
 
 // Update Pagination Controls
@@ -981,6 +1116,9 @@ function createResultRow(business, index) {
     const row = document.createElement('tr');
     row.className = 'fade-in';
     row.style.animationDelay = `${Math.min((index % pageSize) * 0.02, 0.5)}s`;
+    row.dataset.index = index;
+    const enrichPending = pendingRows.has(index);
+    const enrichFailed = failedRows.has(index);
 
     // Name
     const nameCell = document.createElement('td');
@@ -1015,7 +1153,7 @@ function createResultRow(business, index) {
     if (business.phone) {
         phoneCell.innerHTML = `<a href="tel:${escapeHtml(business.phone)}" class="link">${escapeHtml(business.phone)}</a>`;
     } else {
-        phoneCell.textContent = '-';
+        setContactPlaceholder(phoneCell, enrichPending, enrichFailed);
     }
     row.appendChild(phoneCell);
 
@@ -1024,7 +1162,7 @@ function createResultRow(business, index) {
     if (business.email) {
         emailCell.innerHTML = `<a href="mailto:${escapeHtml(business.email)}" class="link">${escapeHtml(business.email)}</a>`;
     } else {
-        emailCell.textContent = '-';
+        setContactPlaceholder(emailCell, enrichPending, enrichFailed);
     }
     // Hide if enrichment is disabled
     if (!currentEnrichState) {
@@ -1037,7 +1175,7 @@ function createResultRow(business, index) {
     if (business.website) {
         websiteCell.innerHTML = `<a href="${escapeHtml(business.website)}" target="_blank" rel="noopener" class="link">Visit</a>`;
     } else {
-        websiteCell.textContent = '-';
+        setContactPlaceholder(websiteCell, enrichPending, enrichFailed);
     }
     // Hide if enrichment is disabled
     if (!currentEnrichState) {
@@ -1067,6 +1205,19 @@ function createResultRow(business, index) {
     return row;
 }
 
+// Empty Contact Cell: "-", or a marker while details are being fetched or after fetching failed
+function setContactPlaceholder(cell, enrichPending, enrichFailed = false) {
+    if (enrichPending) {
+        cell.textContent = '…';
+        cell.title = 'Fetching contact details';
+    } else if (enrichFailed) {
+        cell.textContent = '!';
+        cell.title = 'Could not fetch contact details; shown again to retry';
+    } else {
+        cell.textContent = '-';
+    }
+}
+
 // Export Results
 async function exportResults(format) {
     if (!currentSearchId) return;
@@ -1218,6 +1369,7 @@ function formatStatus(status) {
         'initializing': 'Initializing',
         'connecting': 'Connecting',
         'searching': 'Searching',
+        'enriching': 'Enriching',
         'processing': 'Processing',
         'completed': 'Completed',
         'error': 'Error'